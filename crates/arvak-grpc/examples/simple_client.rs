@@ -91,6 +91,7 @@ async fn main() -> Result<(), Box<dyn std::error::Error>> {
     println!("\nRetrieving results...");
     let result_request = Request::new(GetJobResultRequest {
         job_id: job_id.clone(),
+        packed_counts: false,
     });
 
     let result_response = client.get_job_result(result_request).await?;
@@ -50,6 +50,7 @@ cx q[0], q[1];
     println!("   Watching job status...");
     let watch_req = WatchJobRequest {
         job_id: job_id.clone(),
+        packed_counts: false,
     };
 
     let mut stream = client.watch_job(watch_req).await?.into_inner();
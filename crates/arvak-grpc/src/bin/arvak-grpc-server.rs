@@ -23,6 +23,9 @@
 //!
 //! # Override with environment variables
 //! ARVAK_GRPC_ADDRESS=127.0.0.1:9090 arvak-grpc-server
+//!
+//! # Listen on a Unix domain socket, e.g. for local clients and tests
+//! ARVAK_GRPC_ADDRESS=unix:/tmp/arvak.sock arvak-grpc-server
 //! ```
 //!
 //! # Graceful Shutdown
@@ -38,6 +41,8 @@ use arvak_grpc::{
     ArvakServiceImpl, Config, HealthState, Metrics, TracingConfig, TracingFormat, init_tracing,
     start_health_server,
 };
+use std::future::Future;
+use std::pin::Pin;
 use std::sync::Arc;
 use tokio::sync::Notify;
 use tonic::transport::Server;
@@ -160,11 +165,15 @@ async fn main() -> Result<(), Box<dyn std::error::Error>> {
         None
     };
 
-    // Get gRPC server address
-    let grpc_addr = config.grpc_address()?;
+    // Get gRPC server address (TCP unless a `unix:` socket path is given)
+    let grpc_socket = config.grpc_unix_socket().map(|path| path.to_path_buf());
+    let grpc_addr = match grpc_socket {
+        Some(_) => None,
+        None => Some(config.grpc_address()?),
+    };
     let shutdown_timeout = config.server.shutdown_timeout_seconds;
 
-    info!("gRPC server listening on {}", grpc_addr);
+    info!("gRPC server listening on {}", config.server.address);
     info!("Storage backend: {}", config.storage.backend);
     info!(
         "Resource limits: {} concurrent jobs, {} queued",
@@ -216,7 +225,7 @@ async fn main() -> Result<(), Box<dyn std::error::Error>> {
         .register_encoded_file_descriptor_set(arvak_grpc::FILE_DESCRIPTOR_SET)
         .build_v1()?;
 
-    let server = Server::builder()
+    let router = Server::builder()
         .timeout(std::time::Duration::from_secs(
             config.server.timeout_seconds,
         ))
@@ -225,11 +234,26 @@ async fn main() -> Result<(), Box<dyn std::error::Error>> {
         )))
         .layer(ServiceBuilder::new().layer(TimingLayer::new()).into_inner())
         .add_service(reflection_service)
-        .add_service(service_with_interceptor)
-        .serve_with_shutdown(grpc_addr, async move {
-            shutdown_signal.notified().await;
-            info!("Shutdown signal received, initiating graceful shutdown");
-        });
+        .add_service(service_with_interceptor);
+    let shutdown = async move {
+        shutdown_signal.notified().await;
+        info!("Shutdown signal received, initiating graceful shutdown");
+    };
+    let server: Pin<Box<dyn Future<Output = Result<(), tonic::transport::Error>> + Send>> =
+        match (grpc_addr, grpc_socket) {
+            (Some(addr), _) => Box::pin(router.serve_with_shutdown(addr, shutdown)),
+            #[cfg(unix)]
+            (None, Some(path)) => {
+                // A socket file left behind by an earlier run would fail the bind
+                let _ = std::fs::remove_file(&path);
+                let listener = tokio::net::UnixListener::bind(&path)?;
+                Box::pin(router.serve_with_incoming_shutdown(
+                    tokio_stream::wrappers::UnixListenerStream::new(listener),
+                    shutdown,
+                ))
+            }
+            _ => return Err("Unix domain sockets are not supported on this platform".into()),
+        };
 
     info!("Arvak gRPC server started successfully");
 
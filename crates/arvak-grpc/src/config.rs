@@ -39,7 +39,8 @@ pub struct Config {
 /// gRPC server settings.
 #[derive(Clone, Serialize, Deserialize)]
 pub struct ServerConfig {
-    /// Server bind address (e.g., "0.0.0.0:50051")
+    /// Server bind address (e.g., "0.0.0.0:50051"), or a Unix domain
+    /// socket path prefixed with `unix:` (e.g., "unix:/tmp/arvak.sock")
     #[serde(default = "default_grpc_address")]
     pub address: String,
 
@@ -585,9 +586,18 @@ impl Config {
     /// Validate configuration values.
     pub fn validate(&self) -> Result<(), ConfigError> {
         // Validate server address
-        self.server.address.parse::<SocketAddr>().map_err(|_| {
-            ConfigError::ValidationError(format!("Invalid server address: {}", self.server.address))
-        })?;
+        match self.grpc_unix_socket() {
+            Some(path) if path.as_os_str().is_empty() => {
+                return Err(ConfigError::ValidationError(format!(
+                    "Invalid server address: {}",
+                    self.server.address
+                )));
+            }
+            Some(_) => {}
+            None => {
+                self.grpc_address()?;
+            }
+        }
 
         // Validate HTTP address
         self.observability
@@ -658,6 +668,13 @@ impl Config {
         })
     }
 
+    /// Get the Unix domain socket path of a `unix:` gRPC server address.
+    ///
+    /// Returns `None` for TCP addresses; use [`Config::grpc_address`] for those.
+    pub fn grpc_unix_socket(&self) -> Option<&Path> {
+        self.server.address.strip_prefix("unix:").map(Path::new)
+    }
+
     /// Get the parsed HTTP server address.
     pub fn http_address(&self) -> Result<SocketAddr, ConfigError> {
         self.observability.http_server.address.parse().map_err(|_| {
@@ -719,5 +736,20 @@ mod tests {
         let config = Config::default();
         let addr = config.grpc_address().unwrap();
         assert_eq!(addr.port(), 50051);
+        assert!(config.grpc_unix_socket().is_none());
+    }
+
+    #[test]
+    fn test_grpc_unix_socket_address() {
+        let mut config = Config::default();
+        config.server.address = "unix:/tmp/arvak.sock".to_string();
+        assert_eq!(
+            config.grpc_unix_socket(),
+            Some(Path::new("/tmp/arvak.sock"))
+        );
+        assert!(config.validate().is_ok());
+
+        config.server.address = "unix:".to_string();
+        assert!(config.validate().is_err());
     }
 }
@@ -1,7 +1,10 @@
 //! Circuit parsing and compilation utilities shared across gRPC service modules.
 
+use std::sync::{LazyLock, Mutex, PoisonError};
 use std::time::Duration;
 
+use rustc_hash::FxHashMap;
+
 use crate::error::Error;
 use crate::error::Result;
 use crate::proto::{CircuitPayload, circuit_payload};
@@ -11,16 +14,49 @@ use arvak_hal::backend::Backend;
 use arvak_hal::capability::{Capabilities, TopologyKind};
 use arvak_ir::circuit::Circuit;
 
+/// Most circuits kept by [`parse_qasm_cached`]; the cache is emptied when full.
+const PARSED_QASM_CAPACITY: usize = 256;
+
+/// Longest OpenQASM source [`parse_qasm_cached`] keeps; longer ones are
+/// parsed on every submission.
+const PARSED_QASM_MAX_LEN: usize = 64 * 1024;
+
+/// Parsed circuits by OpenQASM source.
+static PARSED_QASM: LazyLock<Mutex<FxHashMap<String, Circuit>>> = LazyLock::new(Default::default);
+
+/// Parse OpenQASM 3 source, reusing the circuit parsed from identical source.
+///
+/// Clients commonly submit the same circuit over and over (parameter sweeps,
+/// shot-count scans, benchmarks); cloning the cached circuit skips the parse.
+/// Sources that fail to parse are not cached.
+fn parse_qasm_cached(qasm: String) -> Result<Circuit> {
+    if qasm.len() > PARSED_QASM_MAX_LEN {
+        return Ok(arvak_qasm3::parse(&qasm)?);
+    }
+    if let Some(circuit) = PARSED_QASM
+        .lock()
+        .unwrap_or_else(PoisonError::into_inner)
+        .get(&qasm)
+    {
+        return Ok(circuit.clone());
+    }
+
+    let circuit = arvak_qasm3::parse(&qasm)?;
+    let mut cache = PARSED_QASM.lock().unwrap_or_else(PoisonError::into_inner);
+    if cache.len() >= PARSED_QASM_CAPACITY {
+        cache.clear();
+    }
+    cache.insert(qasm, circuit.clone());
+    Ok(circuit)
+}
+
 /// Parse circuit from protobuf payload (static version for use in async contexts).
 pub(crate) fn parse_circuit_static(payload: Option<CircuitPayload>) -> Result<Circuit> {
     let payload =
         payload.ok_or_else(|| Error::InvalidCircuit("Missing circuit payload".to_string()))?;
 
     match payload.format {
-        Some(circuit_payload::Format::Qasm3(qasm)) => {
-            let circuit = arvak_qasm3::parse(&qasm)?;
-            Ok(circuit)
-        }
+        Some(circuit_payload::Format::Qasm3(qasm)) => parse_qasm_cached(qasm),
         Some(circuit_payload::Format::ArvakIrJson(_json)) => Err(Error::InvalidCircuit(
             "Arvak IR JSON format not yet supported. Use OpenQASM 3 format instead.".to_string(),
         )),
@@ -144,3 +180,27 @@ fn build_basis_gates(caps: &Capabilities) -> BasisGates {
     }
     BasisGates::new(gates)
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    const BELL_QASM: &str = "OPENQASM 3.0;\nqubit[2] q;\nh q[0];\ncx q[0], q[1];\n";
+
+    #[test]
+    fn test_parse_qasm_cached() {
+        let first = parse_qasm_cached(BELL_QASM.to_string()).unwrap();
+        let again = parse_qasm_cached(BELL_QASM.to_string()).unwrap();
+        assert_eq!(again.num_qubits(), first.num_qubits());
+        assert_eq!(again.dag().num_ops(), first.dag().num_ops());
+        assert!(PARSED_QASM.lock().unwrap().contains_key(BELL_QASM));
+
+        assert!(parse_qasm_cached("this is not valid qasm".to_string()).is_err());
+        assert!(
+            !PARSED_QASM
+                .lock()
+                .unwrap()
+                .contains_key("this is not valid qasm")
+        );
+    }
+}
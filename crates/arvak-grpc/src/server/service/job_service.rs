@@ -1,17 +1,23 @@
 //! Job-related gRPC RPC implementations.
 
 use arvak_hal::job::{JobId, JobStatus};
+use arvak_hal::result::{Counts, ExecutionResult};
+use tonic::transport::server::TcpConnectInfo;
 use tonic::{Request, Response, Status};
 use tracing::{info, instrument};
 
 use crate::proto::{
-    BatchJobResult, BatchJobSubmission, CancelJobRequest, CancelJobResponse, GetJobResultRequest,
-    GetJobResultResponse, GetJobStatusRequest, GetJobStatusResponse, Job, JobResult,
-    JobStatusUpdate, ResultChunk, StreamResultsRequest, SubmitBatchRequest, SubmitBatchResponse,
-    SubmitJobRequest, SubmitJobResponse, WatchJobRequest, batch_job_result,
+    BatchJobResult, BatchJobSubmission, CancelJobRequest, CancelJobResponse, CountHistogram,
+    GetJobResultRequest, GetJobResultResponse, GetJobStatusBatchRequest, GetJobStatusBatchResponse,
+    GetJobStatusRequest, GetJobStatusResponse, Job, JobResult, JobStatusUpdate, ResultChunk,
+    StreamResultsRequest, SubmitBatchRequest, SubmitBatchResponse, SubmitJobRequest,
+    SubmitJobResponse, SubmitJobStreamRequest, SubmitJobStreamResponse, WatchJobRequest,
+    batch_job_result,
 };
 
+use crate::error::Error;
 use crate::resource_manager::ResourceManager;
+use crate::storage::StoredJob;
 
 use super::super::ArvakServiceImpl;
 use super::circuit_utils::{
@@ -32,6 +38,91 @@ type SubmitBatchStreamStream = std::pin::Pin<
     Box<dyn tokio_stream::Stream<Item = std::result::Result<BatchJobResult, Status>> + Send>,
 >;
 
+type SubmitJobStreamStream = std::pin::Pin<
+    Box<
+        dyn tokio_stream::Stream<Item = std::result::Result<SubmitJobStreamResponse, Status>>
+            + Send,
+    >,
+>;
+
+/// Convert a stored job into its protobuf representation.
+fn stored_job_to_proto(job: &StoredJob) -> Job {
+    let error_message = match &job.status {
+        JobStatus::Failed(msg) => msg.clone(),
+        _ => String::new(),
+    };
+
+    Job {
+        job_id: job.id.0.clone(),
+        state: to_proto_state(&job.status) as i32,
+        submitted_at: job.submitted_at.timestamp(),
+        started_at: job.started_at.map_or(0, |t| t.timestamp()),
+        completed_at: job.completed_at.map_or(0, |t| t.timestamp()),
+        backend_id: job.backend_id.clone(),
+        shots: job.shots,
+        error_message,
+    }
+}
+
+/// Pack counts into little-endian `uint64` keys and `uint32` counts.
+///
+/// Each bitstring is read as a binary number, so its rightmost bit (qubit 0)
+/// is the key's lowest bit. Returns `None` if a bitstring is not a plain
+/// binary string of 1 to 64 bits or a count does not fit in 32 bits; such
+/// results are sent as a counts map.
+fn pack_counts(counts: &Counts) -> Option<CountHistogram> {
+    let mut num_qubits = 0;
+    let mut keys = Vec::with_capacity(counts.len() * 8);
+    let mut values = Vec::with_capacity(counts.len() * 4);
+    for (bitstring, count) in counts.iter() {
+        if bitstring.len() > 64 || !bitstring.bytes().all(|b| b == b'0' || b == b'1') {
+            return None;
+        }
+        let key = u64::from_str_radix(bitstring, 2).ok()?;
+        keys.extend_from_slice(&key.to_le_bytes());
+        values.extend_from_slice(&u32::try_from(*count).ok()?.to_le_bytes());
+        num_qubits = num_qubits.max(bitstring.len() as u32);
+    }
+    Some(CountHistogram {
+        num_qubits,
+        keys,
+        counts: values,
+    })
+}
+
+/// Convert an execution result into its protobuf representation.
+///
+/// With `packed`, the counts are sent as a `CountHistogram` where possible,
+/// which is smaller on the wire and decodes straight into arrays.
+fn execution_result_to_proto(job_id: String, result: &ExecutionResult, packed: bool) -> JobResult {
+    let histogram = if packed {
+        pack_counts(&result.counts)
+    } else {
+        None
+    };
+    let counts = if histogram.is_some() {
+        std::collections::HashMap::new()
+    } else {
+        result
+            .counts
+            .iter()
+            .map(|(bitstring, count)| (bitstring.clone(), *count))
+            .collect()
+    };
+
+    let metadata_json =
+        serde_json::to_string(&result.metadata).unwrap_or_else(|_| "{}".to_string());
+
+    JobResult {
+        job_id,
+        counts,
+        shots: result.shots,
+        execution_time_ms: result.execution_time_ms.unwrap_or(0),
+        metadata_json,
+        histogram,
+    }
+}
+
 impl ArvakServiceImpl {
     #[instrument(skip(self, request), fields(backend_id, job_id))]
     pub(in crate::server) async fn submit_job_impl(
@@ -134,18 +225,16 @@ impl ArvakServiceImpl {
         // Validate backend exists
         let backend = self.backends.get(&req.backend_id).map_err(Status::from)?;
 
-        let mut job_ids = Vec::new();
+        let compilation_timeout = self
+            .resources
+            .as_ref()
+            .map(ResourceManager::compilation_timeout);
 
-        // Submit each job
+        // Parse, validate and compile every circuit before creating any job,
+        // so a batch with a bad circuit is rejected as a whole and a client
+        // can resubmit its jobs without duplicating the ones before it.
+        let mut circuits = Vec::with_capacity(req.jobs.len());
         for batch_job in req.jobs {
-            // Check resource limits per job if manager is configured
-            if let Some(ref resources) = self.resources {
-                resources
-                    .check_can_submit(client_ip.as_deref())
-                    .await
-                    .map_err(|e| Status::resource_exhausted(e.to_string()))?;
-            }
-
             let circuit = self
                 .parse_circuit(batch_job.circuit)
                 .map_err(Status::from)?;
@@ -154,10 +243,6 @@ impl ArvakServiceImpl {
             validate_circuit_complexity(&circuit, self.resources.as_ref())?;
 
             // Compile circuit for target backend (no-op when optimization_level == 0)
-            let compilation_timeout = self
-                .resources
-                .as_ref()
-                .map(ResourceManager::compilation_timeout);
             let circuit = compile_for_backend(
                 circuit,
                 backend.as_ref(),
@@ -166,9 +251,24 @@ impl ArvakServiceImpl {
             )
             .await?;
 
+            circuits.push((circuit, batch_job.shots));
+        }
+
+        let mut job_ids = Vec::with_capacity(circuits.len());
+
+        // Submit each job
+        for (circuit, shots) in circuits {
+            // Check resource limits per job if manager is configured
+            if let Some(ref resources) = self.resources {
+                resources
+                    .check_can_submit(client_ip.as_deref())
+                    .await
+                    .map_err(|e| Status::resource_exhausted(e.to_string()))?;
+            }
+
             let job_id = self
                 .job_store
-                .create_job(circuit, req.backend_id.clone(), batch_job.shots, None)
+                .create_job(circuit, req.backend_id.clone(), shots, None)
                 .await
                 .map_err(Status::from)?;
 
@@ -217,21 +317,7 @@ impl ArvakServiceImpl {
             .await
             .map_err(Status::from)?;
 
-        let error_message = match &job.status {
-            JobStatus::Failed(msg) => msg.clone(),
-            _ => String::new(),
-        };
-
-        let proto_job = Job {
-            job_id: job.id.0,
-            state: to_proto_state(&job.status) as i32,
-            submitted_at: job.submitted_at.timestamp(),
-            started_at: job.started_at.map_or(0, |t| t.timestamp()),
-            completed_at: job.completed_at.map_or(0, |t| t.timestamp()),
-            backend_id: job.backend_id,
-            shots: job.shots,
-            error_message,
-        };
+        let proto_job = stored_job_to_proto(&job);
 
         // Record RPC duration
         let duration = start.elapsed().as_millis() as u64;
@@ -242,6 +328,34 @@ impl ArvakServiceImpl {
         }))
     }
 
+    #[instrument(skip(self, request), fields(num_jobs))]
+    pub(in crate::server) async fn get_job_status_batch_impl(
+        &self,
+        request: Request<GetJobStatusBatchRequest>,
+    ) -> std::result::Result<Response<GetJobStatusBatchResponse>, Status> {
+        let start = std::time::Instant::now();
+        let req = request.into_inner();
+
+        tracing::Span::current().record("num_jobs", req.job_ids.len());
+
+        let mut jobs = Vec::with_capacity(req.job_ids.len());
+        for job_id in req.job_ids {
+            // Unknown jobs are left out rather than failing the whole batch
+            match self.job_store.get_job(&JobId::new(job_id)).await {
+                Ok(job) => jobs.push(stored_job_to_proto(&job)),
+                Err(Error::JobNotFound(_)) => {}
+                Err(e) => return Err(Status::from(e)),
+            }
+        }
+
+        // Record RPC duration
+        let duration = start.elapsed().as_millis() as u64;
+        self.metrics
+            .record_rpc_duration("GetJobStatusBatch", duration);
+
+        Ok(Response::new(GetJobStatusBatchResponse { jobs }))
+    }
+
     #[instrument(skip(self, request), fields(job_id))]
     pub(in crate::server) async fn watch_job_impl(
         &self,
@@ -249,6 +363,7 @@ impl ArvakServiceImpl {
     ) -> std::result::Result<Response<WatchJobStream>, Status> {
         let req = request.into_inner();
         let job_id = JobId::new(req.job_id.clone());
+        let packed = req.packed_counts;
 
         tracing::Span::current().record("job_id", job_id.0.as_str());
         info!("Starting job watch stream");
@@ -274,16 +389,24 @@ impl ArvakServiceImpl {
 
                 match job_store.get_job(&job_id).await {
                     Ok(job) => {
-                        let error_message = match &job.status {
-                            JobStatus::Failed(msg) => msg.clone(),
-                            _ => String::new(),
+                        let proto_job = stored_job_to_proto(&job);
+
+                        // Ship the result with the terminal update so clients
+                        // don't need a follow-up GetJobResult call.
+                        let result = match (&job.status, &job.result) {
+                            (JobStatus::Completed, Some(result)) => {
+                                Some(execution_result_to_proto(job.id.0.clone(), result, packed))
+                            }
+                            _ => None,
                         };
 
                         let update = JobStatusUpdate {
                             job_id: job.id.0.clone(),
-                            state: to_proto_state(&job.status) as i32,
+                            state: proto_job.state,
                             timestamp: chrono::Utc::now().timestamp(),
-                            error_message,
+                            error_message: proto_job.error_message.clone(),
+                            job: Some(proto_job),
+                            result,
                         };
 
                         // Send update
@@ -553,6 +676,7 @@ impl ArvakServiceImpl {
                                                             .execution_time_ms
                                                             .unwrap_or(0),
                                                         metadata_json,
+                                                        histogram: None,
                                                     },
                                                 )),
                                             }))
@@ -587,6 +711,69 @@ impl ArvakServiceImpl {
         Ok(Response::new(Box::pin(stream) as SubmitBatchStreamStream))
     }
 
+    /// Serve `SubmitJobStream`: every request is submitted like a unary
+    /// `SubmitJob` call, and answered on the shared response stream with the
+    /// request's correlation ID.
+    #[instrument(skip(self, request))]
+    pub(in crate::server) async fn submit_job_stream_impl(
+        &self,
+        request: Request<tonic::Streaming<SubmitJobStreamRequest>>,
+    ) -> std::result::Result<Response<SubmitJobStreamStream>, Status> {
+        info!("Starting job submission stream");
+
+        // Keep the peer address, so per-client resource limits still apply
+        let connect_info = request.extensions().get::<TcpConnectInfo>().cloned();
+        let mut in_stream = request.into_inner();
+        let (tx, rx) = tokio::sync::mpsc::channel(64);
+        let service = self.clone();
+
+        tokio::spawn(async move {
+            while let Some(result) = in_stream.message().await.transpose() {
+                match result {
+                    Ok(message) => {
+                        // Submissions run concurrently and may finish out of
+                        // order; the correlation ID pairs each reply with its
+                        // request
+                        let service = service.clone();
+                        let connect_info = connect_info.clone();
+                        let tx = tx.clone();
+                        tokio::spawn(async move {
+                            let correlation_id = message.correlation_id;
+                            let mut job_request = Request::new(message.job.unwrap_or_default());
+                            if let Some(info) = connect_info {
+                                job_request.extensions_mut().insert(info);
+                            }
+
+                            let reply = match service.submit_job_impl(job_request).await {
+                                Ok(response) => SubmitJobStreamResponse {
+                                    correlation_id,
+                                    job_id: response.into_inner().job_id,
+                                    ..Default::default()
+                                },
+                                Err(status) => SubmitJobStreamResponse {
+                                    correlation_id,
+                                    error_code: status.code() as i32,
+                                    error_message: status.message().to_string(),
+                                    ..Default::default()
+                                },
+                            };
+                            let _ = tx.send(Ok(reply)).await;
+                        });
+                    }
+                    Err(e) => {
+                        let _ = tx
+                            .send(Err(Status::internal(format!("Stream error: {e}"))))
+                            .await;
+                        break;
+                    }
+                }
+            }
+        });
+
+        let stream = tokio_stream::wrappers::ReceiverStream::new(rx);
+        Ok(Response::new(Box::pin(stream) as SubmitJobStreamStream))
+    }
+
     pub(in crate::server) async fn get_job_result_impl(
         &self,
         request: Request<GetJobResultRequest>,
@@ -600,22 +787,7 @@ impl ArvakServiceImpl {
             .await
             .map_err(Status::from)?;
 
-        // Convert counts to protobuf map
-        let mut counts = std::collections::HashMap::new();
-        for (bitstring, count) in result.counts.iter() {
-            counts.insert(bitstring.clone(), *count);
-        }
-
-        let metadata_json =
-            serde_json::to_string(&result.metadata).unwrap_or_else(|_| "{}".to_string());
-
-        let proto_result = JobResult {
-            job_id: req.job_id,
-            counts,
-            shots: result.shots,
-            execution_time_ms: result.execution_time_ms.unwrap_or(0),
-            metadata_json,
-        };
+        let proto_result = execution_result_to_proto(req.job_id, &result, req.packed_counts);
 
         Ok(Response::new(GetJobResultResponse {
             result: Some(proto_result),
@@ -660,3 +832,92 @@ impl ArvakServiceImpl {
         }))
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn result(pairs: &[(&str, u64)]) -> ExecutionResult {
+        let counts = Counts::from_pairs(pairs.iter().map(|(b, c)| ((*b).to_string(), *c)));
+        ExecutionResult::new(counts, 1000)
+    }
+
+    #[test]
+    fn test_packed_counts() {
+        let result = result(&[("011", 600), ("100", 400)]);
+
+        let proto = execution_result_to_proto("job-1".to_string(), &result, true);
+        assert!(proto.counts.is_empty());
+        let histogram = proto.histogram.unwrap();
+        assert_eq!(histogram.num_qubits, 3);
+
+        let mut pairs: Vec<(u64, u32)> = histogram
+            .keys
+            .chunks_exact(8)
+            .zip(histogram.counts.chunks_exact(4))
+            .map(|(k, c)| {
+                (
+                    u64::from_le_bytes(k.try_into().unwrap()),
+                    u32::from_le_bytes(c.try_into().unwrap()),
+                )
+            })
+            .collect();
+        pairs.sort_unstable();
+        assert_eq!(pairs, vec![(0b011, 600), (0b100, 400)]);
+
+        let proto = execution_result_to_proto("job-1".to_string(), &result, false);
+        assert!(proto.histogram.is_none());
+        assert_eq!(proto.counts.len(), 2);
+    }
+
+    #[cfg(feature = "simulator")]
+    #[tokio::test]
+    async fn test_submit_batch_with_bad_circuit_creates_no_jobs() {
+        use std::sync::Arc;
+
+        use crate::proto::{BatchJobRequest, CircuitPayload, circuit_payload};
+        use crate::server::JobStore;
+        use crate::server::backend_registry::create_default_registry;
+        use crate::storage::{JobFilter, JobStorage, MemoryStorage};
+
+        let storage = Arc::new(MemoryStorage::new());
+        let service = ArvakServiceImpl::with_components(
+            JobStore::with_storage(storage.clone()),
+            create_default_registry(),
+        );
+        let job = |qasm: &str| BatchJobRequest {
+            circuit: Some(CircuitPayload {
+                format: Some(circuit_payload::Format::Qasm3(qasm.to_string())),
+            }),
+            shots: 100,
+            ..Default::default()
+        };
+        let good = "OPENQASM 3.0;\nqubit[2] q;\nh q[0];\ncx q[0], q[1];\n";
+
+        let status = service
+            .submit_batch_impl(Request::new(SubmitBatchRequest {
+                backend_id: "simulator".to_string(),
+                jobs: vec![job(good), job("invalid qasm"), job(good)],
+            }))
+            .await
+            .unwrap_err();
+
+        assert_eq!(status.code(), tonic::Code::InvalidArgument);
+        let jobs = storage.list_jobs(JobFilter::new()).await.unwrap();
+        assert!(jobs.is_empty(), "rejected batch created jobs");
+    }
+
+    #[test]
+    fn test_packed_counts_fall_back_to_map() {
+        let wide = "1".repeat(65);
+        for pairs in [
+            vec![("01 10", 10)],
+            vec![(wide.as_str(), 10)],
+            vec![("01", u64::from(u32::MAX) + 1)],
+        ] {
+            let proto = execution_result_to_proto("job-1".to_string(), &result(&pairs), true);
+            assert!(proto.histogram.is_none());
+            assert_eq!(proto.counts.len(), 1);
+        }
+    }
+}
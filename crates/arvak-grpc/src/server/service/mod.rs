@@ -16,10 +16,10 @@ use crate::metrics::Metrics;
 use crate::proto::{
     BatchJobResult, BatchJobSubmission, CancelJobRequest, CancelJobResponse, CircuitPayload,
     GetBackendInfoRequest, GetBackendInfoResponse, GetJobResultRequest, GetJobResultResponse,
-    GetJobStatusRequest, GetJobStatusResponse, JobStatusUpdate, ListBackendsRequest,
-    ListBackendsResponse, ResultChunk, StreamResultsRequest, SubmitBatchRequest,
-    SubmitBatchResponse, SubmitJobRequest, SubmitJobResponse, WatchJobRequest,
-    arvak_service_server,
+    GetJobStatusBatchRequest, GetJobStatusBatchResponse, GetJobStatusRequest, GetJobStatusResponse,
+    JobStatusUpdate, ListBackendsRequest, ListBackendsResponse, ResultChunk, StreamResultsRequest,
+    SubmitBatchRequest, SubmitBatchResponse, SubmitJobRequest, SubmitJobResponse,
+    SubmitJobStreamRequest, SubmitJobStreamResponse, WatchJobRequest, arvak_service_server,
 };
 use crate::resource_manager::ResourceManager;
 use crate::server::{BackendRegistry, JobStore};
@@ -27,6 +27,10 @@ use crate::server::{BackendRegistry, JobStore};
 use circuit_utils::parse_circuit_static;
 
 /// Arvak gRPC service implementation.
+///
+/// Cloning is cheap: all state is shared behind `Arc`s, so streaming RPCs
+/// can hand a clone to the tasks that serve them.
+#[derive(Clone)]
 pub struct ArvakServiceImpl {
     pub(crate) job_store: Arc<JobStore>,
     pub(crate) backends: Arc<BackendRegistry>,
@@ -102,6 +106,13 @@ impl arvak_service_server::ArvakService for ArvakServiceImpl {
         Box<dyn tokio_stream::Stream<Item = std::result::Result<BatchJobResult, Status>> + Send>,
     >;
 
+    type SubmitJobStreamStream = std::pin::Pin<
+        Box<
+            dyn tokio_stream::Stream<Item = std::result::Result<SubmitJobStreamResponse, Status>>
+                + Send,
+        >,
+    >;
+
     async fn submit_job(
         &self,
         request: Request<SubmitJobRequest>,
@@ -123,6 +134,13 @@ impl arvak_service_server::ArvakService for ArvakServiceImpl {
         self.get_job_status_impl(request).await
     }
 
+    async fn get_job_status_batch(
+        &self,
+        request: Request<GetJobStatusBatchRequest>,
+    ) -> std::result::Result<Response<GetJobStatusBatchResponse>, Status> {
+        self.get_job_status_batch_impl(request).await
+    }
+
     async fn watch_job(
         &self,
         request: Request<WatchJobRequest>,
@@ -144,6 +162,13 @@ impl arvak_service_server::ArvakService for ArvakServiceImpl {
         self.submit_batch_stream_impl(request).await
     }
 
+    async fn submit_job_stream(
+        &self,
+        request: Request<tonic::Streaming<SubmitJobStreamRequest>>,
+    ) -> std::result::Result<Response<Self::SubmitJobStreamStream>, Status> {
+        self.submit_job_stream_impl(request).await
+    }
+
     async fn get_job_result(
         &self,
         request: Request<GetJobResultRequest>,
@@ -163,6 +163,7 @@ async fn test_full_job_lifecycle() {
     let response = client
         .get_job_result(Request::new(GetJobResultRequest {
             job_id: job_id.clone(),
+            packed_counts: false,
         }))
         .await
         .unwrap();
@@ -814,7 +814,10 @@ pub unsafe extern "C" fn ARVAK_QDMI_device_job_get_results(
                     };
 
                     match client
-                        .get_job_result(Request::new(GetJobResultRequest { job_id: grpc_id }))
+                        .get_job_result(Request::new(GetJobResultRequest {
+                            job_id: grpc_id,
+                            packed_counts: false,
+                        }))
                         .await
                     {
                         Ok(resp) => {
@@ -6,10 +6,12 @@ enabling remote quantum circuit submission and execution.
 Supports both synchronous and asynchronous APIs:
 - ArvakClient: Synchronous blocking client
 - AsyncArvakClient: Async/await client with connection pooling
+- MultiProcessArvakClient: Shards batch submission across worker processes
 """
 
 from .client import ArvakClient
 from .async_client import AsyncArvakClient, ConnectionPool
+from .multiproc import MultiProcessArvakClient
 from .job_future import JobFuture, CancelledError, as_completed, wait
 from .retry_policy import (
     RetryPolicy,
@@ -60,7 +62,7 @@ from .result_analysis import (
     batch_compare,
     group_by_similarity,
 )
-from .types import Job, JobResult, JobState, BackendInfo
+from .types import Job, JobResult, JobState, BackendInfo, PreparedCircuit
 from .exceptions import (
     ArvakError,
     ArvakJobNotFoundError,
@@ -74,6 +76,7 @@ __all__ = [
     "ArvakClient",
     "AsyncArvakClient",
     "ConnectionPool",
+    "MultiProcessArvakClient",
     "JobFuture",
     "CancelledError",
     "as_completed",
@@ -119,6 +122,7 @@ __all__ = [
     "JobResult",
     "JobState",
     "BackendInfo",
+    "PreparedCircuit",
     "ArvakError",
     "ArvakJobNotFoundError",
     "ArvakBackendNotFoundError",
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0b\x61rvak.proto\x12\x08\x61rvak.v1\"D\n\x0e\x43ircuitPayload\x12\x0f\n\x05qasm3\x18\x01 \x01(\tH\x00\x12\x17\n\rarvak_ir_json\x18\x02 \x01(\tH\x00\x42\x08\n\x06\x66ormat\"\xb2\x01\n\x03Job\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12!\n\x05state\x18\x02 \x01(\x0e\x32\x12.arvak.v1.JobState\x12\x14\n\x0csubmitted_at\x18\x03 \x01(\x03\x12\x12\n\nstarted_at\x18\x04 \x01(\x03\x12\x14\n\x0c\x63ompleted_at\x18\x05 \x01(\x03\x12\x12\n\nbackend_id\x18\x06 \x01(\t\x12\r\n\x05shots\x18\x07 \x01(\r\x12\x15\n\rerror_message\x18\x08 \x01(\t\"\xbc\x01\n\tJobResult\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12/\n\x06\x63ounts\x18\x02 \x03(\x0b\x32\x1f.arvak.v1.JobResult.CountsEntry\x12\r\n\x05shots\x18\x03 \x01(\r\x12\x19\n\x11\x65xecution_time_ms\x18\x04 \x01(\x04\x12\x15\n\rmetadata_json\x18\x05 \x01(\t\x1a-\n\x0b\x43ountsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x04:\x02\x38\x01\"\xb1\x01\n\x0b\x42\x61\x63kendInfo\x12\x12\n\nbackend_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x14\n\x0cis_available\x18\x03 \x01(\x08\x12\x12\n\nmax_qubits\x18\x04 \x01(\r\x12\x11\n\tmax_shots\x18\x05 \x01(\r\x12\x13\n\x0b\x64\x65scription\x18\x06 \x01(\t\x12\x17\n\x0fsupported_gates\x18\x07 \x03(\t\x12\x15\n\rtopology_json\x18\x08 \x01(\t\"`\n\x10SubmitJobRequest\x12)\n\x07\x63ircuit\x18\x01 \x01(\x0b\x32\x18.arvak.v1.CircuitPayload\x12\x12\n\nbackend_id\x18\x02 \x01(\t\x12\r\n\x05shots\x18\x03 \x01(\r\"#\n\x11SubmitJobResponse\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"K\n\x0f\x42\x61tchJobRequest\x12)\n\x07\x63ircuit\x18\x01 \x01(\x0b\x32\x18.arvak.v1.CircuitPayload\x12\r\n\x05shots\x18\x02 \x01(\r\"Q\n\x12SubmitBatchRequest\x12\x12\n\nbackend_id\x18\x01 \x01(\t\x12\'\n\x04jobs\x18\x02 \x03(\x0b\x32\x19.arvak.v1.BatchJobRequest\"&\n\x13SubmitBatchResponse\x12\x0f\n\x07job_ids\x18\x01 \x03(\t\"%\n\x13GetJobStatusRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"2\n\x14GetJobStatusResponse\x12\x1a\n\x03job\x18\x01 \x01(\x0b\x32\r.arvak.v1.Job\"%\n\x13GetJobResultRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\";\n\x14GetJobResultResponse\x12#\n\x06result\x18\x01 \x01(\x0b\x32\x13.arvak.v1.JobResult\"\"\n\x10\x43\x61ncelJobRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"5\n\x11\x43\x61ncelJobResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"\x15\n\x13ListBackendsRequest\"?\n\x14ListBackendsResponse\x12\'\n\x08\x62\x61\x63kends\x18\x01 \x03(\x0b\x32\x15.arvak.v1.BackendInfo\"+\n\x15GetBackendInfoRequest\x12\x12\n\nbackend_id\x18\x01 \x01(\t\"@\n\x16GetBackendInfoResponse\x12&\n\x07\x62\x61\x63kend\x18\x01 \x01(\x0b\x32\x15.arvak.v1.BackendInfo*\x99\x01\n\x08JobState\x12\x19\n\x15JOB_STATE_UNSPECIFIED\x10\x00\x12\x14\n\x10JOB_STATE_QUEUED\x10\x01\x12\x15\n\x11JOB_STATE_RUNNING\x10\x02\x12\x17\n\x13JOB_STATE_COMPLETED\x10\x03\x12\x14\n\x10JOB_STATE_FAILED\x10\x04\x12\x16\n\x12JOB_STATE_CANCELED\x10\x05\x32\xa8\x04\n\x0c\x41rvakService\x12\x44\n\tSubmitJob\x12\x1a.arvak.v1.SubmitJobRequest\x1a\x1b.arvak.v1.SubmitJobResponse\x12J\n\x0bSubmitBatch\x12\x1c.arvak.v1.SubmitBatchRequest\x1a\x1d.arvak.v1.SubmitBatchResponse\x12M\n\x0cGetJobStatus\x12\x1d.arvak.v1.GetJobStatusRequest\x1a\x1e.arvak.v1.GetJobStatusResponse\x12M\n\x0cGetJobResult\x12\x1d.arvak.v1.GetJobResultRequest\x1a\x1e.arvak.v1.GetJobResultResponse\x12\x44\n\tCancelJob\x12\x1a.arvak.v1.CancelJobRequest\x1a\x1b.arvak.v1.CancelJobResponse\x12M\n\x0cListBackends\x12\x1d.arvak.v1.ListBackendsRequest\x1a\x1e.arvak.v1.ListBackendsResponse\x12S\n\x0eGetBackendInfo\x12\x1f.arvak.v1.GetBackendInfoRequest\x1a .arvak.v1.GetBackendInfoResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0b\x61rvak.proto\x12\x08\x61rvak.v1\"D\n\x0e\x43ircuitPayload\x12\x0f\n\x05qasm3\x18\x01 \x01(\tH\x00\x12\x17\n\rarvak_ir_json\x18\x02 \x01(\tH\x00\x42\x08\n\x06\x66ormat\"\xb2\x01\n\x03Job\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12!\n\x05state\x18\x02 \x01(\x0e\x32\x12.arvak.v1.JobState\x12\x14\n\x0csubmitted_at\x18\x03 \x01(\x03\x12\x12\n\nstarted_at\x18\x04 \x01(\x03\x12\x14\n\x0c\x63ompleted_at\x18\x05 \x01(\x03\x12\x12\n\nbackend_id\x18\x06 \x01(\t\x12\r\n\x05shots\x18\x07 \x01(\r\x12\x15\n\rerror_message\x18\x08 \x01(\t\"\xe9\x01\n\tJobResult\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12/\n\x06\x63ounts\x18\x02 \x03(\x0b\x32\x1f.arvak.v1.JobResult.CountsEntry\x12\r\n\x05shots\x18\x03 \x01(\r\x12\x19\n\x11\x65xecution_time_ms\x18\x04 \x01(\x04\x12\x15\n\rmetadata_json\x18\x05 \x01(\t\x12+\n\thistogram\x18\x06 \x01(\x0b\x32\x18.arvak.v1.CountHistogram\x1a-\n\x0b\x43ountsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x04:\x02\x38\x01\"B\n\x0e\x43ountHistogram\x12\x12\n\nnum_qubits\x18\x01 \x01(\r\x12\x0c\n\x04keys\x18\x02 \x01(\x0c\x12\x0e\n\x06\x63ounts\x18\x03 \x01(\x0c\"\xb1\x01\n\x0b\x42\x61\x63kendInfo\x12\x12\n\nbackend_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x14\n\x0cis_available\x18\x03 \x01(\x08\x12\x12\n\nmax_qubits\x18\x04 \x01(\r\x12\x11\n\tmax_shots\x18\x05 \x01(\r\x12\x13\n\x0b\x64\x65scription\x18\x06 \x01(\t\x12\x17\n\x0fsupported_gates\x18\x07 \x03(\t\x12\x15\n\rtopology_json\x18\x08 \x01(\t\"|\n\x10SubmitJobRequest\x12)\n\x07\x63ircuit\x18\x01 \x01(\x0b\x32\x18.arvak.v1.CircuitPayload\x12\x12\n\nbackend_id\x18\x02 \x01(\t\x12\r\n\x05shots\x18\x03 \x01(\r\x12\x1a\n\x12optimization_level\x18\x04 \x01(\r\"#\n\x11SubmitJobResponse\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"g\n\x0f\x42\x61tchJobRequest\x12)\n\x07\x63ircuit\x18\x01 \x01(\x0b\x32\x18.arvak.v1.CircuitPayload\x12\r\n\x05shots\x18\x02 \x01(\r\x12\x1a\n\x12optimization_level\x18\x03 \x01(\r\"Q\n\x12SubmitBatchRequest\x12\x12\n\nbackend_id\x18\x01 \x01(\t\x12\'\n\x04jobs\x18\x02 \x03(\x0b\x32\x19.arvak.v1.BatchJobRequest\"&\n\x13SubmitBatchResponse\x12\x0f\n\x07job_ids\x18\x01 \x03(\t\"%\n\x13GetJobStatusRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"2\n\x14GetJobStatusResponse\x12\x1a\n\x03job\x18\x01 \x01(\x0b\x32\r.arvak.v1.Job\"+\n\x18GetJobStatusBatchRequest\x12\x0f\n\x07job_ids\x18\x01 \x03(\t\"8\n\x19GetJobStatusBatchResponse\x12\x1b\n\x04jobs\x18\x01 \x03(\x0b\x32\r.arvak.v1.Job\"<\n\x13GetJobResultRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x15\n\rpacked_counts\x18\x02 \x01(\x08\";\n\x14GetJobResultResponse\x12#\n\x06result\x18\x01 \x01(\x0b\x32\x13.arvak.v1.JobResult\"\"\n\x10\x43\x61ncelJobRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"5\n\x11\x43\x61ncelJobResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"\x15\n\x13ListBackendsRequest\"?\n\x14ListBackendsResponse\x12\'\n\x08\x62\x61\x63kends\x18\x01 \x03(\x0b\x32\x15.arvak.v1.BackendInfo\"+\n\x15GetBackendInfoRequest\x12\x12\n\nbackend_id\x18\x01 \x01(\t\"@\n\x16GetBackendInfoResponse\x12&\n\x07\x62\x61\x63kend\x18\x01 \x01(\x0b\x32\x15.arvak.v1.BackendInfo\"8\n\x0fWatchJobRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x15\n\rpacked_counts\x18\x02 \x01(\x08\"\xaf\x01\n\x0fJobStatusUpdate\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12!\n\x05state\x18\x02 \x01(\x0e\x32\x12.arvak.v1.JobState\x12\x11\n\ttimestamp\x18\x03 \x01(\x03\x12\x15\n\rerror_message\x18\x04 \x01(\t\x12\x1a\n\x03job\x18\x05 \x01(\x0b\x32\r.arvak.v1.Job\x12#\n\x06result\x18\x06 \x01(\x0b\x32\x13.arvak.v1.JobResult\":\n\x14StreamResultsRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x12\n\nchunk_size\x18\x02 \x01(\r\"\xbc\x01\n\x0bResultChunk\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x31\n\x06\x63ounts\x18\x02 \x03(\x0b\x32!.arvak.v1.ResultChunk.CountsEntry\x12\x10\n\x08is_final\x18\x03 \x01(\x08\x12\x13\n\x0b\x63hunk_index\x18\x04 \x01(\r\x12\x14\n\x0ctotal_chunks\x18\x05 \x01(\r\x1a-\n\x0b\x43ountsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x04:\x02\x38\x01\"\x99\x01\n\x12\x42\x61tchJobSubmission\x12)\n\x07\x63ircuit\x18\x01 \x01(\x0b\x32\x18.arvak.v1.CircuitPayload\x12\x12\n\nbackend_id\x18\x02 \x01(\t\x12\r\n\x05shots\x18\x03 \x01(\r\x12\x19\n\x11\x63lient_request_id\x18\x04 \x01(\t\x12\x1a\n\x12optimization_level\x18\x05 \x01(\r\"\x95\x01\n\x0e\x42\x61tchJobResult\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x19\n\x11\x63lient_request_id\x18\x02 \x01(\t\x12\x13\n\tsubmitted\x18\x03 \x01(\tH\x00\x12(\n\tcompleted\x18\x04 \x01(\x0b\x32\x13.arvak.v1.JobResultH\x00\x12\x0f\n\x05\x65rror\x18\x05 \x01(\tH\x00\x42\x08\n\x06result\"Y\n\x16SubmitJobStreamRequest\x12\x16\n\x0e\x63orrelation_id\x18\x01 \x01(\x04\x12\'\n\x03job\x18\x02 \x01(\x0b\x32\x1a.arvak.v1.SubmitJobRequest\"l\n\x17SubmitJobStreamResponse\x12\x16\n\x0e\x63orrelation_id\x18\x01 \x01(\x04\x12\x0e\n\x06job_id\x18\x02 \x01(\t\x12\x12\n\nerror_code\x18\x03 \x01(\x05\x12\x15\n\rerror_message\x18\x04 \x01(\t*\xb7\x01\n\x08JobState\x12\x19\n\x15JOB_STATE_UNSPECIFIED\x10\x00\x12\x14\n\x10JOB_STATE_QUEUED\x10\x01\x12\x15\n\x11JOB_STATE_RUNNING\x10\x02\x12\x17\n\x13JOB_STATE_COMPLETED\x10\x03\x12\x14\n\x10JOB_STATE_FAILED\x10\x04\x12\x16\n\x12JOB_STATE_CANCELED\x10\x05\x12\x1c\n\x18JOB_STATE_RESULT_EXPIRED\x10\x06\x32\xc1\x07\n\x0c\x41rvakService\x12\x44\n\tSubmitJob\x12\x1a.arvak.v1.SubmitJobRequest\x1a\x1b.arvak.v1.SubmitJobResponse\x12J\n\x0bSubmitBatch\x12\x1c.arvak.v1.SubmitBatchRequest\x1a\x1d.arvak.v1.SubmitBatchResponse\x12M\n\x0cGetJobStatus\x12\x1d.arvak.v1.GetJobStatusRequest\x1a\x1e.arvak.v1.GetJobStatusResponse\x12\\\n\x11GetJobStatusBatch\x12\".arvak.v1.GetJobStatusBatchRequest\x1a#.arvak.v1.GetJobStatusBatchResponse\x12M\n\x0cGetJobResult\x12\x1d.arvak.v1.GetJobResultRequest\x1a\x1e.arvak.v1.GetJobResultResponse\x12\x44\n\tCancelJob\x12\x1a.arvak.v1.CancelJobRequest\x1a\x1b.arvak.v1.CancelJobResponse\x12M\n\x0cListBackends\x12\x1d.arvak.v1.ListBackendsRequest\x1a\x1e.arvak.v1.ListBackendsResponse\x12S\n\x0eGetBackendInfo\x12\x1f.arvak.v1.GetBackendInfoRequest\x1a .arvak.v1.GetBackendInfoResponse\x12\x42\n\x08WatchJob\x12\x19.arvak.v1.WatchJobRequest\x1a\x19.arvak.v1.JobStatusUpdate0\x01\x12H\n\rStreamResults\x12\x1e.arvak.v1.StreamResultsRequest\x1a\x15.arvak.v1.ResultChunk0\x01\x12O\n\x11SubmitBatchStream\x12\x1c.arvak.v1.BatchJobSubmission\x1a\x18.arvak.v1.BatchJobResult(\x01\x30\x01\x12Z\n\x0fSubmitJobStream\x12 .arvak.v1.SubmitJobStreamRequest\x1a!.arvak.v1.SubmitJobStreamResponse(\x01\x30\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -33,48 +33,74 @@ if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
   _globals['_JOBRESULT_COUNTSENTRY']._loaded_options = None
   _globals['_JOBRESULT_COUNTSENTRY']._serialized_options = b'8\001'
-  _globals['_JOBSTATE']._serialized_start=1464
-  _globals['_JOBSTATE']._serialized_end=1617
+  _globals['_RESULTCHUNK_COUNTSENTRY']._loaded_options = None
+  _globals['_RESULTCHUNK_COUNTSENTRY']._serialized_options = b'8\001'
+  _globals['_JOBSTATE']._serialized_start=2755
+  _globals['_JOBSTATE']._serialized_end=2938
   _globals['_CIRCUITPAYLOAD']._serialized_start=25
   _globals['_CIRCUITPAYLOAD']._serialized_end=93
   _globals['_JOB']._serialized_start=96
   _globals['_JOB']._serialized_end=274
   _globals['_JOBRESULT']._serialized_start=277
-  _globals['_JOBRESULT']._serialized_end=465
-  _globals['_JOBRESULT_COUNTSENTRY']._serialized_start=420
-  _globals['_JOBRESULT_COUNTSENTRY']._serialized_end=465
-  _globals['_BACKENDINFO']._serialized_start=468
-  _globals['_BACKENDINFO']._serialized_end=645
-  _globals['_SUBMITJOBREQUEST']._serialized_start=647
-  _globals['_SUBMITJOBREQUEST']._serialized_end=743
-  _globals['_SUBMITJOBRESPONSE']._serialized_start=745
-  _globals['_SUBMITJOBRESPONSE']._serialized_end=780
-  _globals['_BATCHJOBREQUEST']._serialized_start=782
-  _globals['_BATCHJOBREQUEST']._serialized_end=857
-  _globals['_SUBMITBATCHREQUEST']._serialized_start=859
-  _globals['_SUBMITBATCHREQUEST']._serialized_end=940
-  _globals['_SUBMITBATCHRESPONSE']._serialized_start=942
-  _globals['_SUBMITBATCHRESPONSE']._serialized_end=980
-  _globals['_GETJOBSTATUSREQUEST']._serialized_start=982
-  _globals['_GETJOBSTATUSREQUEST']._serialized_end=1019
-  _globals['_GETJOBSTATUSRESPONSE']._serialized_start=1021
-  _globals['_GETJOBSTATUSRESPONSE']._serialized_end=1071
-  _globals['_GETJOBRESULTREQUEST']._serialized_start=1073
-  _globals['_GETJOBRESULTREQUEST']._serialized_end=1110
-  _globals['_GETJOBRESULTRESPONSE']._serialized_start=1112
-  _globals['_GETJOBRESULTRESPONSE']._serialized_end=1171
-  _globals['_CANCELJOBREQUEST']._serialized_start=1173
-  _globals['_CANCELJOBREQUEST']._serialized_end=1207
-  _globals['_CANCELJOBRESPONSE']._serialized_start=1209
-  _globals['_CANCELJOBRESPONSE']._serialized_end=1262
-  _globals['_LISTBACKENDSREQUEST']._serialized_start=1264
-  _globals['_LISTBACKENDSREQUEST']._serialized_end=1285
-  _globals['_LISTBACKENDSRESPONSE']._serialized_start=1287
-  _globals['_LISTBACKENDSRESPONSE']._serialized_end=1350
-  _globals['_GETBACKENDINFOREQUEST']._serialized_start=1352
-  _globals['_GETBACKENDINFOREQUEST']._serialized_end=1395
-  _globals['_GETBACKENDINFORESPONSE']._serialized_start=1397
-  _globals['_GETBACKENDINFORESPONSE']._serialized_end=1461
-  _globals['_ARVAKSERVICE']._serialized_start=1620
-  _globals['_ARVAKSERVICE']._serialized_end=2172
+  _globals['_JOBRESULT']._serialized_end=510
+  _globals['_JOBRESULT_COUNTSENTRY']._serialized_start=465
+  _globals['_JOBRESULT_COUNTSENTRY']._serialized_end=510
+  _globals['_COUNTHISTOGRAM']._serialized_start=512
+  _globals['_COUNTHISTOGRAM']._serialized_end=578
+  _globals['_BACKENDINFO']._serialized_start=581
+  _globals['_BACKENDINFO']._serialized_end=758
+  _globals['_SUBMITJOBREQUEST']._serialized_start=760
+  _globals['_SUBMITJOBREQUEST']._serialized_end=884
+  _globals['_SUBMITJOBRESPONSE']._serialized_start=886
+  _globals['_SUBMITJOBRESPONSE']._serialized_end=921
+  _globals['_BATCHJOBREQUEST']._serialized_start=923
+  _globals['_BATCHJOBREQUEST']._serialized_end=1026
+  _globals['_SUBMITBATCHREQUEST']._serialized_start=1028
+  _globals['_SUBMITBATCHREQUEST']._serialized_end=1109
+  _globals['_SUBMITBATCHRESPONSE']._serialized_start=1111
+  _globals['_SUBMITBATCHRESPONSE']._serialized_end=1149
+  _globals['_GETJOBSTATUSREQUEST']._serialized_start=1151
+  _globals['_GETJOBSTATUSREQUEST']._serialized_end=1188
+  _globals['_GETJOBSTATUSRESPONSE']._serialized_start=1190
+  _globals['_GETJOBSTATUSRESPONSE']._serialized_end=1240
+  _globals['_GETJOBSTATUSBATCHREQUEST']._serialized_start=1242
+  _globals['_GETJOBSTATUSBATCHREQUEST']._serialized_end=1285
+  _globals['_GETJOBSTATUSBATCHRESPONSE']._serialized_start=1287
+  _globals['_GETJOBSTATUSBATCHRESPONSE']._serialized_end=1343
+  _globals['_GETJOBRESULTREQUEST']._serialized_start=1345
+  _globals['_GETJOBRESULTREQUEST']._serialized_end=1405
+  _globals['_GETJOBRESULTRESPONSE']._serialized_start=1407
+  _globals['_GETJOBRESULTRESPONSE']._serialized_end=1466
+  _globals['_CANCELJOBREQUEST']._serialized_start=1468
+  _globals['_CANCELJOBREQUEST']._serialized_end=1502
+  _globals['_CANCELJOBRESPONSE']._serialized_start=1504
+  _globals['_CANCELJOBRESPONSE']._serialized_end=1557
+  _globals['_LISTBACKENDSREQUEST']._serialized_start=1559
+  _globals['_LISTBACKENDSREQUEST']._serialized_end=1580
+  _globals['_LISTBACKENDSRESPONSE']._serialized_start=1582
+  _globals['_LISTBACKENDSRESPONSE']._serialized_end=1645
+  _globals['_GETBACKENDINFOREQUEST']._serialized_start=1647
+  _globals['_GETBACKENDINFOREQUEST']._serialized_end=1690
+  _globals['_GETBACKENDINFORESPONSE']._serialized_start=1692
+  _globals['_GETBACKENDINFORESPONSE']._serialized_end=1756
+  _globals['_WATCHJOBREQUEST']._serialized_start=1758
+  _globals['_WATCHJOBREQUEST']._serialized_end=1814
+  _globals['_JOBSTATUSUPDATE']._serialized_start=1817
+  _globals['_JOBSTATUSUPDATE']._serialized_end=1992
+  _globals['_STREAMRESULTSREQUEST']._serialized_start=1994
+  _globals['_STREAMRESULTSREQUEST']._serialized_end=2052
+  _globals['_RESULTCHUNK']._serialized_start=2055
+  _globals['_RESULTCHUNK']._serialized_end=2243
+  _globals['_RESULTCHUNK_COUNTSENTRY']._serialized_start=465
+  _globals['_RESULTCHUNK_COUNTSENTRY']._serialized_end=510
+  _globals['_BATCHJOBSUBMISSION']._serialized_start=2246
+  _globals['_BATCHJOBSUBMISSION']._serialized_end=2399
+  _globals['_BATCHJOBRESULT']._serialized_start=2402
+  _globals['_BATCHJOBRESULT']._serialized_end=2551
+  _globals['_SUBMITJOBSTREAMREQUEST']._serialized_start=2553
+  _globals['_SUBMITJOBSTREAMREQUEST']._serialized_end=2642
+  _globals['_SUBMITJOBSTREAMRESPONSE']._serialized_start=2644
+  _globals['_SUBMITJOBSTREAMRESPONSE']._serialized_end=2752
+  _globals['_ARVAKSERVICE']._serialized_start=2941
+  _globals['_ARVAKSERVICE']._serialized_end=3902
 # @@protoc_insertion_point(module_scope)
@@ -1,4 +1,3 @@
-# NOTE: This file may be out of date. Regenerate from proto/arvak.proto if streaming RPCs are needed.
 # Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
 """Client and server classes corresponding to protobuf-defined services."""
 import grpc
@@ -54,6 +53,11 @@ class ArvakServiceStub(object):
                 request_serializer=arvak__pb2.GetJobStatusRequest.SerializeToString,
                 response_deserializer=arvak__pb2.GetJobStatusResponse.FromString,
                 _registered_method=True)
+        self.GetJobStatusBatch = channel.unary_unary(
+                '/arvak.v1.ArvakService/GetJobStatusBatch',
+                request_serializer=arvak__pb2.GetJobStatusBatchRequest.SerializeToString,
+                response_deserializer=arvak__pb2.GetJobStatusBatchResponse.FromString,
+                _registered_method=True)
         self.GetJobResult = channel.unary_unary(
                 '/arvak.v1.ArvakService/GetJobResult',
                 request_serializer=arvak__pb2.GetJobResultRequest.SerializeToString,
@@ -74,6 +78,26 @@ class ArvakServiceStub(object):
                 request_serializer=arvak__pb2.GetBackendInfoRequest.SerializeToString,
                 response_deserializer=arvak__pb2.GetBackendInfoResponse.FromString,
                 _registered_method=True)
+        self.WatchJob = channel.unary_stream(
+                '/arvak.v1.ArvakService/WatchJob',
+                request_serializer=arvak__pb2.WatchJobRequest.SerializeToString,
+                response_deserializer=arvak__pb2.JobStatusUpdate.FromString,
+                _registered_method=True)
+        self.StreamResults = channel.unary_stream(
+                '/arvak.v1.ArvakService/StreamResults',
+                request_serializer=arvak__pb2.StreamResultsRequest.SerializeToString,
+                response_deserializer=arvak__pb2.ResultChunk.FromString,
+                _registered_method=True)
+        self.SubmitBatchStream = channel.stream_stream(
+                '/arvak.v1.ArvakService/SubmitBatchStream',
+                request_serializer=arvak__pb2.BatchJobSubmission.SerializeToString,
+                response_deserializer=arvak__pb2.BatchJobResult.FromString,
+                _registered_method=True)
+        self.SubmitJobStream = channel.stream_stream(
+                '/arvak.v1.ArvakService/SubmitJobStream',
+                request_serializer=arvak__pb2.SubmitJobStreamRequest.SerializeToString,
+                response_deserializer=arvak__pb2.SubmitJobStreamResponse.FromString,
+                _registered_method=True)
 
 
 class ArvakServiceServicer(object):
@@ -104,6 +128,13 @@ class ArvakServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetJobStatusBatch(self, request, context):
+        """/ Get the status of several jobs in one call.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetJobResult(self, request, context):
         """/ Get the result of a completed job.
         """
@@ -132,6 +163,36 @@ class ArvakServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def WatchJob(self, request, context):
+        """/ Watch job status updates in real-time (server streaming).
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamResults(self, request, context):
+        """/ Stream large result sets in chunks (server streaming).
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SubmitBatchStream(self, request_iterator, context):
+        """/ Submit batch jobs with streaming feedback (bidirectional streaming).
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SubmitJobStream(self, request_iterator, context):
+        """/ Submit single jobs over one long-lived stream (bidirectional streaming).
+        / Each request is answered once, matched by its correlation ID; replies
+        / may arrive out of order.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_ArvakServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -150,6 +211,11 @@ def add_ArvakServiceServicer_to_server(servicer, server):
                     request_deserializer=arvak__pb2.GetJobStatusRequest.FromString,
                     response_serializer=arvak__pb2.GetJobStatusResponse.SerializeToString,
             ),
+            'GetJobStatusBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetJobStatusBatch,
+                    request_deserializer=arvak__pb2.GetJobStatusBatchRequest.FromString,
+                    response_serializer=arvak__pb2.GetJobStatusBatchResponse.SerializeToString,
+            ),
             'GetJobResult': grpc.unary_unary_rpc_method_handler(
                     servicer.GetJobResult,
                     request_deserializer=arvak__pb2.GetJobResultRequest.FromString,
@@ -170,6 +236,26 @@ def add_ArvakServiceServicer_to_server(servicer, server):
                     request_deserializer=arvak__pb2.GetBackendInfoRequest.FromString,
                     response_serializer=arvak__pb2.GetBackendInfoResponse.SerializeToString,
             ),
+            'WatchJob': grpc.unary_stream_rpc_method_handler(
+                    servicer.WatchJob,
+                    request_deserializer=arvak__pb2.WatchJobRequest.FromString,
+                    response_serializer=arvak__pb2.JobStatusUpdate.SerializeToString,
+            ),
+            'StreamResults': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamResults,
+                    request_deserializer=arvak__pb2.StreamResultsRequest.FromString,
+                    response_serializer=arvak__pb2.ResultChunk.SerializeToString,
+            ),
+            'SubmitBatchStream': grpc.stream_stream_rpc_method_handler(
+                    servicer.SubmitBatchStream,
+                    request_deserializer=arvak__pb2.BatchJobSubmission.FromString,
+                    response_serializer=arvak__pb2.BatchJobResult.SerializeToString,
+            ),
+            'SubmitJobStream': grpc.stream_stream_rpc_method_handler(
+                    servicer.SubmitJobStream,
+                    request_deserializer=arvak__pb2.SubmitJobStreamRequest.FromString,
+                    response_serializer=arvak__pb2.SubmitJobStreamResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'arvak.v1.ArvakService', rpc_method_handlers)
@@ -266,6 +352,33 @@ class ArvakService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GetJobStatusBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/arvak.v1.ArvakService/GetJobStatusBatch',
+            arvak__pb2.GetJobStatusBatchRequest.SerializeToString,
+            arvak__pb2.GetJobStatusBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetJobResult(request,
             target,
@@ -373,3 +486,111 @@ class ArvakService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def WatchJob(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/arvak.v1.ArvakService/WatchJob',
+            arvak__pb2.WatchJobRequest.SerializeToString,
+            arvak__pb2.JobStatusUpdate.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamResults(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/arvak.v1.ArvakService/StreamResults',
+            arvak__pb2.StreamResultsRequest.SerializeToString,
+            arvak__pb2.ResultChunk.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SubmitBatchStream(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/arvak.v1.ArvakService/SubmitBatchStream',
+            arvak__pb2.BatchJobSubmission.SerializeToString,
+            arvak__pb2.BatchJobResult.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SubmitJobStream(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/arvak.v1.ArvakService/SubmitJobStream',
+            arvak__pb2.SubmitJobStreamRequest.SerializeToString,
+            arvak__pb2.SubmitJobStreamResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
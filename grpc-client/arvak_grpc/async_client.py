@@ -1,76 +1,704 @@
 """Async Arvak gRPC client implementation with connection pooling."""
 
 import asyncio
-import json
+import itertools
+import operator
+from collections import deque
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import List, Optional, Callable, Any
+from typing import List, Optional, Callable, Any, Tuple, Union
 
 import grpc.aio
 
 from . import arvak_pb2, arvak_pb2_grpc
-from .exceptions import (
-    ArvakBackendNotFoundError,
-    ArvakError,
-    ArvakInvalidCircuitError,
-    ArvakJobNotCompletedError,
-    ArvakJobNotFoundError,
+from .exceptions import ArvakError, ArvakInvalidCircuitError, ArvakJobNotFoundError
+from .types import (
+    BackendInfo,
+    Job,
+    JobResult,
+    JobState,
+    PreparedCircuit,
+    _PACKED_COUNTS,
 )
-from .types import BackendInfo, Job, JobResult, JobState
+from .client import (
+    _CHANNEL_OPTIONS,
+    _SUBMIT_JOB_METHOD,
+    _build_batch_request,
+    _check_qasm_header,
+    _decode_json_field,
+    _encode_prepared_request,
+    _job_from_proto,
+    _prepare_circuit,
+    _result_counts,
+    _single_submission,
+    _submission_error,
+    _translate_grpc_error,
+    _translate_status,
+)
+from .job_future import _POLL_INITIAL, _POLL_MULTIPLIER, _jittered
+from .retry_policy import RetryPolicy
+
+_inflight = operator.attrgetter("inflight")
+
+# Transient failures retried by the interceptor: 3 attempts in total.
+# DEADLINE_EXCEEDED is not retried, since a retry would run past the
+# caller's timeout.
+_UNARY_RETRY_POLICY = RetryPolicy(
+    max_attempts=2,
+    initial_backoff=0.1,
+    max_backoff=2.0,
+    retryable_status_codes=[grpc.StatusCode.UNAVAILABLE],
+)
+
+
+# Only read-only RPCs are retried. UNAVAILABLE can arrive after the server
+# accepted a request, and retrying SubmitJob, SubmitBatch or CancelJob
+# could then submit or cancel twice.
+_RETRYABLE_METHODS = frozenset(
+    f"/arvak.v1.ArvakService/{name}"
+    for name in (
+        "GetJobStatus",
+        "GetJobStatusBatch",
+        "GetJobResult",
+        "ListBackends",
+        "GetBackendInfo",
+    )
+)
+
+
+class _ArvakInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
+    """Retry and error translation for unary RPCs on pooled channels.
+
+    Retries UNAVAILABLE on read-only RPCs with jittered exponential backoff
+    and raises any other failure as the matching Arvak exception, so the
+    client's unary methods need no ``try``/``except`` of their own.
+    """
+
+    def __init__(self, retry_policy: RetryPolicy = _UNARY_RETRY_POLICY):
+        self.retry_policy = retry_policy
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        method = client_call_details.method
+        if isinstance(method, bytes):
+            method = method.decode()
+        if method not in _RETRYABLE_METHODS:
+            call = await continuation(client_call_details, request)
+            try:
+                return await call
+            except grpc.RpcError as e:
+                raise _translate_grpc_error(e) from e
+
+        policy = self.retry_policy
+        attempt = 0
+        while True:
+            call = await continuation(client_call_details, request)
+            try:
+                return await call
+            except grpc.RpcError as e:
+                if not policy.should_retry(e, attempt):
+                    raise _translate_grpc_error(e) from e
+            await asyncio.sleep(policy.get_backoff_delay(attempt))
+            attempt += 1
+
+
+class _ChannelSlot:
+    """A pooled channel, its stub and the number of RPCs in flight on it.
+
+    Used as a context manager around an RPC: entering counts the call as in
+    flight and yields the stub, exiting releases it. A call that raises
+    marks the slot as its pool's most recently failed one (see
+    :meth:`ConnectionPool.reset_failed`).
+    """
+
+    __slots__ = (
+        "channel", "pool", "stub", "submit_job_encoded", "submit_stream", "inflight"
+    )
+
+    def __init__(self, channel: grpc.aio.Channel, pool: "ConnectionPool"):
+        self.channel = channel
+        self.pool = pool
+        self.stub = arvak_pb2_grpc.ArvakServiceStub(channel)
+        # SubmitJob taking pre-encoded request bytes, for submit_prepared()
+        self.submit_job_encoded = channel.unary_unary(
+            _SUBMIT_JOB_METHOD,
+            response_deserializer=arvak_pb2.SubmitJobResponse.FromString,
+        )
+        # This channel's SubmitJobStream, opened on first use
+        self.submit_stream: Optional[_SubmitStream] = None
+        self.inflight = 0
+
+    def __enter__(self) -> arvak_pb2_grpc.ArvakServiceStub:
+        self.inflight += 1
+        return self.stub
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.inflight -= 1
+        if exc_type is not None:
+            self.pool._last_failed = self
 
 
 class ConnectionPool:
     """Connection pool for gRPC channels.
 
-    Manages a pool of reusable gRPC channels to improve performance
-    by avoiding the overhead of creating new connections.
+    Holds up to ``max_size`` long-lived shared channels, each wrapped in a
+    slot that counts the RPCs in flight on it. :meth:`slot` hands out the
+    least busy channel. A channel multiplexes many concurrent HTTP/2 streams,
+    but servers cap that number (commonly at 100) and queue calls beyond it,
+    so another channel is opened once every open one has
+    ``stream_watermark`` calls in flight. Past ``max_size`` channels the
+    least busy one is used regardless.
+
+    Channels are opened on demand rather than in ``__init__``, which also
+    matters because ``grpc.aio`` channels bind to the event loop that is
+    running when they are created.
+
+    :meth:`get_channel`/:meth:`return_channel` remain available for callers
+    that want a dedicated channel. Idle dedicated channels are kept in an
+    ``asyncio.LifoQueue`` so the most recently returned (warm) channel is
+    handed out first.
+
+    Checkouts, returns and slot selection take no lock: they run on the
+    event loop without awaiting between reading ``_closed`` and touching
+    the pool. :meth:`schedule_return` and :meth:`schedule_close` do not
+    await at all; the channels they hand over are pooled or closed by a
+    background drainer task.
     """
 
-    def __init__(self, address: str, max_size: int = 10):
+    def __init__(
+        self, address: str, max_size: int = 10, stream_watermark: int = 80
+    ):
         """Initialize connection pool.
 
         Args:
             address: The gRPC server address
             max_size: Maximum number of channels in the pool
+            stream_watermark: In-flight RPCs per channel at which the pool
+                opens another channel
         """
         self.address = address
         self.max_size = max_size
-        self._pool: List[grpc.aio.Channel] = []
-        self._lock = asyncio.Lock()
+        self.stream_watermark = stream_watermark
+        self._slots: List[_ChannelSlot] = []
+        self._pool: asyncio.LifoQueue = asyncio.LifoQueue(maxsize=max_size)
         self._closed = False
+        # Channels waiting for the drainer to pool or close them
+        self._pending_returns: deque = deque()
+        self._drainer: Optional[asyncio.Task] = None
+        # Closes of channels dropped by reset(), kept until they finish
+        self._resets: set = set()
+        # The slot the most recent failed RPC ran on, for reset_failed()
+        self._last_failed: Optional[_ChannelSlot] = None
+        self._channel_numbers = itertools.count()
+
+    def _open_slot(self) -> _ChannelSlot:
+        """Open another shared channel."""
+        # A distinct channel arg keeps gRPC from collapsing the channels
+        # onto one shared subchannel (and thus one TCP connection).
+        channel = grpc.aio.insecure_channel(
+            self.address,
+            options=_CHANNEL_OPTIONS
+            + (("grpc.channel_number", next(self._channel_numbers)),),
+            interceptors=[_ArvakInterceptor()],
+        )
+        slot = _ChannelSlot(channel, self)
+        self._slots.append(slot)
+        return slot
 
-    async def get_channel(self) -> grpc.aio.Channel:
-        """Get a channel from the pool or create a new one."""
-        async with self._lock:
-            if self._closed:
-                raise RuntimeError("Connection pool is closed")
+    def slot(self) -> _ChannelSlot:
+        """Get the shared channel slot to run the next RPC on.
+
+        Example:
+            >>> with pool.slot() as stub:
+            ...     response = await stub.GetJobStatus(request)
+        """
+        if self._closed:
+            raise RuntimeError("Connection pool is closed")
+        slots = self._slots
+        if not slots:
+            return self._open_slot()
+        best = min(slots, key=_inflight)
+        if best.inflight >= self.stream_watermark and len(slots) < self.max_size:
+            return self._open_slot()
+        return best
 
-            # Try to get an existing channel
-            if self._pool:
-                return self._pool.pop()
+    async def get_channel(self) -> grpc.aio.Channel:
+        """Get a dedicated channel from the pool or create a new one."""
+        if self._closed:
+            raise RuntimeError("Connection pool is closed")
 
-            # Create new channel if pool not full
-            channel = grpc.aio.insecure_channel(self.address)
-            return channel
+        # Try to get an existing channel
+        try:
+            return self._pool.get_nowait()
+        except asyncio.QueueEmpty:
+            return grpc.aio.insecure_channel(
+                self.address, options=_CHANNEL_OPTIONS
+            )
 
     async def return_channel(self, channel: grpc.aio.Channel):
-        """Return a channel to the pool."""
-        async with self._lock:
-            if self._closed:
-                await channel.close()
-                return
-
-            if len(self._pool) < self.max_size:
-                self._pool.append(channel)
-            else:
-                await channel.close()
+        """Return a dedicated channel to the pool."""
+        if self._closed:
+            await channel.close()
+            return
+
+        try:
+            self._pool.put_nowait(channel)
+        except asyncio.QueueFull:
+            await channel.close()
+
+    def schedule_return(self, channel: grpc.aio.Channel):
+        """Return a dedicated channel without awaiting.
+
+        The channel is pooled, or closed if the pool is full or closed, by
+        the background drainer.
+        """
+        self._pending_returns.append(channel)
+        self._start_drainer()
+
+    def reset(self):
+        """Drop every open channel and close them in the background.
+
+        For connections that have gone bad, e.g. after a server restart or
+        a load balancer's idle timeout: the next :meth:`slot` or
+        :meth:`get_channel` opens a fresh channel. RPCs still running on the
+        dropped channels fail with CANCELLED.
+        """
+        if self._closed:
+            return
+        slots, self._slots = self._slots, []
+        self._last_failed = None
+        channels = [slot.channel for slot in slots]
+        while True:
+            try:
+                channels.append(self._pool.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        self._close_in_background(channels)
+
+    def reset_failed(self):
+        """Drop the shared channel the most recent failed RPC ran on.
+
+        Like :meth:`reset`, but leaves the other channels, and the streams
+        they carry, alone: the pool may be shared by several clients. The
+        next :meth:`slot` opens a fresh channel if it needs one.
+        """
+        slot, self._last_failed = self._last_failed, None
+        if self._closed or slot not in self._slots:
+            return
+        self._slots.remove(slot)
+        self._close_in_background([slot.channel])
+
+    def _close_in_background(self, channels: list):
+        if channels:
+            closing = asyncio.gather(*(channel.close() for channel in channels))
+            self._resets.add(closing)
+            closing.add_done_callback(self._resets.discard)
+
+    def schedule_close(self):
+        """Mark the pool closed and close its channels in the background.
+
+        Returns immediately; await :meth:`close` to wait for the channels to
+        shut down. Safe to call more than once.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        # Take every channel out of the pool at once, so nothing can be
+        # checked out or returned into a half-closed pool
+        slots, self._slots = self._slots, []
+        pending = self._pending_returns
+        pending.extend(slot.channel for slot in slots)
+        while True:
+            try:
+                pending.append(self._pool.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        self._start_drainer()
+
+    def _start_drainer(self):
+        if self._drainer is None and self._pending_returns:
+            self._drainer = asyncio.get_running_loop().create_task(
+                self._drain_returns()
+            )
+
+    async def _drain_returns(self):
+        """Pool or close scheduled channels until none are left."""
+        pending = self._pending_returns
+        try:
+            while pending:
+                channels = [pending.popleft() for _ in range(len(pending))]
+                await asyncio.gather(
+                    *(self.return_channel(channel) for channel in channels)
+                )
+        finally:
+            self._drainer = None
 
     async def close(self):
-        """Close all channels in the pool."""
-        async with self._lock:
-            self._closed = True
-            for channel in self._pool:
-                await channel.close()
-            self._pool.clear()
+        """Close all channels in the pool.
+
+        Safe to call more than once; concurrent callers all return only once
+        the channels are closed.
+        """
+        self.schedule_close()
+        drainer = self._drainer
+        if drainer is not None:
+            # Shielded so a cancelled caller does not abort the shutdown
+            await asyncio.shield(drainer)
+
+
+class _StreamPool:
+    """Caps the long-lived streams each pooled channel carries.
+
+    A WatchJob stream occupies an HTTP/2 stream for the whole life of a
+    job. Servers cap concurrent streams per connection (commonly at 100)
+    and queue the rest, so each channel carries at most ``max_streams``
+    streams from this pool, leaving headroom for unary RPCs. :meth:`stream`
+    picks the least busy channel with room, opens another channel while the
+    connection pool has space, and otherwise waits for a stream to end, so
+    backpressure is applied when a stream is acquired instead of in the
+    server's queue.
+
+    A caller that consumes streams one after another can hold two at once:
+    opening the next stream while draining the current one hides its setup
+    round trip.
+    """
+
+    def __init__(self, pool: ConnectionPool, max_streams: int = 90):
+        self._pool = pool
+        self.max_streams = max_streams
+        self._semaphores: dict = {}  # _ChannelSlot -> asyncio.Semaphore
+        # Created on first wait: the pool may be built outside its loop
+        self._freed: Optional[asyncio.Event] = None
+
+    def _semaphore(self, slot: _ChannelSlot) -> asyncio.Semaphore:
+        sem = self._semaphores.get(slot)
+        if sem is None:
+            sem = self._semaphores[slot] = asyncio.Semaphore(self.max_streams)
+        return sem
+
+    def _pick(self) -> Optional[_ChannelSlot]:
+        """The slot for the next stream, or None if every channel is full."""
+        pool = self._pool
+        if pool._closed:
+            raise RuntimeError("Connection pool is closed")
+        open_slots = [s for s in pool._slots if not self._semaphore(s).locked()]
+        can_grow = len(pool._slots) < pool.max_size
+        if open_slots:
+            best = min(open_slots, key=_inflight)
+            if best.inflight < pool.stream_watermark or not can_grow:
+                return best
+        return pool._open_slot() if can_grow else None
+
+    @asynccontextmanager
+    async def stream(self):
+        """Hold a channel slot for the duration of a stream.
+
+        Example:
+            >>> async with streams.stream() as stub:
+            ...     async for update in stub.WatchJob(request):
+            ...         ...
+        """
+        while True:
+            slot = self._pick()
+            if slot is not None:
+                break
+            if self._freed is None:
+                self._freed = asyncio.Event()
+            self._freed.clear()
+            await self._freed.wait()
+
+        sem = self._semaphore(slot)
+        await sem.acquire()  # Not locked, so this does not wait
+        try:
+            with slot as stub:
+                yield stub
+        finally:
+            sem.release()
+            if self._freed is not None:
+                self._freed.set()
+
+
+_SUBMIT_JOB_STREAM_METHOD = "/arvak.v1.ArvakService/SubmitJobStream"
+
+# grpc.StatusCode by number, for status codes carried inside messages
+_STATUS_CODES = {code.value[0]: code for code in grpc.StatusCode}
+
+
+def _varint(value: int) -> bytes:
+    """Encode a non-negative int as a protobuf varint."""
+    out = bytearray()
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _frame_submission(correlation_id: int, encoded_request: bytes) -> bytes:
+    """Encode a SubmitJobStreamRequest around an encoded SubmitJobRequest.
+
+    The ``job`` field (number 2, length-delimited) is written by hand, so a
+    request that is already encoded, e.g. by submit_prepared(), is embedded
+    without being parsed again.
+    """
+    head = arvak_pb2.SubmitJobStreamRequest(correlation_id=correlation_id)
+    return (
+        head.SerializeToString()
+        + b"\x12" + _varint(len(encoded_request)) + encoded_request
+    )
+
+
+def _submit_job_request(backend_id: str, job) -> arvak_pb2.SubmitJobRequest:
+    """Build the SubmitJobRequest for one ``BatchJobRequest``."""
+    request = arvak_pb2.SubmitJobRequest()
+    request.circuit.CopyFrom(job.circuit)
+    request.backend_id = backend_id
+    request.shots = job.shots
+    return request
+
+
+class _SubmitStream:
+    """A long-lived SubmitJobStream call carrying single-job submissions.
+
+    Each submission is written to the one bidirectional stream with its own
+    correlation ID and resolved when the reply carrying that ID arrives, so
+    concurrent submits on a channel share a stream instead of each setting
+    up an HTTP/2 stream for a unary SubmitJob. Once the call ends, for any
+    reason, the stream is ``closed``, its pending submissions fail with the
+    call's error, and the client opens a new stream on next use.
+    """
+
+    def __init__(self, channel: grpc.aio.Channel):
+        self._outbox: asyncio.Queue = asyncio.Queue()
+        self._pending: dict = {}  # correlation ID -> asyncio.Future
+        self._ids = itertools.count(1)
+        self.closed = False
+        open_call = channel.stream_stream(
+            _SUBMIT_JOB_STREAM_METHOD,
+            response_deserializer=arvak_pb2.SubmitJobStreamResponse.FromString,
+        )
+        self._call = open_call(self._requests())
+        self._reader = asyncio.ensure_future(self._read())
+
+    async def _requests(self):
+        while True:
+            yield await self._outbox.get()
+
+    async def submit(self, encoded_request: bytes, timeout: Optional[float]) -> str:
+        """Send an encoded SubmitJobRequest and wait for its job ID."""
+        correlation_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[correlation_id] = future
+        self._outbox.put_nowait(_frame_submission(correlation_id, encoded_request))
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise ArvakError(
+                f"DEADLINE_EXCEEDED: No reply within {timeout} seconds"
+            ) from None
+        finally:
+            self._pending.pop(correlation_id, None)
+
+    async def _read(self):
+        error = ArvakError("SubmitJobStream closed")
+        try:
+            async for reply in self._call:
+                future = self._pending.pop(reply.correlation_id, None)
+                if future is None or future.done():
+                    continue  # The submitter gave up waiting
+                if reply.error_code:
+                    code = _STATUS_CODES.get(reply.error_code, grpc.StatusCode.UNKNOWN)
+                    future.set_exception(_translate_status(code, reply.error_message))
+                else:
+                    future.set_result(reply.job_id)
+        except grpc.RpcError as e:
+            error = _translate_grpc_error(e)
+            error.__cause__ = e
+        finally:
+            self.closed = True
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+
+
+class _SubmitBatcher:
+    """Coalesces concurrent job submissions into SubmitBatch RPCs.
+
+    Submissions are queued and picked up by a single background task. After
+    the first one arrives it waits ``flush_interval`` seconds for more, then
+    groups everything queued by backend and sends one SubmitBatch per group,
+    resolving each caller's future with its job ID. A group of one goes out
+    as a plain SubmitJob.
+
+    The server parses and validates every circuit of a SubmitBatch before
+    it creates any job, so a batch rejected with INVALID_ARGUMENT created
+    nothing and is resubmitted one job at a time; the error then reaches
+    only the caller whose circuit was bad. Any other error fails the whole
+    group, since some of its jobs may already exist.
+    """
+
+    def __init__(self, client: "AsyncArvakClient", flush_interval: float):
+        self._client = client
+        self._flush_interval = flush_interval
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._held: list = []  # Dequeued by _run, not yet handed to _send
+        self._inflight: dict = {}  # _send task -> its group
+
+    def submit(self, backend_id: str, job) -> asyncio.Future:
+        """Queue a ``BatchJobRequest`` and return a future for its job ID."""
+        loop = asyncio.get_running_loop()
+        if self._task is None:
+            self._queue = asyncio.Queue()
+            self._task = loop.create_task(self._run())
+        future = loop.create_future()
+        self._queue.put_nowait((backend_id, job, future))
+        return future
+
+    async def _run(self):
+        queue = self._queue
+        while True:
+            # Held here, not in a local, so close() can reject them
+            items = self._held = [await queue.get()]
+            await asyncio.sleep(self._flush_interval)
+            while True:
+                try:
+                    items.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            self._held = []
+
+            groups = {}
+            for item in items:
+                if not item[2].done():  # Skip callers that gave up
+                    groups.setdefault(item[0], []).append(item)
+            for backend_id, group in groups.items():
+                task = asyncio.ensure_future(self._send(backend_id, group))
+                self._inflight[task] = group
+                task.add_done_callback(self._discard_inflight)
+
+    def _discard_inflight(self, task: asyncio.Task):
+        self._inflight.pop(task, None)
+
+    async def _send(self, backend_id: str, group: list):
+        if len(group) == 1:
+            await self._send_one(group[0])
+            return
+
+        client = self._client
+        request = arvak_pb2.SubmitBatchRequest(
+            backend_id=backend_id, jobs=[job for _, job, _ in group]
+        )
+        try:
+            with client._pool.slot() as stub:
+                response = await stub.SubmitBatch(request, timeout=client.timeout)
+        except ArvakInvalidCircuitError:
+            # The server rejected the batch before creating any job;
+            # resubmit individually so only the bad circuit's caller fails.
+            await asyncio.gather(*(self._send_one(item) for item in group))
+            return
+        except Exception as exc:
+            _reject(group, exc)
+            return
+
+        if len(response.job_ids) != len(group):
+            _reject(
+                group,
+                ArvakError(
+                    f"SubmitBatch returned {len(response.job_ids)} job IDs "
+                    f"for {len(group)} jobs"
+                ),
+            )
+            return
+        for (_, _, future), job_id in zip(group, response.job_ids):
+            if not future.done():
+                future.set_result(job_id)
+
+    async def _send_one(self, item):
+        backend_id, job, future = item
+        try:
+            job_id = await self._client._submit_job(backend_id, job)
+        except Exception as exc:
+            _reject([item], exc)
+        else:
+            if not future.done():
+                future.set_result(job_id)
+
+    def close(self):
+        """Stop the background task and fail submissions still pending."""
+        pending, self._held = self._held, []
+        for task, group in self._inflight.items():
+            task.cancel()
+            pending.extend(group)
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        if self._queue is not None:
+            while True:
+                try:
+                    pending.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+        _reject(pending, ArvakError("client closed"))
+
+
+class _PoolRegistry:
+    """Connection pools shared by the clients on one event loop.
+
+    Clients for the same address and pool size on the same loop use one
+    :class:`ConnectionPool`, and one :class:`_StreamPool` over it, instead
+    of each opening its own channels. The pool is closed once the last
+    client using it closes. ``grpc.aio`` channels are bound to the loop
+    that created them, so clients on different loops, or created outside a
+    running loop, never share.
+    """
+
+    def __init__(self):
+        # (loop, address, max_size) -> [ConnectionPool, _StreamPool, clients]
+        self._entries: dict = {}
+
+    def acquire(self, address: str, max_size: int) -> Tuple[Optional[tuple], list]:
+        """Get the pool for a new client, and its key to release it with."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            pool = ConnectionPool(address, max_size)
+            return None, [pool, _StreamPool(pool), 1]
+        key = (loop, address, max_size)
+        entry = self._entries.get(key)
+        if entry is None or entry[0]._closed:
+            pool = ConnectionPool(address, max_size)
+            entry = self._entries[key] = [pool, _StreamPool(pool), 0]
+        entry[2] += 1
+        return key, entry
+
+    def release(self, key: Optional[tuple], entry: list):
+        """Drop a client's hold on its pool, closing it after the last one."""
+        entry[2] -= 1
+        if entry[2] > 0:
+            return
+        if key is not None and self._entries.get(key) is entry:
+            del self._entries[key]
+        entry[0].schedule_close()
+
+
+_pools = _PoolRegistry()
+
+
+def _is_unimplemented(error: ArvakError) -> bool:
+    """Whether the interceptor raised ``error`` for an UNIMPLEMENTED RPC."""
+    cause = error.__cause__
+    return (
+        isinstance(cause, grpc.RpcError)
+        and cause.code() == grpc.StatusCode.UNIMPLEMENTED
+    )
+
+
+def _reject(group: list, exc: BaseException):
+    """Fail every still-pending future in a batcher group with ``exc``."""
+    for _, _, future in group:
+        if not future.done():
+            future.set_exception(exc)
 
 
 class AsyncArvakClient:
@@ -83,7 +711,13 @@ class AsyncArvakClient:
     Args:
         address: The gRPC server address (default: "localhost:50051")
         timeout: Default timeout for RPC calls in seconds (default: 30.0)
-        pool_size: Maximum number of connections in the pool (default: 10)
+        pool_size: Maximum number of channels RPCs are spread across
+            (default: 10). Clients created on the same event loop with the
+            same address and pool size share their channels.
+        flush_interval_ms: Window in milliseconds during which concurrent
+            submissions are collected into one SubmitBatch RPC; None sends
+            every submission on its own, encoding each circuit only once as
+            :meth:`prepare_qasm` does (default: 1.0)
 
     Example:
         >>> async with AsyncArvakClient("localhost:50051") as client:
@@ -97,43 +731,56 @@ class AsyncArvakClient:
         address: str = "localhost:50051",
         timeout: float = 30.0,
         pool_size: int = 10,
+        flush_interval_ms: Optional[float] = 1.0,
     ):
         """Initialize the async Arvak client."""
         self.address = address
         self.timeout = timeout
-        self._pool = ConnectionPool(address, pool_size)
-        self._channel: Optional[grpc.aio.Channel] = None
-        self._stub: Optional[arvak_pb2_grpc.ArvakServiceStub] = None
+        self._pool_key, self._pool_entry = _pools.acquire(address, pool_size)
+        self._pool, self._streams = self._pool_entry[:2]
+        self._batcher = (
+            _SubmitBatcher(self, flush_interval_ms / 1000.0)
+            if flush_interval_ms is not None
+            else None
+        )
+        # Cleared the first time the server answers WatchJob with UNIMPLEMENTED
+        self._watch_supported = True
+        # Likewise for GetJobStatusBatch, SubmitBatchStream and SubmitJobStream
+        self._status_batch_supported = True
+        self._submit_stream_supported = True
+        self._submit_job_stream_supported = True
 
     async def __aenter__(self):
         """Async context manager entry."""
-        await self._ensure_connected()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
         await self.close()
 
-    async def _ensure_connected(self):
-        """Ensure we have an active connection."""
-        if self._channel is None:
-            self._channel = await self._pool.get_channel()
-            self._stub = arvak_pb2_grpc.ArvakServiceStub(self._channel)
-
     async def close(self):
-        """Close the client and return channel to pool."""
-        if self._channel is not None:
-            await self._pool.return_channel(self._channel)
-            self._channel = None
-            self._stub = None
+        """Close the client, and its connection pool unless still shared.
+
+        Returns without waiting for the channels to shut down; the pool
+        closes them in the background. Safe to call more than once.
+        """
+        if self._batcher is not None:
+            self._batcher.close()
+        entry, self._pool_entry = self._pool_entry, None
+        if entry is not None:
+            _pools.release(self._pool_key, entry)
+
+    def _reconnect(self):
+        """Replace the channel of the last failed RPC with a fresh one."""
+        self._pool.reset_failed()
 
     async def submit_qasm(
-        self, qasm_code: str, backend_id: str, shots: int = 1024
+        self, qasm_code: Union[str, bytes], backend_id: str, shots: int = 1024
     ) -> str:
         """Submit an OpenQASM 3 circuit for execution.
 
         Args:
-            qasm_code: OpenQASM 3 source code
+            qasm_code: OpenQASM 3 source code, as text or UTF-8 bytes
             backend_id: ID of the backend to execute on
             shots: Number of shots to execute (default: 1024)
 
@@ -145,18 +792,14 @@ class AsyncArvakClient:
             ArvakBackendNotFoundError: If the backend does not exist
             ArvakError: For other errors
         """
-        await self._ensure_connected()
-
-        try:
-            request = arvak_pb2.SubmitJobRequest(
-                circuit=arvak_pb2.CircuitPayload(qasm3=qasm_code),
-                backend_id=backend_id,
-                shots=shots,
-            )
-            response = await self._stub.SubmitJob(request, timeout=self.timeout)
-            return response.job_id
-        except grpc.RpcError as e:
-            self._handle_grpc_error(e)
+        if self._batcher is None:
+            prepared = _prepare_circuit("qasm3", qasm_code)
+            return await self.submit_prepared(prepared, backend_id, shots)
+        _check_qasm_header(qasm_code)
+        job = arvak_pb2.BatchJobRequest()
+        job.circuit.qasm3 = qasm_code
+        job.shots = shots
+        return await self._batcher.submit(backend_id, job)
 
     async def submit_circuit_json(
         self, circuit_json: str, backend_id: str, shots: int = 1024
@@ -176,25 +819,108 @@ class AsyncArvakClient:
             ArvakBackendNotFoundError: If the backend does not exist
             ArvakError: For other errors
         """
-        await self._ensure_connected()
-
+        if self._batcher is None:
+            prepared = _prepare_circuit("arvak_ir_json", circuit_json)
+            return await self.submit_prepared(prepared, backend_id, shots)
+        job = arvak_pb2.BatchJobRequest()
+        job.circuit.arvak_ir_json = circuit_json
+        job.shots = shots
+        return await self._batcher.submit(backend_id, job)
+
+    async def _submit_job(self, backend_id: str, job) -> str:
+        """Submit one ``BatchJobRequest`` as a unary SubmitJob RPC."""
+        request = _submit_job_request(backend_id, job)
+        with self._pool.slot() as stub:
+            response = await stub.SubmitJob(request, timeout=self.timeout)
+        return response.job_id
+
+    async def _submit_streamed(self, encoded_request: bytes) -> Optional[str]:
+        """Submit an encoded SubmitJobRequest over a pooled SubmitJobStream.
+
+        Returns None if the server does not implement SubmitJobStream, in
+        which case the caller falls back to a unary SubmitJob.
+        """
+        slot = self._pool.slot()
+        stream = slot.submit_stream
+        if stream is None or stream.closed:
+            stream = slot.submit_stream = _SubmitStream(slot.channel)
         try:
-            request = arvak_pb2.SubmitJobRequest(
-                circuit=arvak_pb2.CircuitPayload(arvak_ir_json=circuit_json),
-                backend_id=backend_id,
-                shots=shots,
-            )
-            response = await self._stub.SubmitJob(request, timeout=self.timeout)
-            return response.job_id
-        except grpc.RpcError as e:
-            self._handle_grpc_error(e)
+            with slot:
+                return await stream.submit(encoded_request, self.timeout)
+        except ArvakError as e:
+            if _is_unimplemented(e):
+                # Nothing was submitted; send it as a unary call instead
+                self._submit_job_stream_supported = False
+                return None
+            # Anything else may have ended the stream after the server took
+            # the submission, so resubmitting could create the job twice
+            raise
+
+    def prepare_qasm(self, qasm_code: Union[str, bytes]) -> PreparedCircuit:
+        """Encode an OpenQASM 3 circuit once for repeated submission.
+
+        Useful when the same circuit is submitted many times, e.g. in a
+        sweep over shot counts, or by many concurrent submitters.
+
+        Args:
+            qasm_code: OpenQASM 3 source code, as text or UTF-8 bytes
+
+        Returns:
+            PreparedCircuit to pass to :meth:`submit_prepared`
+        """
+        return _prepare_circuit("qasm3", qasm_code)
+
+    def prepare_circuit_json(self, circuit_json: str) -> PreparedCircuit:
+        """Encode an Arvak IR JSON circuit once for repeated submission.
+
+        Args:
+            circuit_json: Arvak IR JSON representation
+
+        Returns:
+            PreparedCircuit to pass to :meth:`submit_prepared`
+        """
+        return _prepare_circuit("arvak_ir_json", circuit_json)
+
+    async def submit_prepared(
+        self, prepared: PreparedCircuit, backend_id: str, shots: int = 1024
+    ) -> str:
+        """Submit a circuit encoded by :meth:`prepare_qasm`.
+
+        Prepared circuits bypass the submission batcher: they go out on the
+        channel's SubmitJobStream, or as a unary SubmitJob on servers
+        without it.
+
+        Args:
+            prepared: Circuit from :meth:`prepare_qasm` or
+                :meth:`prepare_circuit_json`
+            backend_id: ID of the backend to execute on
+            shots: Number of shots to execute (default: 1024)
+
+        Returns:
+            Job ID string
+
+        Raises:
+            ArvakInvalidCircuitError: If the circuit is invalid
+            ArvakBackendNotFoundError: If the backend does not exist
+            ArvakError: For other errors
+        """
+        encoded = _encode_prepared_request(prepared, backend_id, shots)
+        if self._submit_job_stream_supported:
+            job_id = await self._submit_streamed(encoded)
+            if job_id is not None:
+                return job_id
+
+        slot = self._pool.slot()
+        with slot:
+            response = await slot.submit_job_encoded(encoded, timeout=self.timeout)
+        return response.job_id
 
     async def submit_batch(
         self,
         circuits: List[tuple[str, int]],
         backend_id: str,
         format: str = "qasm3",
-    ) -> List[str]:
+    ) -> Tuple[str, ...]:
         """Submit multiple circuits as a batch.
 
         Args:
@@ -203,36 +929,17 @@ class AsyncArvakClient:
             format: Circuit format ("qasm3" or "json")
 
         Returns:
-            List of job ID strings
+            Tuple of job ID strings
 
         Raises:
             ArvakInvalidCircuitError: If any circuit is invalid
             ArvakBackendNotFoundError: If the backend does not exist
             ArvakError: For other errors
         """
-        await self._ensure_connected()
-
-        try:
-            batch_jobs = []
-            for circuit_code, shots in circuits:
-                if format == "qasm3":
-                    payload = arvak_pb2.CircuitPayload(qasm3=circuit_code)
-                elif format == "json":
-                    payload = arvak_pb2.CircuitPayload(arvak_ir_json=circuit_code)
-                else:
-                    raise ValueError(f"Invalid format: {format}")
-
-                batch_jobs.append(
-                    arvak_pb2.BatchJobRequest(circuit=payload, shots=shots)
-                )
-
-            request = arvak_pb2.SubmitBatchRequest(
-                backend_id=backend_id, jobs=batch_jobs
-            )
-            response = await self._stub.SubmitBatch(request, timeout=self.timeout)
-            return list(response.job_ids)
-        except grpc.RpcError as e:
-            self._handle_grpc_error(e)
+        request = _build_batch_request(circuits, backend_id, format)
+        with self._pool.slot() as stub:
+            response = await stub.SubmitBatch(request, timeout=self.timeout)
+        return tuple(response.job_ids)
 
     async def get_job_status(self, job_id: str) -> Job:
         """Get the status of a job.
@@ -247,14 +954,50 @@ class AsyncArvakClient:
             ArvakJobNotFoundError: If the job does not exist
             ArvakError: For other errors
         """
-        await self._ensure_connected()
+        request = arvak_pb2.GetJobStatusRequest(job_id=job_id)
+        with self._pool.slot() as stub:
+            response = await stub.GetJobStatus(request, timeout=self.timeout)
+        return self._proto_to_job(response.job)
 
-        try:
-            request = arvak_pb2.GetJobStatusRequest(job_id=job_id)
-            response = await self._stub.GetJobStatus(request, timeout=self.timeout)
-            return self._proto_to_job(response.job)
-        except grpc.RpcError as e:
-            self._handle_grpc_error(e)
+    async def get_job_status_many(self, job_ids: List[str]) -> List[Job]:
+        """Get the status of several jobs in one call.
+
+        Uses the GetJobStatusBatch RPC; against servers that do not
+        implement it, the jobs are queried concurrently one by one.
+
+        Args:
+            job_ids: Job IDs
+
+        Returns:
+            List of Job objects in the order of ``job_ids``; jobs that do
+            not exist are left out
+
+        Raises:
+            ArvakError: For errors
+        """
+        if self._status_batch_supported:
+            request = arvak_pb2.GetJobStatusBatchRequest(job_ids=job_ids)
+            try:
+                with self._pool.slot() as stub:
+                    response = await stub.GetJobStatusBatch(
+                        request, timeout=self.timeout
+                    )
+                return [self._proto_to_job(job) for job in response.jobs]
+            except ArvakError as e:
+                if not _is_unimplemented(e):
+                    raise
+                self._status_batch_supported = False
+
+        jobs = await asyncio.gather(
+            *(self.get_job_status(job_id) for job_id in job_ids),
+            return_exceptions=True,
+        )
+        for job in jobs:
+            if isinstance(job, BaseException) and not isinstance(
+                job, ArvakJobNotFoundError
+            ):
+                raise job
+        return [job for job in jobs if isinstance(job, Job)]
 
     async def get_job_result(self, job_id: str) -> JobResult:
         """Get the result of a completed job.
@@ -270,14 +1013,12 @@ class AsyncArvakClient:
             ArvakJobNotCompletedError: If the job is not completed
             ArvakError: For other errors
         """
-        await self._ensure_connected()
-
-        try:
-            request = arvak_pb2.GetJobResultRequest(job_id=job_id)
-            response = await self._stub.GetJobResult(request, timeout=self.timeout)
-            return self._proto_to_result(response.result)
-        except grpc.RpcError as e:
-            self._handle_grpc_error(e)
+        request = arvak_pb2.GetJobResultRequest(
+            job_id=job_id, packed_counts=_PACKED_COUNTS
+        )
+        with self._pool.slot() as stub:
+            response = await stub.GetJobResult(request, timeout=self.timeout)
+        return self._proto_to_result(response.result)
 
     async def cancel_job(self, job_id: str) -> tuple[bool, str]:
         """Cancel a running or queued job.
@@ -292,14 +1033,10 @@ class AsyncArvakClient:
             ArvakJobNotFoundError: If the job does not exist
             ArvakError: For other errors
         """
-        await self._ensure_connected()
-
-        try:
-            request = arvak_pb2.CancelJobRequest(job_id=job_id)
-            response = await self._stub.CancelJob(request, timeout=self.timeout)
-            return (response.success, response.message)
-        except grpc.RpcError as e:
-            self._handle_grpc_error(e)
+        request = arvak_pb2.CancelJobRequest(job_id=job_id)
+        with self._pool.slot() as stub:
+            response = await stub.CancelJob(request, timeout=self.timeout)
+        return (response.success, response.message)
 
     async def wait_for_job(
         self,
@@ -310,14 +1047,19 @@ class AsyncArvakClient:
     ) -> JobResult:
         """Wait for a job to complete and return its result.
 
-        This method polls the job status until it reaches a terminal state,
-        then retrieves and returns the result.
+        The job is followed over the WatchJob server stream, which delivers
+        each state change (and the result, once completed) as soon as the
+        server has it. Servers that do not implement WatchJob are detected
+        on first use and the client falls back to polling the job status,
+        backing off from a short first wait while the job's state is
+        unchanged, as :class:`JobFuture` does.
 
         Args:
             job_id: Job ID
-            poll_interval: Time to wait between polls in seconds (default: 1.0)
+            poll_interval: Longest wait between polls in seconds when polling
+                (default: 1.0)
             max_wait: Maximum time to wait in seconds, None for no limit (default: None)
-            progress_callback: Optional callback called with Job on each poll
+            progress_callback: Optional callback called with Job on each update
 
         Returns:
             JobResult object
@@ -327,7 +1069,83 @@ class AsyncArvakClient:
             ArvakJobNotFoundError: If the job does not exist
             ArvakError: If the job fails
         """
-        start_time = asyncio.get_running_loop().time()
+        now = asyncio.get_running_loop().time
+        start_time = now()
+
+        if self._watch_supported:
+            result = await self._wait_for_job_stream(
+                job_id, max_wait, progress_callback
+            )
+            if result is not None:
+                return result
+
+        if max_wait is not None:
+            max_wait = max(0.0, max_wait - (now() - start_time))
+        return await self._wait_for_job_poll(
+            job_id, poll_interval, max_wait, progress_callback
+        )
+
+    async def _wait_for_job_stream(
+        self,
+        job_id: str,
+        max_wait: Optional[float],
+        progress_callback: Optional[Callable[[Job], None]],
+    ) -> Optional[JobResult]:
+        """Follow a job over WatchJob until it reaches a terminal state.
+
+        Returns None if the stream is unavailable or ends early, in which
+        case the caller continues by polling.
+        """
+        request = arvak_pb2.WatchJobRequest(
+            job_id=job_id, packed_counts=_PACKED_COUNTS
+        )
+        async with self._streams.stream() as stub:
+            call = stub.WatchJob(request, timeout=max_wait)
+            try:
+                async for update in call:
+                    if progress_callback:
+                        if update.HasField("job"):
+                            progress_callback(self._proto_to_job(update.job))
+                        else:
+                            # Older servers only send the bare state
+                            progress_callback(await self.get_job_status(job_id))
+
+                    if update.state == JobState.COMPLETED:
+                        if update.HasField("result"):
+                            return self._proto_to_result(update.result)
+                        return await self.get_job_result(job_id)
+                    elif update.state == JobState.FAILED:
+                        raise ArvakError(f"Job failed: {update.error_message}")
+                    elif update.state == JobState.CANCELED:
+                        raise ArvakError("Job was canceled")
+            except grpc.RpcError as e:
+                code = e.code()
+                if code == grpc.StatusCode.UNIMPLEMENTED:
+                    self._watch_supported = False
+                    return None
+                if code == grpc.StatusCode.DEADLINE_EXCEEDED and max_wait is not None:
+                    raise TimeoutError(
+                        f"Job did not complete within {max_wait} seconds"
+                    ) from None
+                if code == grpc.StatusCode.DEADLINE_EXCEEDED:
+                    # Server-side watch limit reached; keep waiting by polling
+                    return None
+                self._handle_grpc_error(e)
+            finally:
+                call.cancel()
+        return None
+
+    async def _wait_for_job_poll(
+        self,
+        job_id: str,
+        poll_interval: float,
+        max_wait: Optional[float],
+        progress_callback: Optional[Callable[[Job], None]],
+    ) -> JobResult:
+        """Poll the job status until it reaches a terminal state."""
+        now = asyncio.get_running_loop().time
+        start_time = now()
+        state = None
 
         while True:
             job = await self.get_job_status(job_id)
@@ -343,13 +1161,85 @@ class AsyncArvakClient:
                 raise ArvakError("Job was canceled")
 
             if max_wait is not None:
-                elapsed = asyncio.get_running_loop().time() - start_time
+                elapsed = now() - start_time
                 if elapsed >= max_wait:
                     raise TimeoutError(
                         f"Job did not complete within {max_wait} seconds"
                     )
 
-            await asyncio.sleep(poll_interval)
+            if job.state != state:
+                state = job.state
+                delay = min(_POLL_INITIAL, poll_interval)
+            else:
+                delay = min(delay * _POLL_MULTIPLIER, poll_interval)
+            await asyncio.sleep(_jittered(delay))
+
+    async def submit_and_watch(
+        self,
+        qasm_code: Union[str, bytes],
+        backend_id: str,
+        shots: int = 1024,
+        max_wait: Optional[float] = None,
+    ) -> JobResult:
+        """Submit an OpenQASM 3 circuit and wait for its result.
+
+        Does what :meth:`submit_qasm` followed by :meth:`wait_for_job` does,
+        in one round trip: the circuit goes out on a SubmitBatchStream call,
+        whose server side follows the job it creates and replies on the same
+        stream once it completes. Servers that do not implement
+        SubmitBatchStream are detected on first use and the two separate
+        calls are made instead, as they are when the stream ends before a
+        result arrives (e.g. because the job failed).
+
+        Args:
+            qasm_code: OpenQASM 3 source code, as text or UTF-8 bytes
+            backend_id: ID of the backend to execute on
+            shots: Number of shots to execute (default: 1024)
+            max_wait: Maximum time to wait in seconds, None for no limit (default: None)
+
+        Returns:
+            JobResult object
+
+        Raises:
+            TimeoutError: If max_wait is exceeded
+            ArvakInvalidCircuitError: If the circuit is invalid
+            ArvakBackendNotFoundError: If the backend does not exist
+            ArvakError: If the job fails
+        """
+        now = asyncio.get_running_loop().time
+        start_time = now()
+        job_id = None
+
+        if self._submit_stream_supported:
+            submission = _single_submission(qasm_code, backend_id, shots)
+            async with self._streams.stream() as stub:
+                call = stub.SubmitBatchStream(iter((submission,)), timeout=max_wait)
+                try:
+                    async for reply in call:
+                        kind = reply.WhichOneof("result")
+                        if kind == "completed":
+                            return self._proto_to_result(reply.completed)
+                        if kind == "error":
+                            raise _submission_error(reply.error)
+                        job_id = reply.job_id
+                except grpc.RpcError as e:
+                    code = e.code()
+                    if code == grpc.StatusCode.UNIMPLEMENTED:
+                        self._submit_stream_supported = False
+                    elif code == grpc.StatusCode.DEADLINE_EXCEEDED and max_wait is not None:
+                        raise TimeoutError(
+                            f"Job did not complete within {max_wait} seconds"
+                        ) from None
+                    elif job_id is None:
+                        self._handle_grpc_error(e)
+                finally:
+                    call.cancel()
+
+        if job_id is None:
+            job_id = await self.submit_qasm(qasm_code, backend_id, shots)
+        if max_wait is not None:
+            max_wait = max(0.0, max_wait - (now() - start_time))
+        return await self.wait_for_job(job_id, max_wait=max_wait)
 
     async def list_backends(self) -> List[BackendInfo]:
         """List all available backends.
@@ -360,14 +1250,10 @@ class AsyncArvakClient:
         Raises:
             ArvakError: For errors
         """
-        await self._ensure_connected()
-
-        try:
-            request = arvak_pb2.ListBackendsRequest()
-            response = await self._stub.ListBackends(request, timeout=self.timeout)
-            return [self._proto_to_backend_info(b) for b in response.backends]
-        except grpc.RpcError as e:
-            self._handle_grpc_error(e)
+        request = arvak_pb2.ListBackendsRequest()
+        with self._pool.slot() as stub:
+            response = await stub.ListBackends(request, timeout=self.timeout)
+        return [self._proto_to_backend_info(b) for b in response.backends]
 
     async def get_backend_info(self, backend_id: str) -> BackendInfo:
         """Get detailed information about a specific backend.
@@ -382,14 +1268,10 @@ class AsyncArvakClient:
             ArvakBackendNotFoundError: If the backend does not exist
             ArvakError: For other errors
         """
-        await self._ensure_connected()
-
-        try:
-            request = arvak_pb2.GetBackendInfoRequest(backend_id=backend_id)
-            response = await self._stub.GetBackendInfo(request, timeout=self.timeout)
-            return self._proto_to_backend_info(response.backend)
-        except grpc.RpcError as e:
-            self._handle_grpc_error(e)
+        request = arvak_pb2.GetBackendInfoRequest(backend_id=backend_id)
+        with self._pool.slot() as stub:
+            response = await stub.GetBackendInfo(request, timeout=self.timeout)
+        return self._proto_to_backend_info(response.backend)
 
     async def watch_job(self, job_id: str):
         """Watch job status updates in real-time via server streaming.
@@ -414,14 +1296,13 @@ class AsyncArvakClient:
             ...     if state == JobState.COMPLETED:
             ...         break
         """
-        await self._ensure_connected()
-
         try:
             request = arvak_pb2.WatchJobRequest(job_id=job_id)
-            async for update in self._stub.WatchJob(request, timeout=self.timeout):
-                timestamp = datetime.fromtimestamp(update.timestamp)
-                error_msg = update.error_message if update.error_message else None
-                yield JobState(update.state), timestamp, error_msg
+            async with self._streams.stream() as stub:
+                async for update in stub.WatchJob(request, timeout=self.timeout):
+                    timestamp = datetime.fromtimestamp(update.timestamp)
+                    error_msg = update.error_message if update.error_message else None
+                    yield JobState(update.state), timestamp, error_msg
         except grpc.RpcError as e:
             self._handle_grpc_error(e)
 
@@ -451,15 +1332,14 @@ class AsyncArvakClient:
             ...     if is_final:
             ...         break
         """
-        await self._ensure_connected()
-
         try:
             request = arvak_pb2.StreamResultsRequest(
                 job_id=job_id, chunk_size=chunk_size
             )
-            async for chunk in self._stub.StreamResults(request, timeout=self.timeout):
-                counts = dict(chunk.counts)
-                yield counts, chunk.is_final, chunk.chunk_index, chunk.total_chunks
+            with self._pool.slot() as stub:
+                async for chunk in stub.StreamResults(request, timeout=self.timeout):
+                    counts = dict(chunk.counts)
+                    yield counts, chunk.is_final, chunk.chunk_index, chunk.total_chunks
         except grpc.RpcError as e:
             self._handle_grpc_error(e)
 
@@ -495,98 +1375,61 @@ class AsyncArvakClient:
             ...     elif rtype == "error":
             ...         print(f"Job {job_id} failed: {rdata}")
         """
-        await self._ensure_connected()
-
         async def request_generator():
             """Convert circuit generator to protobuf requests."""
             async for circuit_code, backend_id, shots, format, client_req_id in circuits_generator:
+                submission = arvak_pb2.BatchJobSubmission()
                 if format == "qasm3":
-                    payload = arvak_pb2.CircuitPayload(qasm3=circuit_code)
+                    submission.circuit.qasm3 = circuit_code
                 elif format == "json":
-                    payload = arvak_pb2.CircuitPayload(arvak_ir_json=circuit_code)
+                    submission.circuit.arvak_ir_json = circuit_code
                 else:
                     raise ValueError(f"Invalid format: {format}")
+                submission.backend_id = backend_id
+                submission.shots = shots
+                submission.client_request_id = client_req_id
 
-                yield arvak_pb2.BatchJobSubmission(
-                    circuit=payload,
-                    backend_id=backend_id,
-                    shots=shots,
-                    client_request_id=client_req_id,
-                )
+                yield submission
 
         try:
-            async for result in self._stub.SubmitBatchStream(
-                request_generator(), timeout=self.timeout
-            ):
-                job_id = result.job_id
-                client_req_id = result.client_request_id
-
-                # Determine result type and extract data
-                if result.HasField("submitted"):
-                    yield job_id, client_req_id, "submitted", result.submitted
-                elif result.HasField("completed"):
-                    job_result = self._proto_to_result(result.completed)
-                    yield job_id, client_req_id, "completed", job_result
-                elif result.HasField("error"):
-                    yield job_id, client_req_id, "error", result.error
+            with self._pool.slot() as stub:
+                async for result in stub.SubmitBatchStream(
+                    request_generator(), timeout=self.timeout
+                ):
+                    job_id = result.job_id
+                    client_req_id = result.client_request_id
+
+                    # Determine result type and extract data
+                    if result.HasField("submitted"):
+                        yield job_id, client_req_id, "submitted", result.submitted
+                    elif result.HasField("completed"):
+                        job_result = self._proto_to_result(result.completed)
+                        yield job_id, client_req_id, "completed", job_result
+                    elif result.HasField("error"):
+                        yield job_id, client_req_id, "error", result.error
         except grpc.RpcError as e:
             self._handle_grpc_error(e)
 
     def _proto_to_job(self, proto_job) -> Job:
         """Convert protobuf Job to Job dataclass."""
-        submitted_at = datetime.fromtimestamp(proto_job.submitted_at)
-        started_at = (
-            datetime.fromtimestamp(proto_job.started_at)
-            if proto_job.started_at > 0
-            else None
-        )
-        completed_at = (
-            datetime.fromtimestamp(proto_job.completed_at)
-            if proto_job.completed_at > 0
-            else None
-        )
-
-        return Job(
-            job_id=proto_job.job_id,
-            state=JobState(proto_job.state),
-            submitted_at=submitted_at,
-            backend_id=proto_job.backend_id,
-            shots=proto_job.shots,
-            started_at=started_at,
-            completed_at=completed_at,
-            error_message=proto_job.error_message if proto_job.error_message else None,
-        )
+        return _job_from_proto(proto_job)
 
     def _proto_to_result(self, proto_result) -> JobResult:
         """Convert protobuf JobResult to JobResult dataclass."""
-        metadata = None
-        if proto_result.metadata_json and proto_result.metadata_json != "{}":
-            try:
-                metadata = json.loads(proto_result.metadata_json)
-            except json.JSONDecodeError:
-                pass
-
         return JobResult(
             job_id=proto_result.job_id,
-            counts=dict(proto_result.counts),
+            counts=_result_counts(proto_result),
             shots=proto_result.shots,
             execution_time_ms=(
                 proto_result.execution_time_ms
                 if proto_result.execution_time_ms > 0
                 else None
             ),
-            metadata=metadata,
+            metadata=_decode_json_field(proto_result.metadata_json),
         )
 
     def _proto_to_backend_info(self, proto_backend) -> BackendInfo:
         """Convert protobuf BackendInfo to BackendInfo dataclass."""
-        topology = None
-        if proto_backend.topology_json and proto_backend.topology_json != "{}":
-            try:
-                topology = json.loads(proto_backend.topology_json)
-            except json.JSONDecodeError:
-                pass
-
         return BackendInfo(
             backend_id=proto_backend.backend_id,
             name=proto_backend.name,
@@ -594,25 +1437,10 @@ class AsyncArvakClient:
             max_qubits=proto_backend.max_qubits,
             max_shots=proto_backend.max_shots,
             description=proto_backend.description,
-            supported_gates=list(proto_backend.supported_gates),
-            topology=topology,
+            supported_gates=tuple(proto_backend.supported_gates),
+            topology=_decode_json_field(proto_backend.topology_json),
         )
 
     def _handle_grpc_error(self, error: grpc.RpcError):
         """Convert gRPC errors to Arvak exceptions."""
-        code = error.code()
-        details = error.details()
-
-        if code == grpc.StatusCode.NOT_FOUND:
-            if "job" in details.lower():
-                raise ArvakJobNotFoundError(details)
-            elif "backend" in details.lower():
-                raise ArvakBackendNotFoundError(details)
-            else:
-                raise ArvakError(details)
-        elif code == grpc.StatusCode.INVALID_ARGUMENT:
-            raise ArvakInvalidCircuitError(details)
-        elif code == grpc.StatusCode.FAILED_PRECONDITION:
-            raise ArvakJobNotCompletedError(details)
-        else:
-            raise ArvakError(f"{code.name}: {details}")
+        raise _translate_grpc_error(error)
@@ -6,7 +6,8 @@ from dataclasses import dataclass
 from typing import List, Optional, Callable, Dict, Any
 from enum import Enum
 
-from .job_future import JobFuture
+from .job_future import JobFuture, as_completed, wait
+from .exceptions import ArvakInvalidCircuitError
 from .types import JobResult
 
 
@@ -122,7 +123,14 @@ class BatchJobManager:
         format: str = "qasm3",
         poll_interval: float = 1.0,
     ) -> List[JobFuture]:
-        """Submit multiple circuits concurrently.
+        """Submit multiple circuits in one batch.
+
+        All circuits go out in a single SubmitBatch RPC. The server checks
+        every circuit before it creates any job, so if the batch is rejected
+        as invalid nothing was submitted, and the circuits are submitted
+        concurrently one by one instead, skipping those that fail. Any other
+        error is raised: the server may already have created some of the
+        jobs, and resubmitting them would run them twice.
 
         Args:
             circuits: List of (circuit_code, shots) tuples
@@ -132,7 +140,21 @@ class BatchJobManager:
 
         Returns:
             List of JobFuture objects
+
+        Raises:
+            ArvakBackendNotFoundError: If the backend does not exist
+            ArvakError: If the batch fails for a reason other than an
+                invalid circuit
         """
+        if not circuits:
+            return []
+        try:
+            return self.client.submit_batch_future(
+                circuits, backend_id, format, poll_interval
+            )
+        except ArvakInvalidCircuitError:
+            pass  # Nothing was created; fall back to per-circuit submission
+
         futures = []
 
         def submit_one(circuit_code, shots):
@@ -234,7 +256,8 @@ class BatchJobManager:
             progress.running = sum(1 for f in pending if f.running())
 
             if pending:
-                time.sleep(0.1)
+                # Returns as soon as any pending future completes
+                wait(pending, timeout=0.1, return_when="FIRST_COMPLETED")
 
         # Determine final status
         if progress.failed == 0:
@@ -271,33 +294,11 @@ class BatchJobManager:
             Completed JobFuture objects
         """
         total = len(futures)
-        completed = 0
-        start_time = time.time()
-        pending = set(futures)
-
-        while pending:
-            # Find completed
-            newly_done = [f for f in pending if f.done()]
-
-            for future in newly_done:
-                pending.remove(future)
-                completed += 1
-
-                if progress_callback:
-                    progress_callback(completed, total)
-
-                yield future
-
-            if not pending:
-                break
-
-            # Check timeout
-            if timeout is not None:
-                elapsed = time.time() - start_time
-                if elapsed >= timeout:
-                    raise TimeoutError(f"Not all jobs completed within {timeout}s")
+        for completed, future in enumerate(as_completed(futures, timeout), 1):
+            if progress_callback:
+                progress_callback(completed, total)
 
-            time.sleep(0.1)
+            yield future
 
     def execute_batch(
         self,
@@ -1,11 +1,22 @@
 """Arvak gRPC client implementation."""
 
-import json
+import functools
+import itertools
+import logging
+import operator
+import re
+import threading
 import time
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, List, Optional, Tuple, Union
 
 import grpc
+from google.protobuf.internal import api_implementation
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 from . import arvak_pb2, arvak_pb2_grpc
 from .exceptions import (
@@ -15,8 +26,254 @@ from .exceptions import (
     ArvakJobNotCompletedError,
     ArvakJobNotFoundError,
 )
-from .types import BackendInfo, Job, JobResult, JobState
-from .job_future import JobFuture
+from .types import (
+    BackendInfo,
+    Job,
+    JobResult,
+    JobState,
+    PreparedCircuit,
+    _PACKED_COUNTS,
+    _CountsView,
+    _PackedCounts,
+)
+from .job_future import (
+    _POLL_INITIAL,
+    _POLL_MULTIPLIER,
+    JobFuture,
+    _JobWatcher,
+    _jittered,
+)
+
+logger = logging.getLogger(__name__)
+
+# Building, serializing and parsing messages is the client's hot path; the
+# pure-Python protobuf backend does it several times slower than upb, the
+# default since protobuf 4.21.
+if api_implementation.Type() == "python":
+    logger.warning(
+        "protobuf is using its pure-Python implementation; unset "
+        "PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION or upgrade protobuf for "
+        "the faster upb backend"
+    )
+
+# Per-thread request messages reused by the sync client's unary RPCs, see
+# _scratch_message().
+_scratch = threading.local()
+
+# Status codes that map straight onto an exception class. NOT_FOUND is
+# handled separately because it depends on the error details.
+_STATUS_MAP = {
+    grpc.StatusCode.INVALID_ARGUMENT: ArvakInvalidCircuitError,
+    grpc.StatusCode.FAILED_PRECONDITION: ArvakJobNotCompletedError,
+}
+
+
+def _translate_grpc_error(error: grpc.RpcError) -> ArvakError:
+    """Map a gRPC error onto the matching Arvak exception."""
+    return _translate_status(error.code(), error.details())
+
+
+def _translate_status(code: grpc.StatusCode, details: str) -> ArvakError:
+    """Map a gRPC status code and its details onto an Arvak exception."""
+    exc_class = _STATUS_MAP.get(code)
+    if exc_class is not None:
+        return exc_class(details)
+
+    if code == grpc.StatusCode.NOT_FOUND:
+        details_lower = details.lower()
+        if "job" in details_lower:
+            return ArvakJobNotFoundError(details)
+        elif "backend" in details_lower:
+            return ArvakBackendNotFoundError(details)
+        return ArvakError(details)
+
+    return ArvakError(f"{code.name}: {details}")
+
+# Channel arguments shared by the sync and async clients. The 4 MiB default
+# message limit is too small for large QASM/IR payloads and result sets;
+# keepalive pings keep long-lived idle channels (and WatchJob streams) from
+# being dropped by intermediaries.
+_CHANNEL_OPTIONS = (
+    ("grpc.max_send_message_length", 64 << 20),
+    ("grpc.max_receive_message_length", 64 << 20),
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.http2.min_time_between_pings_ms", 10000),
+    ("grpc.use_local_subchannel_pool", 1),
+)
+
+
+_SUBMIT_JOB_METHOD = "/arvak.v1.ArvakService/SubmitJob"
+
+# The server's parser takes the OPENQASM version statement as the first
+# token, after whitespace and comments (the lexer's skip rules). Each
+# alternative starts differently and comments must run to their end, so
+# the match is linear in the length of the preamble.
+_QASM_HEADER_PATTERN = (
+    r"\A(?:[ \t\r\n]|//[^\n]*(?:\n|\Z)|/\*[^*]*\*+(?:[^/*][^*]*\*+)*/)*"
+    r"OPENQASM(?![A-Za-z0-9_])"
+)
+_QASM_HEADER = re.compile(_QASM_HEADER_PATTERN)
+_QASM_HEADER_BYTES = re.compile(_QASM_HEADER_PATTERN.encode())
+
+
+def _check_qasm_header(qasm_code: Union[str, bytes]):
+    """Reject a circuit without an OPENQASM version statement up front.
+
+    Only the header is checked; everything after it is left to the server.
+    """
+    pattern = _QASM_HEADER_BYTES if isinstance(qasm_code, bytes) else _QASM_HEADER
+    if pattern.match(qasm_code) is None:
+        raise ArvakInvalidCircuitError(
+            "Invalid circuit: expected an OPENQASM version statement"
+        )
+
+
+@functools.lru_cache(maxsize=256)
+def _prepare_circuit(field: str, code: Union[str, bytes]) -> PreparedCircuit:
+    """Serialize a SubmitJobRequest carrying only the circuit.
+
+    Cached by circuit source, so a circuit submitted over and over, e.g.
+    across a parameter sweep, is only encoded once.
+    """
+    if field == "qasm3":
+        _check_qasm_header(code)
+    request = arvak_pb2.SubmitJobRequest()
+    setattr(request.circuit, field, code)
+    return PreparedCircuit(request.SerializeToString())
+
+
+def _encode_prepared_request(
+    prepared: PreparedCircuit, backend_id: str, shots: int
+) -> bytes:
+    """Encode a SubmitJobRequest for a prepared circuit.
+
+    Concatenated protobuf encodings parse as the merge of the messages, so
+    appending the scalar fields to the prepared circuit bytes yields a full
+    request without touching the circuit again.
+    """
+    tail = arvak_pb2.SubmitJobRequest()
+    tail.backend_id = backend_id
+    tail.shots = shots
+    return prepared.encoded + tail.SerializeToString()
+
+
+def _scratch_message(message_class):
+    """This thread's reusable instance of ``message_class``, cleared.
+
+    Saves allocating a request message per call. Safe for the sync stub,
+    which has serialized the request by the time the call returns, as long
+    as the message is not kept beyond the call.
+    """
+    messages = _scratch.__dict__
+    message = messages.get(message_class)
+    if message is None:
+        message = messages[message_class] = message_class()
+    else:
+        message.Clear()
+    return message
+
+
+# CircuitPayload field for each submit_batch format
+_CIRCUIT_FIELDS = {"qasm3": "qasm3", "json": "arvak_ir_json"}
+
+
+def _build_batch_request(
+    circuits: List[tuple[str, int]], backend_id: str, format: str
+) -> arvak_pb2.SubmitBatchRequest:
+    """Build a SubmitBatchRequest, writing jobs straight into the request."""
+    field = _CIRCUIT_FIELDS.get(format)
+    if field is None:
+        raise ValueError(f"Invalid format: {format}")
+
+    request = arvak_pb2.SubmitBatchRequest()
+    request.backend_id = backend_id
+    add_job = request.jobs.add
+    for circuit_code, shots in circuits:
+        job = add_job()
+        setattr(job.circuit, field, circuit_code)
+        job.shots = shots
+    return request
+
+
+def _single_submission(
+    qasm_code: Union[str, bytes], backend_id: str, shots: int
+) -> arvak_pb2.BatchJobSubmission:
+    """Build the one SubmitBatchStream message sent by submit_and_watch()."""
+    _check_qasm_header(qasm_code)
+    submission = arvak_pb2.BatchJobSubmission()
+    submission.circuit.qasm3 = qasm_code
+    submission.backend_id = backend_id
+    submission.shots = shots
+    return submission
+
+
+def _submission_error(message: str) -> ArvakError:
+    """Map a SubmitBatchStream ``error`` reply to an exception.
+
+    The server rejects a submission in-band with a message prefixed by the
+    stage that failed.
+    """
+    if message.startswith("Backend not found"):
+        return ArvakBackendNotFoundError(message)
+    if message.startswith(("Circuit", "Compilation")):
+        return ArvakInvalidCircuitError(message)
+    return ArvakError(message)
+
+
+def _result_counts(proto_result):
+    """The counts of a JobResult message, packed or as a map."""
+    if proto_result.HasField("histogram"):
+        return _PackedCounts(proto_result.histogram)
+    return _CountsView(proto_result.counts)
+
+
+def _decode_json_field(value: str) -> Optional[Any]:
+    """Decode a JSON-encoded proto string field.
+
+    Returns None for fields that are empty or ``{}``, without decoding.
+
+    Raises:
+        ArvakError: If the field holds malformed JSON
+    """
+    if not value or value == "{}":
+        return None
+    try:
+        return _json_loads(value)
+    except ValueError as e:  # json.JSONDecodeError and orjson.JSONDecodeError
+        raise ArvakError(f"Malformed JSON from server: {e}") from e
+
+
+# Reads every Job field in one C-level call, in Job's field order
+_job_fields = operator.attrgetter(
+    "job_id",
+    "state",
+    "submitted_at",
+    "backend_id",
+    "shots",
+    "started_at",
+    "completed_at",
+    "error_message",
+)
+
+
+def _job_from_proto(proto_job) -> Job:
+    """Convert a protobuf Job to a Job dataclass."""
+    job_id, state, submitted, backend_id, shots, started, completed, error = (
+        _job_fields(proto_job)
+    )
+    # Unset timestamps and messages arrive as 0 / ""
+    return Job(
+        job_id,
+        JobState(state),
+        submitted,
+        backend_id,
+        shots,
+        started or None,
+        completed or None,
+        error or None,
+    )
 
 
 class ArvakClient:
@@ -25,9 +282,15 @@ class ArvakClient:
     This client provides methods for submitting quantum circuits for execution,
     checking job status, retrieving results, and managing backends.
 
+    RPCs are spread round-robin over ``pool_size`` channels, each with its
+    own TCP connection. A single HTTP/2 connection caps the number of
+    concurrent streams (commonly at 100), so many threads submitting and
+    watching jobs at once benefit from a larger pool.
+
     Args:
         address: The gRPC server address (default: "localhost:50051")
         timeout: Default timeout for RPC calls in seconds (default: 30.0)
+        pool_size: Number of channels RPCs are spread across (default: 1)
 
     Example:
         >>> client = ArvakClient("localhost:50051")
@@ -42,17 +305,66 @@ class ArvakClient:
         >>> print(result.counts)
     """
 
-    def __init__(self, address: str = "localhost:50051", timeout: float = 30.0):
+    def __init__(
+        self,
+        address: str = "localhost:50051",
+        timeout: float = 30.0,
+        pool_size: int = 1,
+    ):
         """Initialize the Arvak client."""
         self.address = address
         self.timeout = timeout
+        self.pool_size = pool_size
         # TODO: Add optional TLS support via grpc.secure_channel for production deployments
-        self.channel = grpc.insecure_channel(address)
-        self.stub = arvak_pb2_grpc.ArvakServiceStub(self.channel)
+        # A distinct channel arg keeps gRPC from collapsing the channels
+        # onto one shared subchannel (and thus one TCP connection).
+        self._channels = tuple(
+            grpc.insecure_channel(
+                address, options=_CHANNEL_OPTIONS + (("grpc.channel_number", i),)
+            )
+            for i in range(pool_size)
+        )
+        self._stubs = tuple(
+            arvak_pb2_grpc.ArvakServiceStub(channel) for channel in self._channels
+        )
+        # SubmitJob taking pre-encoded request bytes, for submit_prepared()
+        self._submit_job_encoded = tuple(
+            channel.unary_unary(
+                _SUBMIT_JOB_METHOD,
+                response_deserializer=arvak_pb2.SubmitJobResponse.FromString,
+            )
+            for channel in self._channels
+        )
+        # next() on a count is atomic under the GIL, so no lock is needed
+        self._rr = itertools.count()
+        self.channel = self._channels[0]
+        self.stub = self._stubs[0]
+        # Cleared the first time the server answers WatchJob with UNIMPLEMENTED
+        self._watch_supported = True
+        # Likewise for GetJobStatusBatch and SubmitBatchStream
+        self._status_batch_supported = True
+        self._submit_stream_supported = True
+        # Follows the jobs of this client's JobFutures, started on first use
+        self._watcher: Optional[_JobWatcher] = None
+        self._watcher_lock = threading.Lock()
 
     def close(self):
-        """Close the gRPC channel."""
-        self.channel.close()
+        """Close the gRPC channels and stop following JobFutures."""
+        if self._watcher is not None:
+            self._watcher.close()
+        for channel in self._channels:
+            channel.close()
+
+    def _stub(self) -> arvak_pb2_grpc.ArvakServiceStub:
+        """Get the stub of the next channel in round-robin order."""
+        return self._stubs[next(self._rr) % self.pool_size]
+
+    def _job_watcher(self) -> _JobWatcher:
+        """Get the watcher that settles this client's JobFutures."""
+        with self._watcher_lock:
+            if self._watcher is None:
+                self._watcher = _JobWatcher(self.address, self.timeout)
+            return self._watcher
 
     def __enter__(self):
         """Context manager entry."""
@@ -63,12 +375,12 @@ class ArvakClient:
         self.close()
 
     def submit_qasm(
-        self, qasm_code: str, backend_id: str, shots: int = 1024
+        self, qasm_code: Union[str, bytes], backend_id: str, shots: int = 1024
     ) -> str:
         """Submit an OpenQASM 3 circuit for execution.
 
         Args:
-            qasm_code: OpenQASM 3 source code
+            qasm_code: OpenQASM 3 source code, as text or UTF-8 bytes
             backend_id: ID of the backend to execute on
             shots: Number of shots to execute (default: 1024)
 
@@ -80,16 +392,7 @@ class ArvakClient:
             ArvakBackendNotFoundError: If the backend does not exist
             ArvakError: For other errors
         """
-        try:
-            request = arvak_pb2.SubmitJobRequest(
-                circuit=arvak_pb2.CircuitPayload(qasm3=qasm_code),
-                backend_id=backend_id,
-                shots=shots,
-            )
-            response = self.stub.SubmitJob(request, timeout=self.timeout)
-            return response.job_id
-        except grpc.RpcError as e:
-            self._handle_grpc_error(e)
+        return self.submit_prepared(self.prepare_qasm(qasm_code), backend_id, shots)
 
     def submit_circuit_json(
         self, circuit_json: str, backend_id: str, shots: int = 1024
@@ -110,12 +413,74 @@ class ArvakClient:
             ArvakError: For other errors
         """
         try:
-            request = arvak_pb2.SubmitJobRequest(
-                circuit=arvak_pb2.CircuitPayload(arvak_ir_json=circuit_json),
-                backend_id=backend_id,
-                shots=shots,
+            request = _scratch_message(arvak_pb2.SubmitJobRequest)
+            request.circuit.arvak_ir_json = circuit_json
+            request.backend_id = backend_id
+            request.shots = shots
+            response = self._stub().SubmitJob(request, timeout=self.timeout)
+            return response.job_id
+        except grpc.RpcError as e:
+            self._handle_grpc_error(e)
+
+    def prepare_qasm(self, qasm_code: Union[str, bytes]) -> PreparedCircuit:
+        """Encode an OpenQASM 3 circuit once for repeated submission.
+
+        Useful when the same circuit is submitted many times, e.g. in a
+        sweep over shot counts, or by many concurrent submitters. Recently
+        prepared circuits are cached, so preparing the same source again
+        returns the same PreparedCircuit.
+
+        Args:
+            qasm_code: OpenQASM 3 source code, as text or UTF-8 bytes
+
+        Returns:
+            PreparedCircuit to pass to :meth:`submit_prepared`
+        """
+        return _prepare_circuit("qasm3", qasm_code)
+
+    def prepare_circuit_json(self, circuit_json: str) -> PreparedCircuit:
+        """Encode an Arvak IR JSON circuit once for repeated submission.
+
+        Args:
+            circuit_json: Arvak IR JSON representation
+
+        Returns:
+            PreparedCircuit to pass to :meth:`submit_prepared`
+        """
+        return _prepare_circuit("arvak_ir_json", circuit_json)
+
+    def submit_prepared(
+        self, prepared: PreparedCircuit, backend_id: str, shots: int = 1024
+    ) -> str:
+        """Submit a circuit encoded by :meth:`prepare_qasm`.
+
+        Args:
+            prepared: Circuit from :meth:`prepare_qasm` or
+                :meth:`prepare_circuit_json`
+            backend_id: ID of the backend to execute on
+            shots: Number of shots to execute (default: 1024)
+
+        Returns:
+            Job ID string
+
+        Raises:
+            ArvakInvalidCircuitError: If the circuit is invalid
+            ArvakBackendNotFoundError: If the backend does not exist
+            ArvakError: For other errors
+
+        Example:
+            >>> prepared = client.prepare_qasm(qasm)
+            >>> job_ids = [
+            ...     client.submit_prepared(prepared, "simulator", shots=n)
+            ...     for n in (100, 1000, 10000)
+            ... ]
+        """
+        try:
+            submit_job_encoded = self._submit_job_encoded[next(self._rr) % self.pool_size]
+            response = submit_job_encoded(
+                _encode_prepared_request(prepared, backend_id, shots),
+                timeout=self.timeout,
             )
-            response = self.stub.SubmitJob(request, timeout=self.timeout)
             return response.job_id
         except grpc.RpcError as e:
             self._handle_grpc_error(e)
@@ -125,7 +490,7 @@ class ArvakClient:
         circuits: List[tuple[str, int]],
         backend_id: str,
         format: str = "qasm3",
-    ) -> List[str]:
+    ) -> Tuple[str, ...]:
         """Submit multiple circuits as a batch.
 
         Args:
@@ -134,28 +499,17 @@ class ArvakClient:
             format: Circuit format ("qasm3" or "json")
 
         Returns:
-            List of job ID strings
+            Tuple of job ID strings
 
         Raises:
             ArvakInvalidCircuitError: If any circuit is invalid
             ArvakBackendNotFoundError: If the backend does not exist
             ArvakError: For other errors
         """
+        request = _build_batch_request(circuits, backend_id, format)
         try:
-            batch_jobs = []
-            for circuit_code, shots in circuits:
-                if format == "qasm3":
-                    payload = arvak_pb2.CircuitPayload(qasm3=circuit_code)
-                elif format == "json":
-                    payload = arvak_pb2.CircuitPayload(arvak_ir_json=circuit_code)
-                else:
-                    raise ValueError(f"Invalid format: {format}")
-
-                batch_jobs.append(arvak_pb2.BatchJobRequest(circuit=payload, shots=shots))
-
-            request = arvak_pb2.SubmitBatchRequest(backend_id=backend_id, jobs=batch_jobs)
-            response = self.stub.SubmitBatch(request, timeout=self.timeout)
-            return list(response.job_ids)
+            response = self._stub().SubmitBatch(request, timeout=self.timeout)
+            return tuple(response.job_ids)
         except grpc.RpcError as e:
             self._handle_grpc_error(e)
 
@@ -221,12 +575,47 @@ class ArvakClient:
             ArvakError: For other errors
         """
         try:
-            request = arvak_pb2.GetJobStatusRequest(job_id=job_id)
-            response = self.stub.GetJobStatus(request, timeout=self.timeout)
+            request = _scratch_message(arvak_pb2.GetJobStatusRequest)
+            request.job_id = job_id
+            response = self._stub().GetJobStatus(request, timeout=self.timeout)
             return self._proto_to_job(response.job)
         except grpc.RpcError as e:
             self._handle_grpc_error(e)
 
+    def get_job_status_many(self, job_ids: List[str]) -> List[Job]:
+        """Get the status of several jobs in one call.
+
+        Uses the GetJobStatusBatch RPC; against servers that do not
+        implement it, the jobs are queried one at a time.
+
+        Args:
+            job_ids: Job IDs
+
+        Returns:
+            List of Job objects in the order of ``job_ids``; jobs that do
+            not exist are left out
+
+        Raises:
+            ArvakError: For errors
+        """
+        if self._status_batch_supported:
+            try:
+                request = arvak_pb2.GetJobStatusBatchRequest(job_ids=job_ids)
+                response = self._stub().GetJobStatusBatch(request, timeout=self.timeout)
+                return [self._proto_to_job(job) for job in response.jobs]
+            except grpc.RpcError as e:
+                if e.code() != grpc.StatusCode.UNIMPLEMENTED:
+                    self._handle_grpc_error(e)
+                self._status_batch_supported = False
+
+        jobs = []
+        for job_id in job_ids:
+            try:
+                jobs.append(self.get_job_status(job_id))
+            except ArvakJobNotFoundError:
+                pass
+        return jobs
+
     def get_job_result(self, job_id: str) -> JobResult:
         """Get the result of a completed job.
 
@@ -242,8 +631,10 @@ class ArvakClient:
             ArvakError: For other errors
         """
         try:
-            request = arvak_pb2.GetJobResultRequest(job_id=job_id)
-            response = self.stub.GetJobResult(request, timeout=self.timeout)
+            request = _scratch_message(arvak_pb2.GetJobResultRequest)
+            request.job_id = job_id
+            request.packed_counts = _PACKED_COUNTS
+            response = self._stub().GetJobResult(request, timeout=self.timeout)
             return self._proto_to_result(response.result)
         except grpc.RpcError as e:
             self._handle_grpc_error(e)
@@ -263,7 +654,7 @@ class ArvakClient:
         """
         try:
             request = arvak_pb2.CancelJobRequest(job_id=job_id)
-            response = self.stub.CancelJob(request, timeout=self.timeout)
+            response = self._stub().CancelJob(request, timeout=self.timeout)
             return (response.success, response.message)
         except grpc.RpcError as e:
             self._handle_grpc_error(e)
@@ -276,12 +667,17 @@ class ArvakClient:
     ) -> JobResult:
         """Wait for a job to complete and return its result.
 
-        This method polls the job status until it reaches a terminal state,
-        then retrieves and returns the result.
+        The job is followed over the WatchJob server stream, which delivers
+        each state change (and the result, once completed) as soon as the
+        server has it. Servers that do not implement WatchJob are detected
+        on first use and the client falls back to polling the job status,
+        backing off from a short first wait while the job's state is
+        unchanged, as :class:`JobFuture` does.
 
         Args:
             job_id: Job ID
-            poll_interval: Time to wait between polls in seconds (default: 1.0)
+            poll_interval: Longest wait between polls in seconds when polling
+                (default: 1.0)
             max_wait: Maximum time to wait in seconds, None for no limit (default: None)
 
         Returns:
@@ -292,7 +688,62 @@ class ArvakClient:
             ArvakJobNotFoundError: If the job does not exist
             ArvakError: If the job fails
         """
-        start_time = time.time()
+        start_time = time.monotonic()
+
+        if self._watch_supported:
+            result = self._wait_for_job_stream(job_id, max_wait)
+            if result is not None:
+                return result
+
+        if max_wait is not None:
+            max_wait = max(0.0, max_wait - (time.monotonic() - start_time))
+        return self._wait_for_job_poll(job_id, poll_interval, max_wait)
+
+    def _wait_for_job_stream(
+        self, job_id: str, max_wait: Optional[float]
+    ) -> Optional[JobResult]:
+        """Follow a job over WatchJob until it reaches a terminal state.
+
+        Returns None if the stream is unavailable or ends early, in which
+        case the caller continues by polling.
+        """
+        request = arvak_pb2.WatchJobRequest(
+            job_id=job_id, packed_counts=_PACKED_COUNTS
+        )
+        call = self._stub().WatchJob(request, timeout=max_wait)
+        try:
+            for update in call:
+                if update.state == JobState.COMPLETED:
+                    if update.HasField("result"):
+                        return self._proto_to_result(update.result)
+                    return self.get_job_result(job_id)
+                elif update.state == JobState.FAILED:
+                    raise ArvakError(f"Job failed: {update.error_message}")
+                elif update.state == JobState.CANCELED:
+                    raise ArvakError("Job was canceled")
+        except grpc.RpcError as e:
+            code = e.code()
+            if code == grpc.StatusCode.UNIMPLEMENTED:
+                self._watch_supported = False
+                return None
+            if code == grpc.StatusCode.DEADLINE_EXCEEDED and max_wait is not None:
+                raise TimeoutError(
+                    f"Job did not complete within {max_wait} seconds"
+                ) from None
+            if code == grpc.StatusCode.DEADLINE_EXCEEDED:
+                # Server-side watch limit reached; keep waiting by polling
+                return None
+            self._handle_grpc_error(e)
+        finally:
+            call.cancel()
+        return None
+
+    def _wait_for_job_poll(
+        self, job_id: str, poll_interval: float, max_wait: Optional[float]
+    ) -> JobResult:
+        """Poll the job status until it reaches a terminal state."""
+        start_time = time.monotonic()
+        state = None
 
         while True:
             job = self.get_job_status(job_id)
@@ -304,10 +755,80 @@ class ArvakClient:
             elif job.state == JobState.CANCELED:
                 raise ArvakError("Job was canceled")
 
-            if max_wait is not None and (time.time() - start_time) >= max_wait:
+            if max_wait is not None and (time.monotonic() - start_time) >= max_wait:
                 raise TimeoutError(f"Job did not complete within {max_wait} seconds")
 
-            time.sleep(poll_interval)
+            if job.state != state:
+                state = job.state
+                delay = min(_POLL_INITIAL, poll_interval)
+            else:
+                delay = min(delay * _POLL_MULTIPLIER, poll_interval)
+            time.sleep(_jittered(delay))
+
+    def submit_and_watch(
+        self,
+        qasm_code: Union[str, bytes],
+        backend_id: str,
+        shots: int = 1024,
+        max_wait: Optional[float] = None,
+    ) -> JobResult:
+        """Submit an OpenQASM 3 circuit and wait for its result.
+
+        Does what :meth:`submit_qasm` followed by :meth:`wait_for_job` does,
+        in one round trip: the circuit goes out on a SubmitBatchStream call,
+        whose server side follows the job it creates and replies on the same
+        stream once it completes. Servers that do not implement
+        SubmitBatchStream are detected on first use and the two separate
+        calls are made instead, as they are when the stream ends before a
+        result arrives (e.g. because the job failed).
+
+        Args:
+            qasm_code: OpenQASM 3 source code, as text or UTF-8 bytes
+            backend_id: ID of the backend to execute on
+            shots: Number of shots to execute (default: 1024)
+            max_wait: Maximum time to wait in seconds, None for no limit (default: None)
+
+        Returns:
+            JobResult object
+
+        Raises:
+            TimeoutError: If max_wait is exceeded
+            ArvakInvalidCircuitError: If the circuit is invalid
+            ArvakBackendNotFoundError: If the backend does not exist
+            ArvakError: If the job fails
+        """
+        start_time = time.monotonic()
+        job_id = None
+
+        if self._submit_stream_supported:
+            submission = _single_submission(qasm_code, backend_id, shots)
+            call = self._stub().SubmitBatchStream(iter((submission,)), timeout=max_wait)
+            try:
+                for reply in call:
+                    kind = reply.WhichOneof("result")
+                    if kind == "completed":
+                        return self._proto_to_result(reply.completed)
+                    if kind == "error":
+                        raise _submission_error(reply.error)
+                    job_id = reply.job_id
+            except grpc.RpcError as e:
+                code = e.code()
+                if code == grpc.StatusCode.UNIMPLEMENTED:
+                    self._submit_stream_supported = False
+                elif code == grpc.StatusCode.DEADLINE_EXCEEDED and max_wait is not None:
+                    raise TimeoutError(
+                        f"Job did not complete within {max_wait} seconds"
+                    ) from None
+                elif job_id is None:
+                    self._handle_grpc_error(e)
+            finally:
+                call.cancel()
+
+        if job_id is None:
+            job_id = self.submit_qasm(qasm_code, backend_id, shots)
+        if max_wait is not None:
+            max_wait = max(0.0, max_wait - (time.monotonic() - start_time))
+        return self.wait_for_job(job_id, max_wait=max_wait)
 
     def list_backends(self) -> List[BackendInfo]:
         """List all available backends.
@@ -320,7 +841,7 @@ class ArvakClient:
         """
         try:
             request = arvak_pb2.ListBackendsRequest()
-            response = self.stub.ListBackends(request, timeout=self.timeout)
+            response = self._stub().ListBackends(request, timeout=self.timeout)
             return [self._proto_to_backend_info(b) for b in response.backends]
         except grpc.RpcError as e:
             self._handle_grpc_error(e)
@@ -340,62 +861,27 @@ class ArvakClient:
         """
         try:
             request = arvak_pb2.GetBackendInfoRequest(backend_id=backend_id)
-            response = self.stub.GetBackendInfo(request, timeout=self.timeout)
+            response = self._stub().GetBackendInfo(request, timeout=self.timeout)
             return self._proto_to_backend_info(response.backend)
         except grpc.RpcError as e:
             self._handle_grpc_error(e)
 
     def _proto_to_job(self, proto_job) -> Job:
         """Convert protobuf Job to Job dataclass."""
-        submitted_at = datetime.fromtimestamp(proto_job.submitted_at)
-        started_at = (
-            datetime.fromtimestamp(proto_job.started_at)
-            if proto_job.started_at > 0
-            else None
-        )
-        completed_at = (
-            datetime.fromtimestamp(proto_job.completed_at)
-            if proto_job.completed_at > 0
-            else None
-        )
-
-        return Job(
-            job_id=proto_job.job_id,
-            state=JobState(proto_job.state),
-            submitted_at=submitted_at,
-            backend_id=proto_job.backend_id,
-            shots=proto_job.shots,
-            started_at=started_at,
-            completed_at=completed_at,
-            error_message=proto_job.error_message if proto_job.error_message else None,
-        )
+        return _job_from_proto(proto_job)
 
     def _proto_to_result(self, proto_result) -> JobResult:
         """Convert protobuf JobResult to JobResult dataclass."""
-        metadata = None
-        if proto_result.metadata_json and proto_result.metadata_json != "{}":
-            try:
-                metadata = json.loads(proto_result.metadata_json)
-            except json.JSONDecodeError:
-                pass
-
         return JobResult(
             job_id=proto_result.job_id,
-            counts=dict(proto_result.counts),
+            counts=_result_counts(proto_result),
             shots=proto_result.shots,
             execution_time_ms=proto_result.execution_time_ms if proto_result.execution_time_ms > 0 else None,
-            metadata=metadata,
+            metadata=_decode_json_field(proto_result.metadata_json),
         )
 
     def _proto_to_backend_info(self, proto_backend) -> BackendInfo:
         """Convert protobuf BackendInfo to BackendInfo dataclass."""
-        topology = None
-        if proto_backend.topology_json and proto_backend.topology_json != "{}":
-            try:
-                topology = json.loads(proto_backend.topology_json)
-            except json.JSONDecodeError:
-                pass
-
         return BackendInfo(
             backend_id=proto_backend.backend_id,
             name=proto_backend.name,
@@ -403,8 +889,8 @@ class ArvakClient:
             max_qubits=proto_backend.max_qubits,
             max_shots=proto_backend.max_shots,
             description=proto_backend.description,
-            supported_gates=list(proto_backend.supported_gates),
-            topology=topology,
+            supported_gates=tuple(proto_backend.supported_gates),
+            topology=_decode_json_field(proto_backend.topology_json),
         )
 
     def watch_job(self, job_id: str):
@@ -432,7 +918,7 @@ class ArvakClient:
         """
         try:
             request = arvak_pb2.WatchJobRequest(job_id=job_id)
-            for update in self.stub.WatchJob(request, timeout=self.timeout):
+            for update in self._stub().WatchJob(request, timeout=self.timeout):
                 timestamp = datetime.fromtimestamp(update.timestamp)
                 error_msg = update.error_message if update.error_message else None
                 yield JobState(update.state), timestamp, error_msg
@@ -469,7 +955,7 @@ class ArvakClient:
             request = arvak_pb2.StreamResultsRequest(
                 job_id=job_id, chunk_size=chunk_size
             )
-            for chunk in self.stub.StreamResults(request, timeout=self.timeout):
+            for chunk in self._stub().StreamResults(request, timeout=self.timeout):
                 counts = dict(chunk.counts)
                 yield counts, chunk.is_final, chunk.chunk_index, chunk.total_chunks
         except grpc.RpcError as e:
@@ -510,22 +996,21 @@ class ArvakClient:
         def request_generator():
             """Convert circuit generator to protobuf requests."""
             for circuit_code, backend_id, shots, format, client_req_id in circuits_generator:
+                submission = arvak_pb2.BatchJobSubmission()
                 if format == "qasm3":
-                    payload = arvak_pb2.CircuitPayload(qasm3=circuit_code)
+                    submission.circuit.qasm3 = circuit_code
                 elif format == "json":
-                    payload = arvak_pb2.CircuitPayload(arvak_ir_json=circuit_code)
+                    submission.circuit.arvak_ir_json = circuit_code
                 else:
                     raise ValueError(f"Invalid format: {format}")
+                submission.backend_id = backend_id
+                submission.shots = shots
+                submission.client_request_id = client_req_id
 
-                yield arvak_pb2.BatchJobSubmission(
-                    circuit=payload,
-                    backend_id=backend_id,
-                    shots=shots,
-                    client_request_id=client_req_id,
-                )
+                yield submission
 
         try:
-            for result in self.stub.SubmitBatchStream(
+            for result in self._stub().SubmitBatchStream(
                 request_generator(), timeout=self.timeout
             ):
                 job_id = result.job_id
@@ -544,19 +1029,4 @@ class ArvakClient:
 
     def _handle_grpc_error(self, error: grpc.RpcError):
         """Convert gRPC errors to Arvak exceptions."""
-        code = error.code()
-        details = error.details()
-
-        if code == grpc.StatusCode.NOT_FOUND:
-            if "job" in details.lower():
-                raise ArvakJobNotFoundError(details)
-            elif "backend" in details.lower():
-                raise ArvakBackendNotFoundError(details)
-            else:
-                raise ArvakError(details)
-        elif code == grpc.StatusCode.INVALID_ARGUMENT:
-            raise ArvakInvalidCircuitError(details)
-        elif code == grpc.StatusCode.FAILED_PRECONDITION:
-            raise ArvakJobNotCompletedError(details)
-        else:
-            raise ArvakError(f"{code.name}: {details}")
+        raise _translate_grpc_error(error)
@@ -346,8 +346,7 @@ class Visualizer:
             )
 
         # Get top N states by count
-        sorted_counts = sorted(result.counts.items(), key=lambda x: x[1], reverse=True)
-        top_states = sorted_counts[:max_states]
+        top_states = result.top_k(max_states)
 
         bitstrings = [bs for bs, _ in top_states]
         counts = [c for _, c in top_states]
@@ -68,8 +68,7 @@ def example_result_aggregation():
     # Top-k states
     print("\nTop 2 states:")
     top2 = ResultAggregator.top_k_states(averaged, k=2)
-    for bitstring, count in sorted(top2.counts.items(),
-                                   key=lambda x: x[1], reverse=True):
+    for bitstring, count in top2.top_k(2):
         prob = count / top2.shots
         print(f"  {bitstring}: {count} ({prob:.4f})")
 
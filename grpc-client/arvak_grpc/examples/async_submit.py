@@ -33,91 +33,90 @@ h q[1];
 async def submit_and_wait(client, qasm, name, shots=1000):
     """Submit a circuit and wait for results."""
     print(f"\n[{name}] Submitting...")
-    job_id = await client.submit_qasm(qasm, "simulator", shots=shots)
-    print(f"[{name}] Job ID: {job_id}")
-
-    # Wait with progress callback
-    def progress(job):
-        print(f"[{name}] Status: {job.state.name}")
-
-    result = await client.wait_for_job(
-        job_id, poll_interval=0.5, progress_callback=progress
-    )
+    # Submission and watching share one stream: a single round trip
+    result = await client.submit_and_watch(qasm, "simulator", shots=shots)
+    print(f"[{name}] Job ID: {result.job_id}")
 
     print(f"[{name}] Results:")
-    for bitstring, count in sorted(result.counts.items(), key=lambda x: -x[1])[:3]:
+    for bitstring, count in result.top_k(3):
         prob = count / result.shots
         print(f"  {bitstring}: {count} ({prob:.3f})")
 
     return result
 
 
-async def main():
+async def main(client):
     """Run async example with concurrent jobs."""
-    # Create async client with connection pooling
-    async with AsyncArvakClient("localhost:50051", pool_size=5) as client:
-        # List backends
-        print("Available backends:")
-        backends = await client.list_backends()
-        for backend in backends:
-            print(f"  - {backend.backend_id}: {backend.name}")
-
-        # Submit multiple jobs concurrently
-        print("\n" + "=" * 60)
-        print("Submitting 3 jobs concurrently...")
-        print("=" * 60)
-
-        # Create tasks for concurrent execution
-        tasks = [
-            submit_and_wait(client, BELL_STATE_QASM, "Bell State", shots=1000),
-            submit_and_wait(client, GHZ_STATE_QASM, "GHZ State", shots=1000),
-            submit_and_wait(client, SUPERPOSITION_QASM, "Superposition", shots=1000),
-        ]
-
-        # Wait for all jobs to complete
-        results = await asyncio.gather(*tasks)
-
-        print("\n" + "=" * 60)
-        print(f"All {len(results)} jobs completed successfully!")
-        print("=" * 60)
-
-        # Summary
-        for i, result in enumerate(results, 1):
-            most_freq = result.most_frequent()
-            if most_freq:
-                print(f"Job {i}: Most frequent = {most_freq[0]} ({most_freq[1]:.3f})")
-
-
-async def benchmark_concurrent_submissions():
+    # List backends
+    print("Available backends:")
+    backends = await client.list_backends()
+    for backend in backends:
+        print(f"  - {backend.backend_id}: {backend.name}")
+
+    # Submit multiple jobs concurrently
+    print("\n" + "=" * 60)
+    print("Submitting 3 jobs concurrently...")
+    print("=" * 60)
+
+    # Create tasks for concurrent execution
+    tasks = [
+        submit_and_wait(client, BELL_STATE_QASM, "Bell State", shots=1000),
+        submit_and_wait(client, GHZ_STATE_QASM, "GHZ State", shots=1000),
+        submit_and_wait(client, SUPERPOSITION_QASM, "Superposition", shots=1000),
+    ]
+
+    # Wait for all jobs to complete
+    results = await asyncio.gather(*tasks)
+
+    print("\n" + "=" * 60)
+    print(f"All {len(results)} jobs completed successfully!")
+    print("=" * 60)
+
+    # Summary
+    for i, result in enumerate(results, 1):
+        most_freq = result.most_frequent()
+        if most_freq:
+            print(f"Job {i}: Most frequent = {most_freq[0]} ({most_freq[1]:.3f})")
+
+
+async def benchmark_concurrent_submissions(client):
     """Benchmark concurrent job submissions."""
     import time
 
-    circuits = [(BELL_STATE_QASM, 100) for _ in range(20)]
+    # Encode the circuit once; each submission only appends its shots
+    prepared = client.prepare_qasm(BELL_STATE_QASM)
 
-    async with AsyncArvakClient("localhost:50051") as client:
-        print("\nBenchmark: Submitting 20 jobs concurrently...")
-        start = time.time()
+    print("\nBenchmark: Submitting 20 jobs concurrently...")
+    start = time.time()
 
-        # Submit all jobs concurrently
-        job_ids = await client.submit_batch(circuits, "simulator")
+    # Submit all jobs concurrently
+    job_ids = await asyncio.gather(*(
+        client.submit_prepared(prepared, "simulator", shots=100)
+        for _ in range(20)
+    ))
 
-        elapsed = time.time() - start
-        print(f"Submitted {len(job_ids)} jobs in {elapsed:.3f}s")
-        print(f"Rate: {len(job_ids)/elapsed:.1f} jobs/second")
+    elapsed = time.time() - start
+    print(f"Submitted {len(job_ids)} jobs in {elapsed:.3f}s")
+    print(f"Rate: {len(job_ids)/elapsed:.1f} jobs/second")
 
-        # Wait for all to complete
-        print("\nWaiting for completion...")
-        tasks = [client.wait_for_job(job_id) for job_id in job_ids]
-        results = await asyncio.gather(*tasks)
+    # Wait for all to complete
+    print("\nWaiting for completion...")
+    tasks = [client.wait_for_job(job_id) for job_id in job_ids]
+    results = await asyncio.gather(*tasks)
 
-        total_elapsed = time.time() - start
-        print(f"All jobs completed in {total_elapsed:.3f}s")
-        print(f"Throughput: {len(results)/total_elapsed:.1f} jobs/second")
+    total_elapsed = time.time() - start
+    print(f"All jobs completed in {total_elapsed:.3f}s")
+    print(f"Throughput: {len(results)/total_elapsed:.1f} jobs/second")
 
 
-if __name__ == "__main__":
-    # Run main example
-    asyncio.run(main())
+async def run_all():
+    """Run the example and the benchmark on one event loop and client."""
+    # One client for both workloads: its pooled channels (and their HTTP/2
+    # connections) are set up once instead of once per asyncio.run()
+    async with AsyncArvakClient("localhost:50051", pool_size=8) as client:
+        await main(client)
+        await benchmark_concurrent_submissions(client)
 
-    # Run benchmark
-    asyncio.run(benchmark_concurrent_submissions())
+
+if __name__ == "__main__":
+    asyncio.run(run_all())
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """Example: Submit multiple jobs in a batch."""
 
-from arvak_grpc import ArvakClient
+from arvak_grpc import ArvakClient, as_completed
 
 # Different circuits to test
 CIRCUITS = [
@@ -34,22 +34,24 @@ def main():
     client = ArvakClient("localhost:50051")
 
     try:
-        # Submit batch
+        # Submit batch; each job is followed by a future
         print("Submitting batch of 3 circuits...")
-        job_ids = client.submit_batch(
+        futures = client.submit_batch_future(
             [(circuit, 1000) for circuit in CIRCUITS],
             backend_id="simulator",
             format="qasm3",
         )
-        print(f"Submitted {len(job_ids)} jobs")
+        print(f"Submitted {len(futures)} jobs")
+        index = {future: i for i, future in enumerate(futures, 1)}
 
-        # Wait for all jobs
-        for i, job_id in enumerate(job_ids, 1):
-            print(f"\nWaiting for job {i}/{len(job_ids)}: {job_id}")
-            result = client.wait_for_job(job_id, max_wait=30)
+        # Handle results in completion order: every job is already running,
+        # so printing one result overlaps with the others finishing
+        for future in as_completed(futures, timeout=30):
+            result = future.result()
+            i = index[future]
 
-            print(f"Results for job {i}:")
-            for bitstring, count in sorted(result.counts.items(), key=lambda x: -x[1])[:5]:
+            print(f"\nResults for job {i} ({future.job_id}):")
+            for bitstring, count in result.top_k(5):
                 prob = count / result.shots
                 print(f"  {bitstring}: {count} ({prob:.3f})")
 
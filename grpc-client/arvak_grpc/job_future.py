@@ -1,12 +1,47 @@
 """JobFuture implementation for non-blocking job result retrieval."""
 
+import asyncio
+import random
 import threading
 import time
-from concurrent.futures import Future as ConcurrentFuture
-from typing import Optional, Callable, Any, List
+from concurrent.futures import Future as ConcurrentFuture, ThreadPoolExecutor
+from typing import Optional, Callable, Any, Dict, List
 
-from .types import Job, JobResult, JobState
-from .exceptions import ArvakError
+import grpc
+
+from . import arvak_pb2
+from .types import _PACKED_COUNTS, Job, JobResult, JobState
+from .exceptions import ArvakError, ArvakJobNotFoundError
+
+# Default polling backoff, after Google's PollSettings: the first check
+# after a change comes quickly, then checks thin out while nothing happens.
+_POLL_INITIAL = 0.05
+_POLL_MULTIPLIER = 1.5
+
+# Poll errors that point at a dead connection rather than at the request
+# (server restarts, load balancers dropping idle connections): the poller
+# reconnects and retries, at most _MAX_RECONNECTS times in a row.
+_RECONNECT_CODES = frozenset({
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.INTERNAL,
+    grpc.StatusCode.CANCELLED,
+})
+_MAX_RECONNECTS = 5
+
+
+# Notified whenever any JobFuture completes; as_completed() and wait()
+# sleep on it instead of polling their futures.
+_any_done = threading.Condition()
+
+
+# Runs done callbacks, so slow user code never holds up the watcher thread
+# that settles futures (or the waiters it wakes).
+_callback_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="arvak-callback")
+
+
+def _jittered(delay: float) -> float:
+    """Spread ``delay`` by +/-10% so futures started together drift apart."""
+    return delay * random.uniform(0.9, 1.1)
 
 
 class JobFuture:
@@ -21,17 +56,41 @@ class JobFuture:
         >>> result = future.result(timeout=30)  # Blocks until complete
     """
 
-    def __init__(self, client, job_id: str, poll_interval: float = 1.0):
+    __slots__ = (
+        "_client", "_job_id", "_poll_interval", "_initial_poll", "_multiplier",
+        "_result", "_exception", "_done", "_cancelled", "_callbacks",
+        "_lock", "_condition",
+    )
+
+    def __init__(
+        self,
+        client,
+        job_id: str,
+        poll_interval: float = 1.0,
+        initial_poll: float = _POLL_INITIAL,
+        multiplier: float = _POLL_MULTIPLIER,
+    ):
         """Initialize JobFuture.
 
+        The polling arguments only apply on servers without WatchJob. The
+        wait between status checks starts at ``initial_poll``, grows by
+        ``multiplier`` while the job's state is unchanged and is capped at
+        ``poll_interval``.
+
         Args:
             client: ArvakClient instance
             job_id: The job ID
-            poll_interval: Polling interval in seconds (default: 1.0)
+            poll_interval: Longest wait between status checks in seconds
+                (default: 1.0)
+            initial_poll: First wait between status checks in seconds
+                (default: 0.05)
+            multiplier: Growth of the wait per unchanged check (default: 1.5)
         """
         self._client = client
         self._job_id = job_id
         self._poll_interval = poll_interval
+        self._initial_poll = initial_poll
+        self._multiplier = multiplier
         self._result: Optional[JobResult] = None
         self._exception: Optional[Exception] = None
         self._done = False
@@ -40,9 +99,8 @@ class JobFuture:
         self._lock = threading.Lock()
         self._condition = threading.Condition(self._lock)
 
-        # Start background thread to poll for completion
-        self._thread = threading.Thread(target=self._poll_loop, daemon=True)
-        self._thread.start()
+        # The client's watcher follows the job and settles this future
+        client._job_watcher().watch(self)
 
     @property
     def job_id(self) -> str:
@@ -66,7 +124,7 @@ class JobFuture:
 
         try:
             job = self._client.get_job_status(self._job_id)
-            return job.state in [JobState.RUNNING, JobState.QUEUED]
+            return job.is_pending
         except Exception:
             return False
 
@@ -80,16 +138,15 @@ class JobFuture:
             if self._done:
                 return False
 
-            try:
-                success, _ = self._client.cancel_job(self._job_id)
-                if success:
-                    self._cancelled = True
-                    self._done = True
-                    self._condition.notify_all()
-                    self._run_callbacks()
-                return success
-            except Exception:
-                return False
+        try:
+            success, _ = self._client.cancel_job(self._job_id)
+        except Exception:
+            return False
+        if success:
+            # Settled outside our lock: _finish() also takes _any_done,
+            # which as_completed() holds while checking done()
+            self._set_cancelled()
+        return success
 
     def result(self, timeout: Optional[float] = None) -> JobResult:
         """Get the job result, blocking until available.
@@ -144,21 +201,23 @@ class JobFuture:
     def add_done_callback(self, fn: Callable[["JobFuture"], Any]):
         """Add a callback to be called when the job completes.
 
-        The callback will be called with the JobFuture as its only argument.
-        If the job is already done, the callback is called immediately.
+        The callback will be called with the JobFuture as its only argument,
+        on a shared callback thread once the job completes. If the job is
+        already done, the callback is called immediately in this thread.
 
         Args:
             fn: Callback function
         """
         with self._lock:
-            if self._done:
-                # Job already done, call immediately
-                try:
-                    fn(self)
-                except Exception:
-                    pass  # Ignore callback exceptions
-            else:
+            if not self._done:
                 self._callbacks.append(fn)
+                return
+
+        # Job already done, call immediately (outside the lock)
+        try:
+            fn(self)
+        except Exception:
+            pass  # Ignore callback exceptions
 
     def wait(self, timeout: Optional[float] = None) -> bool:
         """Wait for the job to complete.
@@ -194,64 +253,313 @@ class JobFuture:
         self.add_done_callback(done_callback)
         return future
 
-    def _poll_loop(self):
-        """Background polling loop to check job status."""
-        try:
-            while True:
-                with self._lock:
-                    if self._done:
-                        return
-
-                try:
-                    job = self._client.get_job_status(self._job_id)
+    def _set_result(self, result: JobResult):
+        self._finish(result=result)
 
-                    if job.state == JobState.COMPLETED:
-                        result = self._client.get_job_result(self._job_id)
-                        with self._lock:
-                            self._result = result
-                            self._done = True
-                            self._condition.notify_all()
-                        self._run_callbacks()
-                        return
+    def _set_exception(self, exception: Exception):
+        self._finish(exception=exception)
 
-                    elif job.state == JobState.FAILED:
-                        with self._lock:
-                            self._exception = ArvakError(f"Job failed: {job.error_message}")
-                            self._done = True
-                            self._condition.notify_all()
-                        self._run_callbacks()
-                        return
+    def _set_cancelled(self):
+        self._finish(cancelled=True)
 
-                    elif job.state == JobState.CANCELED:
-                        with self._lock:
-                            self._cancelled = True
-                            self._done = True
-                            self._condition.notify_all()
-                        self._run_callbacks()
-                        return
-
-                except Exception as e:
-                    # Temporary error, keep polling
-                    pass
+    def _finish(
+        self,
+        result: Optional[JobResult] = None,
+        exception: Optional[Exception] = None,
+        cancelled: bool = False,
+    ):
+        """Mark the future done, wake waiters and run callbacks once."""
+        with self._lock:
+            if self._done:
+                return
+            self._result = result
+            self._exception = exception
+            self._cancelled = cancelled
+            self._done = True
+            self._condition.notify_all()
+        with _any_done:
+            _any_done.notify_all()
+        self._run_callbacks()
 
-                time.sleep(self._poll_interval)
+    def _run_callbacks(self):
+        """Hand all registered callbacks to the callback pool.
 
-        except Exception as e:
-            with self._lock:
-                self._exception = e
-                self._done = True
-                self._condition.notify_all()
-            self._run_callbacks()
+        The list is taken under the lock and emptied, then run without it,
+        so user code never blocks other threads on it. The callbacks of one
+        future run in registration order, in one pool task.
+        """
+        with self._lock:
+            callbacks, self._callbacks = self._callbacks, []
+        if callbacks:
+            _callback_pool.submit(self._invoke_callbacks, callbacks)
 
-    def _run_callbacks(self):
-        """Run all registered callbacks."""
-        for callback in self._callbacks:
+    def _invoke_callbacks(self, callbacks: List[Callable[["JobFuture"], Any]]):
+        for callback in callbacks:
             try:
                 callback(self)
             except Exception:
                 pass  # Ignore callback exceptions
 
 
+class _JobWatcher:
+    """Follows the jobs behind one client's JobFutures from a single thread.
+
+    Sync gRPC streams are blocking iterators that each tie up a reader
+    thread, so the watcher runs an asyncio event loop on one daemon thread
+    and follows every job over its own WatchJob stream through an
+    ``AsyncArvakClient``. The stream's final message carries the result, so
+    a completed job costs no further RPCs.
+
+    Jobs on servers without WatchJob go to a single poller task. Each job
+    keeps its own jittered backoff (see :class:`JobFuture`), and on every
+    tick the poller checks all jobs that are due with one
+    GetJobStatusBatch call. If that call fails because the connection went
+    bad, the poller reopens the channel it failed on and retries, leaving
+    the streams on other channels alone; any other failure fails the
+    futures of the jobs it was checking.
+
+    Args:
+        address: The gRPC server address
+        timeout: Timeout for the unary RPCs used while polling
+    """
+
+    def __init__(self, address: str, timeout: float):
+        self._address = address
+        self._timeout = timeout
+        self._client = None  # Created on the watcher loop, see _async_client()
+        # Futures handed to watch() and not yet settled or left to the poller
+        self._followed: set = set()
+        # Jobs left to the poller, by job ID
+        self._polled: Dict[str, _PolledJob] = {}
+        self._poller: Optional[asyncio.Task] = None
+        # Created by _poll(), on the watcher loop: before Python 3.10 an
+        # Event binds to the loop current where it is made
+        self._poll_wakeup: Optional[asyncio.Event] = None
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="arvak-job-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def watch(self, future: JobFuture):
+        """Follow ``future``'s job until it settles the future."""
+        self._followed.add(future)
+        asyncio.run_coroutine_threadsafe(self._follow(future), self._loop)
+
+    def close(self):
+        """Stop following jobs, close the channels and stop the thread."""
+        if self._loop.is_closed():
+            return
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    async def _shutdown(self):
+        # Settle the futures first: cancelled follows would leave them pending
+        error = ArvakError("client closed")
+        _settle(list(self._followed), exception=error)
+        for entry in self._polled.values():
+            _settle(entry.futures, exception=error)
+        self._followed.clear()
+        self._polled.clear()
+
+        current = asyncio.current_task()
+        tasks = [t for t in asyncio.all_tasks() if t is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._client is not None:
+            await self._client.close()
+            await self._client._pool.close()
+
+    def _async_client(self):
+        if self._client is None:
+            # Imported here: async_client imports client, which imports us
+            from .async_client import AsyncArvakClient
+
+            self._client = AsyncArvakClient(
+                self._address, timeout=self._timeout, flush_interval_ms=None
+            )
+        return self._client
+
+    async def _follow(self, future: JobFuture):
+        client = self._async_client()
+        try:
+            if client._watch_supported and await self._follow_stream(client, future):
+                return
+        except Exception as e:
+            future._set_exception(e)
+            return
+        finally:
+            self._followed.discard(future)
+        self._poll(future)
+
+    async def _follow_stream(self, client, future: JobFuture) -> bool:
+        """Follow the job over WatchJob.
+
+        Returns False if the stream is unavailable or ends early, in which
+        case the job is polled instead.
+        """
+        request = arvak_pb2.WatchJobRequest(
+            job_id=future._job_id, packed_counts=_PACKED_COUNTS
+        )
+        async with client._streams.stream() as stub:
+            call = stub.WatchJob(request)
+            try:
+                async for update in call:
+                    if update.state == JobState.COMPLETED:
+                        if update.HasField("result"):
+                            result = client._proto_to_result(update.result)
+                        else:
+                            result = await client.get_job_result(future._job_id)
+                        future._set_result(result)
+                        return True
+                    elif update.state == JobState.FAILED:
+                        future._set_exception(
+                            ArvakError(f"Job failed: {update.error_message}")
+                        )
+                        return True
+                    elif update.state == JobState.CANCELED:
+                        future._set_cancelled()
+                        return True
+            except grpc.RpcError as e:
+                if e.code() == grpc.StatusCode.UNIMPLEMENTED:
+                    client._watch_supported = False
+                # Otherwise treat it as temporary and keep going by polling
+            finally:
+                call.cancel()
+        return False
+
+    def _poll(self, future: JobFuture):
+        """Hand ``future``'s job to the shared poller."""
+        entry = self._polled.get(future._job_id)
+        if entry is None:
+            self._polled[future._job_id] = _PolledJob(future, self._loop.time())
+        else:
+            entry.futures.append(future)
+        if self._poll_wakeup is None:
+            self._poll_wakeup = asyncio.Event()
+        self._poll_wakeup.set()
+        if self._poller is None:
+            self._poller = asyncio.ensure_future(self._poll_jobs())
+
+    async def _poll_jobs(self):
+        """Poll the jobs handed to the poller until none are left."""
+        client = self._async_client()
+        polled = self._polled
+        wakeup = self._poll_wakeup
+        now = self._loop.time
+        reconnects = 0
+        try:
+            while polled:
+                next_due = min(entry.due for entry in polled.values())
+                wakeup.clear()
+                try:
+                    await asyncio.wait_for(wakeup.wait(), max(0.0, next_due - now()))
+                    continue  # A job was added, it may be due sooner
+                except asyncio.TimeoutError:
+                    pass
+
+                tick = now()
+                job_ids = [
+                    job_id for job_id, entry in polled.items() if entry.due <= tick
+                ]
+                try:
+                    jobs = await client.get_job_status_many(job_ids)
+                except ArvakError as e:
+                    if (
+                        _status_code(e) not in _RECONNECT_CODES
+                        or reconnects >= _MAX_RECONNECTS
+                    ):
+                        for job_id in job_ids:
+                            _settle(polled.pop(job_id).futures, exception=e)
+                        continue
+                    reconnects += 1
+                    client._reconnect()
+                    for job_id in job_ids:
+                        polled[job_id].reschedule(None, tick)
+                    continue
+                reconnects = 0
+
+                found = {job.job_id: job for job in jobs}
+                completed = []
+                for job_id in job_ids:
+                    job = found.get(job_id)
+                    if job is None:
+                        _settle(
+                            polled.pop(job_id).futures,
+                            exception=ArvakJobNotFoundError(f"Job not found: {job_id}"),
+                        )
+                    elif job.state == JobState.COMPLETED:
+                        completed.append(job_id)
+                    elif job.state == JobState.FAILED:
+                        _settle(
+                            polled.pop(job_id).futures,
+                            exception=ArvakError(f"Job failed: {job.error_message}"),
+                        )
+                    elif job.state == JobState.CANCELED:
+                        _settle(polled.pop(job_id).futures, cancelled=True)
+                    else:
+                        polled[job_id].reschedule(job.state, tick)
+
+                results = await asyncio.gather(
+                    *(client.get_job_result(job_id) for job_id in completed),
+                    return_exceptions=True,
+                )
+                for job_id, result in zip(completed, results):
+                    if isinstance(result, ArvakError):
+                        # Temporary error, fetch it on the next check
+                        polled[job_id].reschedule(JobState.COMPLETED, tick)
+                    elif isinstance(result, Exception):
+                        _settle(polled.pop(job_id).futures, exception=result)
+                    else:
+                        _settle(polled.pop(job_id).futures, result=result)
+        finally:
+            self._poller = None
+
+
+class _PolledJob:
+    """A job left to the poller, the futures waiting on it and its backoff.
+
+    The backoff settings come from the first future registered for the job.
+    """
+
+    __slots__ = (
+        "futures", "state", "delay", "due", "initial", "multiplier", "max_delay"
+    )
+
+    def __init__(self, future: JobFuture, now: float):
+        self.futures = [future]
+        self.state: Optional[JobState] = None
+        self.initial = future._initial_poll
+        self.multiplier = future._multiplier
+        self.max_delay = future._poll_interval
+        self.delay = self.initial
+        self.due = now + _jittered(self.delay)
+
+    def reschedule(self, state: Optional[JobState], now: float):
+        """Schedule the next check, backing off unless ``state`` changed."""
+        if state is not None and state != self.state:
+            self.state = state
+            self.delay = self.initial
+        else:
+            self.delay = min(self.delay * self.multiplier, self.max_delay)
+        self.due = now + _jittered(self.delay)
+
+
+def _status_code(error: ArvakError) -> Optional[grpc.StatusCode]:
+    """The gRPC status code behind ``error``, if it came from an RPC."""
+    cause = error.__cause__
+    return cause.code() if isinstance(cause, grpc.RpcError) else None
+
+
+def _settle(futures: List[JobFuture], **outcome):
+    """Settle every future waiting on one job with the same outcome."""
+    for future in futures:
+        future._finish(**outcome)
+
+
 class CancelledError(Exception):
     """Raised when a job was cancelled."""
     pass
@@ -270,29 +578,25 @@ def as_completed(futures: List[JobFuture], timeout: Optional[float] = None):
     Raises:
         TimeoutError: If timeout is exceeded
     """
-    start_time = time.time()
+    deadline = None if timeout is None else time.monotonic() + timeout
     pending = set(futures)
 
     while pending:
-        # Check for completed futures
-        completed = [f for f in pending if f.done()]
+        # Checked under the condition so no completion slips in unnoticed
+        # between the check and the wait
+        with _any_done:
+            completed = [f for f in pending if f.done()]
+            if not completed:
+                remaining = _remaining(deadline)
+                if remaining == 0.0:
+                    raise TimeoutError(f"Not all futures completed within {timeout} seconds")
+                _any_done.wait(remaining)
+                continue
 
         for future in completed:
             pending.remove(future)
             yield future
 
-        if not pending:
-            break
-
-        # Check timeout
-        if timeout is not None:
-            elapsed = time.time() - start_time
-            if elapsed >= timeout:
-                raise TimeoutError(f"Not all futures completed within {timeout} seconds")
-
-        # Wait a bit before checking again
-        time.sleep(0.1)
-
 
 def wait(futures: List[JobFuture], timeout: Optional[float] = None, return_when: str = "ALL_COMPLETED"):
     """Wait for futures to complete.
@@ -308,39 +612,39 @@ def wait(futures: List[JobFuture], timeout: Optional[float] = None, return_when:
     Raises:
         TimeoutError: If timeout is exceeded and return_when="ALL_COMPLETED"
     """
-    start_time = time.time()
+    deadline = None if timeout is None else time.monotonic() + timeout
     pending = set(futures)
     done = set()
 
     while pending:
-        # Check completed futures
-        newly_done = {f for f in pending if f.done()}
-
-        if newly_done:
-            done.update(newly_done)
-            pending -= newly_done
-
-            # Check return conditions
-            if return_when == "FIRST_COMPLETED" and done:
-                return done, pending
-
-            if return_when == "FIRST_EXCEPTION":
-                for future in newly_done:
-                    if future.exception(timeout=0) is not None:
-                        return done, pending
-
-        if not pending:
-            break
-
-        # Check timeout
-        if timeout is not None:
-            elapsed = time.time() - start_time
-            if elapsed >= timeout:
-                if return_when == "ALL_COMPLETED":
-                    raise TimeoutError(f"Not all futures completed within {timeout} seconds")
-                return done, pending
-
-        # Wait a bit
-        time.sleep(0.1)
+        with _any_done:
+            newly_done = {f for f in pending if f.done()}
+            if not newly_done:
+                remaining = _remaining(deadline)
+                if remaining == 0.0:
+                    if return_when == "ALL_COMPLETED":
+                        raise TimeoutError(f"Not all futures completed within {timeout} seconds")
+                    return done, pending
+                _any_done.wait(remaining)
+                continue
+
+        done.update(newly_done)
+        pending -= newly_done
+
+        # Check return conditions
+        if return_when == "FIRST_COMPLETED":
+            return done, pending
+
+        if return_when == "FIRST_EXCEPTION":
+            for future in newly_done:
+                if future.exception(timeout=0) is not None:
+                    return done, pending
 
     return done, pending
+
+
+def _remaining(deadline: Optional[float]) -> Optional[float]:
+    """Seconds left until ``deadline``: None without one, 0.0 once passed."""
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
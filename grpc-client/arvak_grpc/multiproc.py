@@ -0,0 +1,119 @@
+"""Multi-process submission frontend for the Arvak gRPC client.
+
+Building and serializing protobuf requests in Python holds the GIL, so a
+single process submitting many circuits is bound to one core no matter how
+many threads it uses. ``MultiProcessArvakClient`` shards submissions across
+a pool of worker processes, each owning its own ``ArvakClient`` and channel.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
+from typing import List, Optional, Tuple
+
+from .client import ArvakClient
+
+# Per-process client, created by the pool initializer in each worker.
+_worker_client: Optional[ArvakClient] = None
+
+
+def _init_worker(address: str, timeout: float):
+    """Open this worker's own client and channel."""
+    global _worker_client
+    _worker_client = ArvakClient(address, timeout=timeout)
+
+
+def _submit_shard(
+    circuits: List[tuple[str, int]], backend_id: str, format: str
+) -> Tuple[str, ...]:
+    """Submit one shard of circuits from a worker process."""
+    return _worker_client.submit_batch(circuits, backend_id, format=format)
+
+
+def _shard(items: list, n: int) -> List[list]:
+    """Split ``items`` into at most ``n`` contiguous, near-equal shards."""
+    size = -(-len(items) // n)
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+class MultiProcessArvakClient:
+    """Submit circuits from several processes in parallel.
+
+    Each worker process holds its own ``ArvakClient``, so request building
+    and serialization for different shards run on separate cores. Workers
+    are started with the ``spawn`` method: gRPC channels do not survive a
+    fork.
+
+    Args:
+        address: The gRPC server address (default: "localhost:50051")
+        n_workers: Number of worker processes (default: ``os.cpu_count()``)
+        timeout: Default timeout for RPC calls in seconds (default: 30.0)
+
+    Example:
+        >>> with MultiProcessArvakClient("localhost:50051", n_workers=4) as client:
+        ...     job_ids = client.submit_batch(
+        ...         [(qasm, 1000) for qasm in circuits], "simulator"
+        ...     )
+    """
+
+    def __init__(
+        self,
+        address: str = "localhost:50051",
+        n_workers: Optional[int] = None,
+        timeout: float = 30.0,
+    ):
+        """Initialize the worker pool."""
+        self.address = address
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.n_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(address, timeout),
+        )
+
+    def submit_batch(
+        self,
+        circuits: List[tuple[str, int]],
+        backend_id: str,
+        format: str = "qasm3",
+    ) -> Tuple[str, ...]:
+        """Submit circuits as one batch per worker.
+
+        Args:
+            circuits: List of (circuit_code, shots) tuples
+            backend_id: ID of the backend to execute on
+            format: Circuit format ("qasm3" or "json")
+
+        Returns:
+            Tuple of job ID strings, in the order of ``circuits``
+
+        Raises:
+            ArvakInvalidCircuitError: If any circuit is invalid
+            ArvakBackendNotFoundError: If the backend does not exist
+            ArvakError: For other errors
+        """
+        if not circuits:
+            return ()
+        shards = _shard(list(circuits), self.n_workers)
+        return tuple(
+            chain.from_iterable(
+                self._executor.map(
+                    _submit_shard, shards, repeat(backend_id), repeat(format)
+                )
+            )
+        )
+
+    def close(self):
+        """Shut down the worker processes."""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
@@ -177,12 +177,9 @@ class ResultAggregator:
         Returns:
             New JobResult with top k states
         """
-        sorted_items = sorted(result.counts.items(), key=lambda x: x[1], reverse=True)
-        top_counts = dict(sorted_items[:k])
-
         return JobResult(
             job_id=result.job_id,
-            counts=top_counts,
+            counts=dict(result.top_k(k)),
             shots=result.shots,
             execution_time_ms=result.execution_time_ms,
             metadata=result.metadata,
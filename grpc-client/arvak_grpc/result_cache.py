@@ -2,6 +2,7 @@
 
 import time
 import json
+import itertools
 import threading
 from pathlib import Path
 from typing import Optional, Dict, List, Union
@@ -11,6 +12,9 @@ import hashlib
 
 from .types import JobResult
 
+# Most misses a TwoLevelCache remembers; the oldest is dropped past this
+_NEGATIVE_CACHE_SIZE = 1024
+
 
 @dataclass
 class CacheEntry:
@@ -34,6 +38,10 @@ class MemoryCache:
     - TTL (time-to-live) support
     - Thread-safe operations
     - Access statistics
+
+    Lookups do not take the lock: on CPython single dict operations
+    (``get``, ``move_to_end``, ``pop``) are atomic under the GIL, so only
+    multi-step updates in ``put``/``evict_expired``/``clear`` are locked.
     """
 
     def __init__(self, max_size: int = 100, ttl: Optional[float] = None):
@@ -47,6 +55,16 @@ class MemoryCache:
         self.ttl = ttl
         self._lock = threading.Lock()
         self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._reset_counters()
+
+    def _reset_counters(self):
+        """Reset hit/miss statistics.
+
+        ``next()`` on an ``itertools.count`` is atomic, so the counters can
+        be bumped from the lock-free lookup path.
+        """
+        self._hit_counter = itertools.count(1)
+        self._miss_counter = itertools.count(1)
         self._hits = 0
         self._misses = 0
 
@@ -59,31 +77,36 @@ class MemoryCache:
         Returns:
             JobResult if found and not expired, None otherwise
         """
-        with self._lock:
-            if job_id not in self._cache:
-                self._misses += 1
-                return None
+        entry = self._cache.get(job_id)
+        if entry is None:
+            self._misses = next(self._miss_counter)
+            return None
 
-            entry = self._cache[job_id]
+        now = time.time()
 
-            # Check TTL
-            if self.ttl is not None:
-                age = time.time() - entry.timestamp
-                if age > self.ttl:
-                    # Expired, remove from cache
-                    del self._cache[job_id]
-                    self._misses += 1
-                    return None
+        # Check TTL
+        if self.ttl is not None and now - entry.timestamp > self.ttl:
+            # Expired, remove from cache unless it was replaced meanwhile.
+            # remove() takes no lock, so the entry may be gone by now.
+            with self._lock:
+                if self._cache.get(job_id) is entry:
+                    self._cache.pop(job_id, None)
+            self._misses = next(self._miss_counter)
+            return None
 
-            # Update access metadata
-            entry.access_count += 1
-            entry.last_access = time.time()
+        # Update access metadata
+        entry.access_count += 1
+        entry.last_access = now
 
-            # Move to end (most recently used)
+        # Move to end (most recently used); the entry may have been
+        # evicted by a concurrent put()
+        try:
             self._cache.move_to_end(job_id)
+        except KeyError:
+            pass
 
-            self._hits += 1
-            return entry.result
+        self._hits = next(self._hit_counter)
+        return entry.result
 
     def put(self, result: JobResult):
         """Put result in cache.
@@ -95,18 +118,26 @@ class MemoryCache:
 
         with self._lock:
             # If already exists, update and move to end
-            if job_id in self._cache:
-                entry = self._cache[job_id]
+            entry = self._cache.get(job_id)
+            if entry is not None:
                 entry.result = result
                 entry.timestamp = time.time()
                 entry.last_access = time.time()
-                self._cache.move_to_end(job_id)
+                try:
+                    self._cache.move_to_end(job_id)
+                except KeyError:
+                    # Removed concurrently by remove(); re-insert
+                    self._cache[job_id] = entry
                 return
 
             # Check size limit
             if len(self._cache) >= self.max_size:
-                # Remove least recently used (first item)
-                self._cache.popitem(last=False)
+                # Remove least recently used (first item); a lock-free
+                # remove() may have emptied the cache since the check
+                try:
+                    self._cache.popitem(last=False)
+                except KeyError:
+                    pass
 
             # Add new entry
             entry = CacheEntry(
@@ -125,23 +156,17 @@ class MemoryCache:
         Returns:
             True if removed, False if not found
         """
-        with self._lock:
-            if job_id in self._cache:
-                del self._cache[job_id]
-                return True
-            return False
+        return self._cache.pop(job_id, None) is not None
 
     def clear(self):
         """Clear all cached results."""
         with self._lock:
             self._cache.clear()
-            self._hits = 0
-            self._misses = 0
+            self._reset_counters()
 
     def size(self) -> int:
         """Get current cache size."""
-        with self._lock:
-            return len(self._cache)
+        return len(self._cache)
 
     def stats(self) -> dict:
         """Get cache statistics.
@@ -172,13 +197,14 @@ class MemoryCache:
 
         with self._lock:
             current_time = time.time()
+            # Snapshot first: lock-free get() may reorder entries meanwhile
             expired = [
-                job_id for job_id, entry in self._cache.items()
+                job_id for job_id, entry in list(self._cache.items())
                 if current_time - entry.timestamp > self.ttl
             ]
 
             for job_id in expired:
-                del self._cache[job_id]
+                self._cache.pop(job_id, None)
 
             return len(expired)
 
@@ -211,21 +237,51 @@ class DiskCache:
         # Create cache directory
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-        # Metadata file
+        # Metadata is kept column-wise (one dict per field) so scans such as
+        # disk_usage() and evict_expired() only touch the field they need.
         self.metadata_file = self.cache_dir / "_cache_metadata.json"
-        self._metadata: Dict[str, dict] = self._load_metadata()
+        self._meta_timestamps: Dict[str, float] = {}
+        self._meta_paths: Dict[str, str] = {}
+        self._meta_shots: Dict[str, int] = {}
+        self._meta_num_states: Dict[str, int] = {}
+        self._load_metadata()
 
-    def _load_metadata(self) -> dict:
+    def _load_metadata(self):
         """Load cache metadata from disk."""
-        if self.metadata_file.exists():
-            with open(self.metadata_file, 'r') as f:
-                return json.load(f)
-        return {}
+        if not self.metadata_file.exists():
+            return
+        with open(self.metadata_file, 'r') as f:
+            entries = json.load(f)
+        for job_id, metadata in entries.items():
+            self._meta_timestamps[job_id] = metadata['timestamp']
+            self._meta_paths[job_id] = metadata['path']
+            self._meta_shots[job_id] = metadata['shots']
+            self._meta_num_states[job_id] = metadata['num_states']
 
     def _save_metadata(self):
-        """Save cache metadata to disk."""
+        """Save cache metadata to disk.
+
+        The on-disk layout stays one record per job for compatibility with
+        existing cache directories.
+        """
+        entries = {
+            job_id: {
+                'timestamp': timestamp,
+                'path': self._meta_paths[job_id],
+                'shots': self._meta_shots[job_id],
+                'num_states': self._meta_num_states[job_id],
+            }
+            for job_id, timestamp in self._meta_timestamps.items()
+        }
         with open(self.metadata_file, 'w') as f:
-            json.dump(self._metadata, f, indent=2)
+            json.dump(entries, f, indent=2)
+
+    def _drop_metadata(self, job_id: str):
+        """Remove a job from every metadata column."""
+        del self._meta_timestamps[job_id]
+        del self._meta_paths[job_id]
+        del self._meta_shots[job_id]
+        del self._meta_num_states[job_id]
 
     def _get_cache_path(self, job_id: str) -> Path:
         """Get cache file path for job ID.
@@ -254,14 +310,13 @@ class DiskCache:
             JobResult if found and not expired, None otherwise
         """
         # Check metadata
-        if job_id not in self._metadata:
+        timestamp = self._meta_timestamps.get(job_id)
+        if timestamp is None:
             return None
 
-        metadata = self._metadata[job_id]
-
         # Check TTL
         if self.ttl is not None:
-            age = time.time() - metadata['timestamp']
+            age = time.time() - timestamp
             if age > self.ttl:
                 self.remove(job_id)
                 return None
@@ -270,7 +325,7 @@ class DiskCache:
         cache_path = self._get_cache_path(job_id)
         if not cache_path.exists():
             # File missing, clean up metadata
-            del self._metadata[job_id]
+            self._drop_metadata(job_id)
             self._save_metadata()
             return None
 
@@ -300,12 +355,10 @@ class DiskCache:
             self._save_parquet(result, cache_path)
 
         # Update metadata
-        self._metadata[job_id] = {
-            'timestamp': time.time(),
-            'path': str(cache_path),
-            'shots': result.shots,
-            'num_states': len(result.counts),
-        }
+        self._meta_timestamps[job_id] = time.time()
+        self._meta_paths[job_id] = str(cache_path)
+        self._meta_shots[job_id] = result.shots
+        self._meta_num_states[job_id] = len(result.counts)
         self._save_metadata()
 
     def remove(self, job_id: str) -> bool:
@@ -317,16 +370,16 @@ class DiskCache:
         Returns:
             True if removed, False if not found
         """
-        if job_id not in self._metadata:
+        if job_id not in self._meta_paths:
             return False
 
         # Remove file
-        cache_path = Path(self._metadata[job_id]['path'])
+        cache_path = Path(self._meta_paths[job_id])
         if cache_path.exists():
             cache_path.unlink()
 
         # Remove metadata
-        del self._metadata[job_id]
+        self._drop_metadata(job_id)
         self._save_metadata()
 
         return True
@@ -334,18 +387,18 @@ class DiskCache:
     def clear(self):
         """Clear entire cache."""
         # Remove all cache files
-        for job_id in list(self._metadata.keys()):
+        for job_id in list(self._meta_paths):
             self.remove(job_id)
 
     def size(self) -> int:
         """Get number of cached results."""
-        return len(self._metadata)
+        return len(self._meta_timestamps)
 
     def disk_usage(self) -> int:
         """Get total disk usage in bytes."""
         total = 0
-        for metadata in self._metadata.values():
-            path = Path(metadata['path'])
+        for path_str in self._meta_paths.values():
+            path = Path(path_str)
             if path.exists():
                 total += path.stat().st_size
         return total
@@ -361,8 +414,8 @@ class DiskCache:
 
         current_time = time.time()
         expired = [
-            job_id for job_id, metadata in self._metadata.items()
-            if current_time - metadata['timestamp'] > self.ttl
+            job_id for job_id, timestamp in self._meta_timestamps.items()
+            if current_time - timestamp > self.ttl
         ]
 
         for job_id in expired:
@@ -374,7 +427,7 @@ class DiskCache:
         """Save result as JSON."""
         data = {
             'job_id': result.job_id,
-            'counts': result.counts,
+            'counts': dict(result.counts),
             'shots': result.shots,
             'execution_time_ms': result.execution_time_ms,
             'metadata': result.metadata,
@@ -413,6 +466,7 @@ class TwoLevelCache:
         format: str = "json",
         memory_ttl: Optional[float] = None,
         disk_ttl: Optional[float] = None,
+        negative_ttl: Optional[float] = 1.0,
     ):
         """Initialize two-level cache.
 
@@ -422,9 +476,19 @@ class TwoLevelCache:
             format: Disk cache format ('json' or 'parquet')
             memory_ttl: L1 TTL in seconds
             disk_ttl: L2 TTL in seconds
+            negative_ttl: How long a miss is remembered, in seconds, so that
+                repeated lookups of an unknown job skip L1 and L2
+                (None disables negative caching). At most
+                1024 misses are remembered at once.
         """
         self.l1 = MemoryCache(max_size=memory_size, ttl=memory_ttl)
         self.l2 = DiskCache(cache_dir=cache_dir, format=format, ttl=disk_ttl)
+        self.negative_ttl = negative_ttl
+        # job_id -> time of the miss, oldest first
+        self._neg: OrderedDict[str, float] = OrderedDict()
+        self._neg_lock = threading.Lock()
+        # Bumped by put(), so a lookup that raced one records no miss
+        self._puts = 0
 
     def get(self, job_id: str) -> Optional[JobResult]:
         """Get result from cache (L1 first, then L2).
@@ -435,6 +499,16 @@ class TwoLevelCache:
         Returns:
             JobResult if found, None otherwise
         """
+        # Recent miss, skip both levels
+        if self.negative_ttl is not None:
+            with self._neg_lock:
+                puts = self._puts
+                missed_at = self._neg.get(job_id)
+                if missed_at is not None:
+                    if time.time() - missed_at <= self.negative_ttl:
+                        return None
+                    del self._neg[job_id]
+
         # Try L1 first
         result = self.l1.get(job_id)
         if result is not None:
@@ -447,8 +521,29 @@ class TwoLevelCache:
             self.l1.put(result)
             return result
 
+        if self.negative_ttl is not None:
+            self._record_miss(job_id, puts)
+
         return None
 
+    def _record_miss(self, job_id: str, puts: int):
+        """Remember a miss, unless a put() ran since the lookup began."""
+        now = time.time()
+        neg = self._neg
+        with self._neg_lock:
+            if self._puts != puts:
+                return  # The result may have been cached meanwhile
+            neg.pop(job_id, None)
+            neg[job_id] = now
+            # Drop expired misses, oldest first, then any over the cap
+            while neg:
+                oldest, missed_at = next(iter(neg.items()))
+                if now - missed_at <= self.negative_ttl:
+                    break
+                del neg[oldest]
+            while len(neg) > _NEGATIVE_CACHE_SIZE:
+                neg.popitem(last=False)
+
     def put(self, result: JobResult):
         """Put result in both caches.
 
@@ -457,6 +552,9 @@ class TwoLevelCache:
         """
         self.l1.put(result)
         self.l2.put(result)
+        with self._neg_lock:
+            self._puts += 1
+            self._neg.pop(result.job_id, None)
 
     def remove(self, job_id: str) -> bool:
         """Remove result from both caches.
@@ -475,6 +573,8 @@ class TwoLevelCache:
         """Clear both caches."""
         self.l1.clear()
         self.l2.clear()
+        with self._neg_lock:
+            self._neg.clear()
 
     def stats(self) -> dict:
         """Get cache statistics.
@@ -222,7 +222,7 @@ class ResultExporter:
         for result in results:
             data.append({
                 'job_id': result.job_id,
-                'counts': result.counts,
+                'counts': dict(result.counts),
                 'shots': result.shots,
                 'execution_time_ms': result.execution_time_ms,
                 'metadata': result.metadata,
@@ -1,9 +1,20 @@
 """Type definitions for the Arvak gRPC client."""
 
-from dataclasses import dataclass
+import heapq
+import importlib.util
+import operator
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import IntEnum
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Union
+
+
+# Records allocated per job are slotted: no per-instance __dict__ and faster
+# attribute access. dataclass(slots=True) needs Python 3.10; on 3.9 they
+# remain regular dataclasses.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class JobState(IntEnum):
@@ -16,27 +27,112 @@ class JobState(IntEnum):
     CANCELED = 5
 
 
-@dataclass
+# State sets as bitmasks over the state values: membership is a shift and a
+# mask on plain ints instead of IntEnum comparisons against a tuple.
+_TERMINAL_STATES = (
+    (1 << JobState.COMPLETED) | (1 << JobState.FAILED) | (1 << JobState.CANCELED)
+)
+_PENDING_STATES = (1 << JobState.QUEUED) | (1 << JobState.RUNNING)
+
+
+def _cached_time(name: str) -> property:
+    """A ``datetime`` view of the ``<name>_epoch`` field, built on first use.
+
+    Stands in for ``functools.cached_property``, which needs an instance
+    ``__dict__``; the datetime is kept in the ``_<name>`` field instead.
+    """
+    epoch_attr, cache_attr = f"{name}_epoch", f"_{name}"
+
+    def get(self) -> Optional[datetime]:
+        value = getattr(self, cache_attr)
+        if value is None:
+            epoch = getattr(self, epoch_attr)
+            if epoch is None:
+                return None
+            value = datetime.fromtimestamp(epoch)
+            setattr(self, cache_attr, value)
+        return value
+
+    return property(get)
+
+
+def _cache_field():
+    return field(default=None, init=False, repr=False, compare=False)
+
+
+def _timestamp(value) -> tuple:
+    """Epoch seconds and datetime, if known, for a datetime or epoch value.
+
+    A datetime passed in is kept and returned as is, not rebuilt later.
+    """
+    if isinstance(value, datetime):
+        return value.timestamp(), value
+    return value, None
+
+
+@dataclass(init=False, repr=False, **_SLOTS)
 class Job:
-    """Job metadata and status."""
+    """Job metadata and status.
+
+    Timestamps may be given as ``datetime`` objects or as Unix epoch
+    seconds, and are kept as epochs (``submitted_at_epoch`` and so on). The
+    ``datetime`` views (``submitted_at``, ``started_at``, ``completed_at``)
+    are only built when accessed, then kept.
+    """
     job_id: str
     state: JobState
-    submitted_at: datetime
+    submitted_at_epoch: float
     backend_id: str
     shots: int
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
-    error_message: Optional[str] = None
+    started_at_epoch: Optional[float]
+    completed_at_epoch: Optional[float]
+    error_message: Optional[str]
+    _submitted_at: Optional[datetime] = _cache_field()
+    _started_at: Optional[datetime] = _cache_field()
+    _completed_at: Optional[datetime] = _cache_field()
+
+    submitted_at = _cached_time("submitted_at")
+    started_at = _cached_time("started_at")
+    completed_at = _cached_time("completed_at")
+
+    def __init__(
+        self,
+        job_id: str,
+        state: JobState,
+        submitted_at: Union[datetime, float],
+        backend_id: str,
+        shots: int,
+        started_at: Union[datetime, float, None] = None,
+        completed_at: Union[datetime, float, None] = None,
+        error_message: Optional[str] = None,
+    ):
+        self.job_id = job_id
+        self.state = state
+        self.backend_id = backend_id
+        self.shots = shots
+        self.error_message = error_message
+        self.submitted_at_epoch, self._submitted_at = _timestamp(submitted_at)
+        self.started_at_epoch, self._started_at = _timestamp(started_at)
+        self.completed_at_epoch, self._completed_at = _timestamp(completed_at)
+
+    def __repr__(self) -> str:
+        return (
+            f"Job(job_id={self.job_id!r}, state={self.state!r}, "
+            f"submitted_at={self.submitted_at!r}, backend_id={self.backend_id!r}, "
+            f"shots={self.shots!r}, started_at={self.started_at!r}, "
+            f"completed_at={self.completed_at!r}, "
+            f"error_message={self.error_message!r})"
+        )
 
     @property
     def is_terminal(self) -> bool:
         """Check if the job is in a terminal state."""
-        return self.state in (JobState.COMPLETED, JobState.FAILED, JobState.CANCELED)
+        return bool(_TERMINAL_STATES >> self.state & 1)
 
     @property
     def is_pending(self) -> bool:
         """Check if the job is still pending."""
-        return self.state in (JobState.QUEUED, JobState.RUNNING)
+        return bool(_PENDING_STATES >> self.state & 1)
 
     @property
     def is_success(self) -> bool:
@@ -44,34 +140,336 @@ class Job:
         return self.state == JobState.COMPLETED
 
 
-@dataclass
+class _CountsView(Mapping):
+    """Read-only view over a protobuf ``counts`` map.
+
+    Lets a ``JobResult`` expose the map from the RPC response without
+    copying it into a dict. Missing keys raise ``KeyError`` instead of
+    inserting a zero the way the underlying map does, and the view pickles
+    as a plain dict.
+    """
+
+    __slots__ = ("_counts",)
+
+    def __init__(self, counts):
+        self._counts = counts
+
+    def __getitem__(self, bitstring: str) -> int:
+        if bitstring in self._counts:
+            return self._counts[bitstring]
+        raise KeyError(bitstring)
+
+    def get(self, bitstring: str, default=None):
+        return self._counts.get(bitstring, default)
+
+    def __contains__(self, bitstring) -> bool:
+        return bitstring in self._counts
+
+    def __iter__(self):
+        return iter(self._counts)
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __repr__(self) -> str:
+        return repr(dict(self._counts))
+
+    def __reduce__(self):
+        return (dict, (dict(self._counts),))
+
+
+class _PackedCounts(Mapping):
+    """Read-only counts decoded from a packed ``CountHistogram``.
+
+    Keeps the histogram as the ``uint64`` key and ``int64`` count arrays a
+    ``JobResult`` serves from :meth:`JobResult.arrays`; the bitstring dict
+    is only built once the counts are read as a mapping. Pickles as a plain
+    dict, like ``_CountsView``.
+    """
+
+    __slots__ = ("arrays", "num_qubits", "_dict")
+
+    def __init__(self, histogram):
+        np = _numpy()
+        keys = np.frombuffer(histogram.keys, dtype="<u8").astype(np.uint64)
+        counts = np.frombuffer(histogram.counts, dtype="<u4").astype(np.int64)
+        self.arrays = (keys, counts)
+        self.num_qubits = histogram.num_qubits
+        self._dict: Optional[Dict[str, int]] = None
+
+    def _counts(self) -> Dict[str, int]:
+        if self._dict is None:
+            keys, counts = self.arrays
+            width = self.num_qubits
+            self._dict = {
+                f"{key:0{width}b}": count
+                for key, count in zip(keys.tolist(), counts.tolist())
+            }
+        return self._dict
+
+    def __getitem__(self, bitstring: str) -> int:
+        return self._counts()[bitstring]
+
+    def __iter__(self):
+        return iter(self._counts())
+
+    def __len__(self) -> int:
+        return len(self.arrays[1])
+
+    def __repr__(self) -> str:
+        return repr(self._counts())
+
+    def __reduce__(self):
+        return (dict, (self._counts(),))
+
+
 class JobResult:
-    """Result of circuit execution."""
-    job_id: str
-    counts: Dict[str, int]
-    shots: int
-    execution_time_ms: Optional[int] = None
-    metadata: Optional[Dict] = None
+    """Result of circuit execution.
+
+    The total of ``counts``, the probabilities and the most frequent
+    bitstring are computed on first use and kept, so repeated
+    ``probabilities()``/``most_frequent()`` calls do not rescan the counts.
+    ``counts`` is treated as immutable once the result is built.
+
+    For vectorized work over large results, :meth:`arrays` gives the counts
+    as NumPy arrays, optionally with each bitstring packed into one
+    ``uint64``. Results the server sent as a packed histogram start out in
+    that form.
+    """
+
+    __slots__ = (
+        "job_id", "counts", "shots", "execution_time_ms", "metadata",
+        "_num_qubits", "_total", "_probs", "_most", "_arrays", "_packed",
+    )
+
+    def __init__(
+        self,
+        job_id: str,
+        counts: Mapping[str, int],
+        shots: int,
+        execution_time_ms: Optional[int] = None,
+        metadata: Optional[Dict] = None,
+        num_qubits: Optional[int] = None,
+    ):
+        self.job_id = job_id
+        self.counts = counts
+        self.shots = shots
+        self.execution_time_ms = execution_time_ms
+        self.metadata = metadata
+        self._num_qubits = num_qubits
+        self._total: Optional[int] = None
+        self._probs: Optional[Dict[str, float]] = None
+        self._most: Optional[tuple[str, int]] = None
+        self._arrays = None
+        self._packed = None
+        if isinstance(counts, _PackedCounts):
+            self._num_qubits = counts.num_qubits
+            self._packed = counts.arrays
+
+    def __repr__(self) -> str:
+        return (
+            f"JobResult(job_id={self.job_id!r}, counts={self.counts!r}, "
+            f"shots={self.shots!r}, execution_time_ms={self.execution_time_ms!r}, "
+            f"metadata={self.metadata!r})"
+        )
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.job_id, self.counts, self.shots,
+            self.execution_time_ms, self.metadata,
+        ) == (
+            other.job_id, other.counts, other.shots,
+            other.execution_time_ms, other.metadata,
+        )
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return (
+            JobResult,
+            (self.job_id, self.counts, self.shots,
+             self.execution_time_ms, self.metadata, self._num_qubits),
+        )
+
+    @property
+    def num_qubits(self) -> int:
+        """Width of the measured bitstrings.
+
+        Taken from the longest bitstring unless given when the result was
+        built.
+        """
+        if self._num_qubits is None:
+            self._num_qubits = max(map(len, self.counts), default=0)
+        return self._num_qubits
+
+    @property
+    def total(self) -> int:
+        """Sum of all counts."""
+        if self._total is None:
+            cached = self._arrays or self._packed
+            if cached is None:
+                self._total = sum(self.counts.values())
+            else:
+                self._total = int(cached[1].sum())
+        return self._total
+
+    def top_k(self, k: int) -> List[tuple[str, int]]:
+        """Get the ``k`` most frequent bitstrings with their counts.
+
+        Ordered by count, highest first; ties keep their order in
+        ``counts``. Uses a bounded heap, so this is O(N log k) rather than a
+        full sort of the counts, or a linear-time partition of the count
+        array once :meth:`arrays` has been built.
+        """
+        cached = self._arrays or self._packed
+        if cached is None:
+            return heapq.nlargest(k, self.counts.items(), key=operator.itemgetter(1))
+        keys, counts = cached
+        return [
+            (self.format_key(keys[i]), int(counts[i]))
+            for i in _top_k_indices(counts, k)
+        ]
+
+    def arrays(self, packed: bool = False) -> tuple:
+        """Get the counts as a struct of NumPy arrays.
+
+        Built on first call and kept, so ``counts.sum()``, ``counts.argmax()``
+        or ``counts / counts.sum()`` run as single C loops over contiguous
+        memory instead of iterating a mapping.
+
+        With ``packed=True`` each bitstring of at most 64 qubits is stored
+        as one ``uint64`` (the bitstring read as a binary number), which is
+        several times smaller than a unicode entry and works directly with
+        ``np.bincount``, ``np.sort`` and bitwise operations. Use
+        :meth:`format_key` to turn a key back into a bitstring. Results
+        wider than 64 qubits, or whose keys are not plain ``0``/``1``
+        strings, keep unicode keys.
+
+        Args:
+            packed: Return packed ``uint64`` keys where possible
+
+        Returns:
+            Tuple ``(keys, counts)``: an array of bitstrings (unicode, or
+            ``uint64`` if packed) and an ``int64`` array of their counts, in
+            the same order
+
+        Raises:
+            ImportError: If numpy is not installed
+        """
+        if packed:
+            if self._packed is None:
+                self._packed = self._pack()
+            return self._packed
+        if self._arrays is None:
+            np = _numpy()
+            bitstrings = np.array(list(self.counts), dtype=str)
+            self._arrays = (bitstrings, self._count_array(np))
+        return self._arrays
+
+    def _count_array(self, np):
+        """The int64 counts, shared by the packed and unpacked arrays."""
+        for cached in (self._arrays, self._packed):
+            if cached is not None:
+                return cached[1]
+        n = len(self.counts)
+        return np.fromiter(self.counts.values(), dtype=np.int64, count=n)
+
+    def _pack(self) -> tuple:
+        np = _numpy()
+        if self.num_qubits > 64:
+            return self.arrays()
+        n = len(self.counts)
+        try:
+            keys = np.fromiter(
+                (int(b, 2) for b in self.counts), dtype=np.uint64, count=n
+            )
+        except ValueError:  # Register separators or other non-binary keys
+            return self.arrays()
+        return (keys, self._count_array(np))
+
+    def format_key(self, key) -> str:
+        """Format a packed ``uint64`` key from :meth:`arrays` as a bitstring."""
+        if isinstance(key, str):
+            return str(key)
+        return f"{int(key):0{self.num_qubits}b}"
 
     def probabilities(self) -> Dict[str, float]:
-        """Get probabilities for each bitstring."""
-        total = sum(self.counts.values())
-        if total == 0:
-            return {}
-        return {k: v / total for k, v in self.counts.items()}
+        """Get probabilities for each bitstring.
+
+        Built on first call and kept; the returned dict is shared between
+        calls and must not be modified.
+        """
+        if self._probs is None:
+            total = self.total
+            if total == 0:
+                self._probs = {}
+            else:
+                self._probs = {k: v / total for k, v in self.counts.items()}
+        return self._probs
 
     def most_frequent(self) -> Optional[tuple[str, float]]:
         """Get the most frequent measurement result."""
-        if not self.counts:
-            return None
-        total = sum(self.counts.values())
+        total = self.total
         if total == 0:
             return None
-        most = max(self.counts.items(), key=lambda x: x[1])
-        return (most[0], most[1] / total)
+        if self._most is None:
+            self._most = self.top_k(1)[0]
+        bitstring, count = self._most
+        return (bitstring, count / total)
+
+
+def _top_k_indices(counts, k: int):
+    """Indices of the ``k`` largest ``counts``, as ``heapq.nlargest`` orders them.
+
+    ``np.partition`` finds the k-th largest count in linear time; ties at
+    that count are filled in by position, so the selection matches the
+    heap path exactly.
+    """
+    np = _numpy()
+    n = len(counts)
+    if k <= 0:
+        return []
+    if k >= n:
+        indices = np.arange(n)
+    else:
+        kth = np.partition(counts, n - k)[n - k]
+        above = np.flatnonzero(counts > kth)
+        ties = np.flatnonzero(counts == kth)[:k - len(above)]
+        indices = np.concatenate((above, ties))
+    return indices[np.lexsort((indices, -counts[indices]))].tolist()
+
+
+# Results are requested as packed count histograms, which decode straight
+# into NumPy arrays, when numpy is there to decode them.
+_PACKED_COUNTS = importlib.util.find_spec("numpy") is not None
+
+
+def _numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            "numpy is required for JobResult.arrays(). "
+            "Install with: pip install numpy"
+        )
+    return np
+
+
+@dataclass(frozen=True)
+class PreparedCircuit:
+    """A circuit encoded once for repeated submission.
+
+    Returned by ``prepare_qasm``/``prepare_circuit_json`` and accepted by
+    ``submit_prepared``. Holds the circuit as an already-serialized
+    ``SubmitJobRequest`` fragment, so resubmitting it with other shots or
+    backends does not re-encode the circuit source.
+    """
+    encoded: bytes
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class BackendInfo:
     """Backend capabilities and information."""
     backend_id: str
@@ -80,5 +478,5 @@ class BackendInfo:
     max_qubits: int
     max_shots: int
     description: str
-    supported_gates: list[str]
+    supported_gates: tuple[str, ...]
     topology: Optional[Dict] = None
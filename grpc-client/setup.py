@@ -36,7 +36,9 @@ setup(
         "dev": [
             "grpcio-tools>=1.60.0",
             "pytest>=7.0.0",
-            "pytest-asyncio>=0.21.0",
+            "pytest-asyncio>=1.0.0",
+            "pytest-xdist>=3.0.0",
+            "uvloop>=0.17.0; sys_platform != 'win32'",
         ],
         "export": [
             "pyarrow>=14.0.0",
@@ -49,15 +51,21 @@ setup(
             "matplotlib>=3.5.0",
             "numpy>=1.21.0",
         ],
+        "fast": [
+            "orjson>=3.8.0",
+        ],
         "all": [
             "grpcio-tools>=1.60.0",
             "pytest>=7.0.0",
-            "pytest-asyncio>=0.21.0",
+            "pytest-asyncio>=1.0.0",
+            "pytest-xdist>=3.0.0",
+            "uvloop>=0.17.0; sys_platform != 'win32'",
             "pyarrow>=14.0.0",
             "pandas>=2.0.0",
             "polars>=0.19.0",
             "matplotlib>=3.5.0",
             "numpy>=1.21.0",
+            "orjson>=3.8.0",
         ],
     },
     package_data={
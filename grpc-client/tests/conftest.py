@@ -0,0 +1,89 @@
+"""Shared fixtures for the Arvak gRPC client tests."""
+
+import os
+
+import pytest
+
+from arvak_grpc import arvak_pb2
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency
+    np = None
+
+try:
+    import uvloop
+except ImportError:  # Not available on Windows
+    uvloop = None
+
+
+if uvloop is not None:
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """Run the async tests on uvloop where it is installed.
+
+        All async tests and fixtures share one session-wide loop (see
+        ``pytest.ini``), so the client's channels and pools are set up once
+        rather than per test.
+        """
+        return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture(scope="session")
+def server_address():
+    """Address of the Arvak server the integration tests run against.
+
+    Defaults to ``localhost:50051``. Set ``ARVAK_TEST_SERVER`` to use
+    another server, e.g. one listening on a Unix domain socket, which keeps
+    the TCP stack out of every test's round trips::
+
+        ARVAK_GRPC_ADDRESS=unix:/tmp/arvak-test.sock arvak-grpc-server
+        ARVAK_TEST_SERVER=unix:/tmp/arvak-test.sock pytest
+
+    Under pytest-xdist (``-n auto --dist loadgroup``) every worker connects
+    to this one server, each with its own session-scoped clients.
+    """
+    return os.environ.get("ARVAK_TEST_SERVER", "localhost:50051")
+
+
+def _assert_valid_distribution(probs, tol=1e-3):
+    """Check that ``probs`` is a probability distribution.
+
+    With numpy installed the checks run as array reductions, so they stay
+    cheap for distributions over many qubits.
+    """
+    assert len(probs) > 0
+    if np is None:
+        values = list(probs.values())
+        assert all(0.0 <= p <= 1.0 for p in values)
+        assert abs(sum(values) - 1.0) < tol
+        return
+    arr = np.fromiter(probs.values(), dtype=np.float64, count=len(probs))
+    assert ((arr >= 0.0) & (arr <= 1.0)).all()
+    assert abs(arr.sum() - 1.0) < tol
+
+
+@pytest.fixture(scope="session")
+def assert_valid_distribution():
+    """The distribution check, for tests that inspect probabilities."""
+    return _assert_valid_distribution
+
+
+def _assert_cancel_response(response):
+    """Check a ``cancel_job()`` reply against the CancelJobResponse message.
+
+    The reply is rebuilt as the message, so a value that no longer fits its
+    field in the proto schema fails here rather than in every caller.
+    """
+    fields = arvak_pb2.CancelJobResponse.DESCRIPTOR.fields
+    assert len(response) == len(fields)
+    arvak_pb2.CancelJobResponse(
+        **{field.name: value for field, value in zip(fields, response)}
+    )
+
+
+@pytest.fixture(scope="session")
+def assert_cancel_response():
+    """The cancel reply check, for tests that cancel jobs."""
+    return _assert_cancel_response
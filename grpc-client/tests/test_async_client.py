@@ -2,8 +2,24 @@
 
 import pytest
 import asyncio
-from arvak_grpc import AsyncArvakClient, JobState
+from contextlib import nullcontext
+from unittest.mock import AsyncMock, Mock
+
+import grpc
+
+from arvak_grpc import (
+    AsyncArvakClient,
+    ConnectionPool,
+    Job,
+    JobState,
+    arvak_pb2,
+    arvak_pb2_grpc,
+)
+from arvak_grpc import async_client as async_client_module
+from arvak_grpc.async_client import _UNARY_RETRY_POLICY, _StreamPool
+from arvak_grpc.client import _prepare_circuit
 from arvak_grpc.exceptions import (
+    ArvakError,
     ArvakJobNotFoundError,
     ArvakBackendNotFoundError,
     ArvakInvalidCircuitError,
@@ -20,15 +36,56 @@ cx q[0], q[1];
 INVALID_QASM = "this is not valid qasm"
 
 
-@pytest.fixture
-async def async_client():
-    """Create an async client connected to the test server."""
-    # Note: Tests assume server is running on localhost:50051
-    client = AsyncArvakClient("localhost:50051", timeout=30.0)
+async def _gather(*aws):
+    """Await ``aws`` concurrently; on the first failure cancel the rest.
+
+    ``asyncio.TaskGroup`` semantics on the Python versions without it:
+    unlike plain ``asyncio.gather``, a failed call does not leave its
+    siblings running into later tests.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+@pytest.fixture(scope="session")
+async def async_client(server_address):
+    """Create an async client connected to the test server.
+
+    Shared by the whole session, like the event loop it runs on.
+    """
+    # Note: Tests assume a server is running at server_address
+    client = AsyncArvakClient(server_address, timeout=30.0)
     yield client
     await client.close()
 
 
+@pytest.fixture(scope="session")
+async def bell_result(async_client):
+    """Get a completed Bell-state result for a shot count.
+
+    Each shot count is run on the simulator once per session; tests that
+    only inspect a finished result share it instead of resubmitting.
+    """
+    results = {}
+
+    async def run(shots):
+        if shots not in results:
+            job_id = await async_client.submit_qasm(
+                BELL_STATE_QASM, "simulator", shots=shots
+            )
+            assert job_id
+            results[shots] = await async_client.wait_for_job(job_id, max_wait=30.0)
+        return results[shots]
+
+    return run
+
+
 @pytest.mark.asyncio
 async def test_list_backends(async_client):
     """Test listing available backends async."""
@@ -37,8 +94,10 @@ async def test_list_backends(async_client):
     assert len(backends) > 0, "Should have at least one backend"
 
     # Check simulator backend exists
-    simulator = next((b for b in backends if b.backend_id == "simulator"), None)
-    assert simulator is not None, "Simulator backend should be available"
+    by_id = {b.backend_id: b for b in backends}
+    assert len(by_id) == len(backends), "Backend IDs should be unique"
+    assert "simulator" in by_id, "Simulator backend should be available"
+    simulator = by_id["simulator"]
     assert simulator.is_available
     assert simulator.max_qubits > 0
 
@@ -54,23 +113,17 @@ async def test_get_backend_info(async_client):
 
 
 @pytest.mark.asyncio
-async def test_submit_and_wait(async_client):
+async def test_submit_and_wait(bell_result, assert_valid_distribution):
     """Test async job submission and waiting."""
-    # Submit job
-    job_id = await async_client.submit_qasm(BELL_STATE_QASM, "simulator", shots=1000)
-    assert job_id is not None
-    assert len(job_id) > 0
+    # Submits the job and waits for it, unless an earlier test has
+    result = await bell_result(1000)
 
-    # Wait for completion
-    result = await async_client.wait_for_job(job_id, max_wait=30.0)
-
-    assert result.job_id == job_id
+    assert result.job_id
     assert result.shots == 1000
     assert len(result.counts) > 0
 
     # Verify probabilities
-    probs = result.probabilities()
-    assert abs(sum(probs.values()) - 1.0) < 0.001
+    assert_valid_distribution(result.probabilities())
 
 
 @pytest.mark.asyncio
@@ -82,23 +135,23 @@ async def test_concurrent_submissions(async_client):
         for _ in range(5)
     ]
 
-    job_ids = await asyncio.gather(*tasks)
+    job_ids = await _gather(*tasks)
 
     assert len(job_ids) == 5
     assert all(len(job_id) > 0 for job_id in job_ids)
 
     # Wait for all jobs concurrently
     wait_tasks = [async_client.wait_for_job(job_id, max_wait=30.0) for job_id in job_ids]
-    results = await asyncio.gather(*wait_tasks)
+    results = await _gather(*wait_tasks)
 
     assert len(results) == 5
     assert all(result.shots == 500 for result in results)
 
 
 @pytest.mark.asyncio
-async def test_context_manager():
+async def test_context_manager(server_address):
     """Test async context manager."""
-    async with AsyncArvakClient("localhost:50051") as client:
+    async with AsyncArvakClient(server_address) as client:
         backends = await client.list_backends()
         assert len(backends) > 0
 
@@ -117,7 +170,7 @@ async def test_submit_batch(async_client):
     assert len(job_ids) == 3
 
     # Wait for all
-    results = await asyncio.gather(
+    results = await _gather(
         *[async_client.wait_for_job(job_id, max_wait=30.0) for job_id in job_ids]
     )
 
@@ -147,27 +200,62 @@ async def test_progress_callback(async_client):
 
 
 @pytest.mark.asyncio
-async def test_get_job_status(async_client):
+async def test_watch_job(async_client):
+    """Test following a job's state changes over one WatchJob stream."""
+    job_id = await async_client.submit_qasm(BELL_STATE_QASM, "simulator", shots=100)
+
+    states_seen = []
+    async for state, timestamp, error_msg in async_client.watch_job(job_id):
+        states_seen.append(state)
+        if state in (JobState.COMPLETED, JobState.FAILED, JobState.CANCELED):
+            break
+
+    assert states_seen[-1] == JobState.COMPLETED
+    assert error_msg is None
+
+
+@pytest.mark.asyncio
+async def test_poll_fallback_backs_off(monkeypatch):
+    """Test that polling backs off while the state is unchanged."""
+    client = AsyncArvakClient("localhost:50051")
+    client._watch_supported = False
+    states = [JobState.QUEUED] * 3 + [JobState.RUNNING] * 2 + [JobState.COMPLETED]
+    client.get_job_status = AsyncMock(
+        side_effect=[Job("job-1", state, 0.0, "simulator", 1) for state in states]
+    )
+    client.get_job_result = AsyncMock(return_value="result")
+
+    delays = []
+    monkeypatch.setattr(
+        async_client_module, "_jittered", lambda delay: delays.append(delay) or 0.0
+    )
+
+    assert await client.wait_for_job("job-1", poll_interval=0.1) == "result"
+    assert delays == pytest.approx([0.05, 0.075, 0.1, 0.05, 0.075])
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_get_job_status(async_client, bell_result):
     """Test getting job status async."""
-    job_id = await async_client.submit_qasm(BELL_STATE_QASM, "simulator", shots=500)
+    job_id = (await bell_result(1000)).job_id
 
     job = await async_client.get_job_status(job_id)
 
     assert job.job_id == job_id
     assert job.backend_id == "simulator"
-    assert job.shots == 500
+    assert job.shots == 1000
+    assert job.state == JobState.COMPLETED
 
 
 @pytest.mark.asyncio
-async def test_cancel_job(async_client):
+async def test_cancel_job(async_client, assert_cancel_response):
     """Test canceling a job async."""
     job_id = await async_client.submit_qasm(BELL_STATE_QASM, "simulator", shots=1000)
 
     # Try to cancel
-    success, message = await async_client.cancel_job(job_id)
-
-    assert isinstance(success, bool)
-    assert isinstance(message, str)
+    assert_cancel_response(await async_client.cancel_job(job_id))
 
 
 @pytest.mark.asyncio
@@ -192,9 +280,10 @@ async def test_job_not_found(async_client):
 
 
 @pytest.mark.asyncio
-async def test_connection_pooling():
+async def test_connection_pooling(server_address):
     """Test connection pooling with multiple clients."""
-    clients = [AsyncArvakClient("localhost:50051", pool_size=3) for _ in range(5)]
+    clients = [AsyncArvakClient(server_address, pool_size=3) for _ in range(5)]
+    assert all(client._pool is clients[0]._pool for client in clients)
 
     try:
         # Use all clients concurrently
@@ -212,16 +301,483 @@ async def test_connection_pooling():
 
 
 @pytest.mark.asyncio
-async def test_high_concurrency():
+async def test_connection_pool_reuse():
+    """Test that returned channels are reused LIFO and capped at max_size."""
+    pool = ConnectionPool("localhost:50051", max_size=1)
+
+    first = await pool.get_channel()
+    second = await pool.get_channel()
+    await pool.return_channel(first)
+    await pool.return_channel(second)  # Pool full, closed instead
+
+    assert await pool.get_channel() is first
+
+    await pool.close()
+    with pytest.raises(RuntimeError):
+        await pool.get_channel()
+
+
+@pytest.mark.asyncio
+async def test_connection_pool_stream_watermark():
+    """Test that a new channel opens only once the open ones are busy."""
+    pool = ConnectionPool("localhost:50051", max_size=2, stream_watermark=2)
+
+    first = pool.slot()
+    assert pool.slot() is first  # Idle pool reuses its only channel
+
+    with first, first:
+        second = pool.slot()  # First channel at the watermark
+        assert second is not first
+        assert len(pool._slots) == 2
+
+        with second:
+            assert pool.slot() is second  # Least busy wins
+            with second:
+                # Both at the watermark and the pool is full
+                assert pool.slot() in (first, second)
+                assert len(pool._slots) == 2
+
+    assert first.inflight == 0 and second.inflight == 0
+
+    await pool.close()
+    with pytest.raises(RuntimeError):
+        pool.slot()
+
+
+@pytest.mark.asyncio
+async def test_stream_pool_applies_backpressure():
+    """Test that streams past the per-channel cap wait for one to end."""
+    pool = ConnectionPool("localhost:50051", max_size=1)
+    streams = _StreamPool(pool, max_streams=2)
+
+    third = streams.stream()
+    async with streams.stream(), streams.stream():
+        waiter = asyncio.ensure_future(third.__aenter__())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()  # Channel full and the pool cannot grow
+        assert pool._slots[0].inflight == 2
+
+    await asyncio.wait_for(waiter, 1)
+    assert pool._slots[0].inflight == 1
+    assert len(pool._slots) == 1
+
+    await third.__aexit__(None, None, None)
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_connection_pool_shares_stubs():
+    """Test that each channel's stub is built once and reused by every RPC."""
+    client = AsyncArvakClient("localhost:50051", pool_size=2)
+
+    with client._pool.slot() as first:
+        pass
+    with client._pool.slot() as again:
+        pass
+
+    assert again is first
+    assert not hasattr(client, "_stub")
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_connection_pool_reset_failed():
+    """Test that only the channel of the last failed RPC is replaced."""
+    pool = ConnectionPool("localhost:50051", max_size=2, stream_watermark=1)
+    first = pool.slot()
+    with first:
+        second = pool.slot()
+
+    with pytest.raises(ArvakError):
+        with first:
+            raise ArvakError("UNAVAILABLE: connection reset")
+    with second:
+        pass  # Succeeded; not what reset_failed() drops
+    pool.reset_failed()
+
+    assert pool._slots == [second]
+    fresh = pool.slot()
+    assert fresh is second
+    with fresh:
+        assert pool.slot() not in (first, second)
+    pool.reset_failed()  # Nothing failed since; a no-op
+    assert len(pool._slots) == 2
+
+    await pool.close()
+    assert first.channel.get_state() == grpc.ChannelConnectivity.SHUTDOWN
+
+
+@pytest.mark.asyncio
+async def test_connection_pool_close_concurrent():
+    """Test that concurrent closes all wait and late returns are closed."""
+    pool = ConnectionPool("localhost:50051", max_size=2)
+    pool.slot()
+    dedicated = await pool.get_channel()
+    channels = [slot.channel for slot in pool._slots]
+
+    await asyncio.gather(pool.close(), pool.close())
+
+    assert pool._slots == [] and pool._pool.empty()
+    for channel in channels:
+        assert channel.get_state() == grpc.ChannelConnectivity.SHUTDOWN
+
+    await pool.return_channel(dedicated)
+    assert pool._pool.empty()
+    assert dedicated.get_state() == grpc.ChannelConnectivity.SHUTDOWN
+
+
+@pytest.mark.asyncio
+async def test_clients_share_pool():
+    """Test that clients on one loop share a pool until the last one closes."""
+    first = AsyncArvakClient("localhost:50051", pool_size=2)
+    second = AsyncArvakClient("localhost:50051", pool_size=2)
+    other = AsyncArvakClient("localhost:50051", pool_size=3)
+
+    assert second._pool is first._pool and second._streams is first._streams
+    assert other._pool is not first._pool
+
+    pool = first._pool
+    await first.close()
+    await first.close()  # Releases its hold only once
+    assert not pool._closed
+    await second.close()
+    assert pool._closed
+
+    third = AsyncArvakClient("localhost:50051", pool_size=2)
+    assert third._pool is not pool
+    await asyncio.gather(third.close(), other.close())
+
+
+@pytest.mark.asyncio
+async def test_close_is_lazy_and_idempotent():
+    """Test that client close returns at once and the pool drains later."""
+    client = AsyncArvakClient("localhost:50051", pool_size=2)
+    pool = client._pool
+    channel = pool.slot().channel
+    dedicated = await pool.get_channel()
+
+    pool.schedule_return(dedicated)
+    await pool._drainer
+    assert await pool.get_channel() is dedicated
+
+    await client.close()
+    await client.close()
+    with pytest.raises(RuntimeError):
+        pool.slot()
+
+    pool.schedule_return(dedicated)  # Late return is closed, not pooled
+    await pool.close()
+    assert pool._pool.empty() and not pool._pending_returns
+    for ch in (channel, dedicated):
+        assert ch.get_state() == grpc.ChannelConnectivity.SHUTDOWN
+
+
+@pytest.mark.asyncio
+async def test_submit_batching(monkeypatch):
+    """Test that concurrent submissions share one SubmitBatch per backend."""
+    client = AsyncArvakClient("localhost:50051", flush_interval_ms=5)
+    stub = Mock()
+
+    async def submit_batch(request, timeout=None):
+        prefix = request.backend_id
+        return arvak_pb2.SubmitBatchResponse(
+            job_ids=[f"{prefix}-{job.shots}" for job in request.jobs]
+        )
+
+    stub.SubmitBatch = AsyncMock(side_effect=submit_batch)
+    stub.SubmitJob = AsyncMock(
+        return_value=arvak_pb2.SubmitJobResponse(job_id="single")
+    )
+    monkeypatch.setattr(client._pool, "slot", lambda: nullcontext(stub))
+
+    job_ids = await asyncio.gather(
+        client.submit_qasm(BELL_STATE_QASM, "simulator", shots=1),
+        client.submit_qasm(BELL_STATE_QASM, "simulator", shots=2),
+        client.submit_circuit_json("{}", "simulator", shots=3),
+        client.submit_qasm(BELL_STATE_QASM, "other", shots=4),
+    )
+
+    assert job_ids == ["simulator-1", "simulator-2", "simulator-3", "single"]
+    assert stub.SubmitBatch.await_count == 1
+    assert stub.SubmitJob.await_count == 1
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_submit_batching_isolates_invalid_circuit(monkeypatch):
+    """Test that a rejected batch only fails the caller with the bad circuit."""
+    client = AsyncArvakClient("localhost:50051", flush_interval_ms=5)
+    stub = Mock()
+    # The mocked stub bypasses the channel interceptor, so raise the
+    # already-translated exception.
+    stub.SubmitBatch = AsyncMock(side_effect=ArvakInvalidCircuitError("parse error"))
+
+    # Passes the client's header check; only the server can reject it
+    bad_circuit = "OPENQASM 3.0;\nnot a statement;"
+
+    async def submit_job(request, timeout=None):
+        if request.circuit.qasm3 == bad_circuit:
+            raise ArvakInvalidCircuitError("parse error")
+        return arvak_pb2.SubmitJobResponse(job_id="ok")
+
+    stub.SubmitJob = AsyncMock(side_effect=submit_job)
+    monkeypatch.setattr(client._pool, "slot", lambda: nullcontext(stub))
+
+    good, bad = await asyncio.gather(
+        client.submit_qasm(BELL_STATE_QASM, "simulator"),
+        client.submit_qasm(bad_circuit, "simulator"),
+        return_exceptions=True,
+    )
+
+    assert good == "ok"
+    assert isinstance(bad, ArvakInvalidCircuitError)
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_close_fails_pending_submissions(monkeypatch):
+    """Test that closing fails batched submits, sent or still collecting."""
+    client = AsyncArvakClient("localhost:50051", flush_interval_ms=20)
+    sent = asyncio.Event()
+    stub = Mock()
+
+    async def submit_batch(request, timeout=None):
+        sent.set()
+        await asyncio.Event().wait()  # Never answered
+
+    stub.SubmitBatch = AsyncMock(side_effect=submit_batch)
+    monkeypatch.setattr(client._pool, "slot", lambda: nullcontext(stub))
+
+    in_flight = [
+        asyncio.ensure_future(client.submit_qasm(BELL_STATE_QASM, "simulator"))
+        for _ in range(2)
+    ]
+    await sent.wait()
+    # Dequeued by the batcher, which is now waiting out the flush interval
+    collecting = asyncio.ensure_future(
+        client.submit_qasm(BELL_STATE_QASM, "simulator")
+    )
+    while not client._batcher._held:
+        await asyncio.sleep(0)
+    await client.close()
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*in_flight, collecting, return_exceptions=True), 1
+    )
+    for result in results:
+        assert isinstance(result, ArvakError)
+        assert str(result) == "client closed"
+
+
+class _FlakyServicer(arvak_pb2_grpc.ArvakServiceServicer):
+    """Fails the first calls with UNAVAILABLE, then succeeds."""
+
+    def __init__(self, failures: int):
+        self.failures = failures
+        self.calls = 0
+
+    async def _flake(self, context):
+        self.calls += 1
+        if self.calls <= self.failures:
+            await context.abort(grpc.StatusCode.UNAVAILABLE, "scheduler busy")
+
+    async def SubmitJob(self, request, context):
+        await self._flake(context)
+        return arvak_pb2.SubmitJobResponse(job_id="flaky-job")
+
+    async def GetJobStatus(self, request, context):
+        await self._flake(context)
+        if request.job_id == "missing":
+            await context.abort(
+                grpc.StatusCode.NOT_FOUND, f"Job not found: {request.job_id}"
+            )
+        return arvak_pb2.GetJobStatusResponse(
+            job=arvak_pb2.Job(
+                job_id=request.job_id, state=arvak_pb2.JOB_STATE_RUNNING
+            )
+        )
+
+
+@pytest.mark.asyncio
+async def test_interceptor_retries_and_translates(monkeypatch):
+    """Test that pooled channels retry reads on UNAVAILABLE and map errors."""
+    monkeypatch.setattr(_UNARY_RETRY_POLICY, "initial_backoff", 0.0)
+    servicer = _FlakyServicer(failures=2)
+    server = grpc.aio.server()
+    arvak_pb2_grpc.add_ArvakServiceServicer_to_server(servicer, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    client = AsyncArvakClient(f"127.0.0.1:{port}", flush_interval_ms=None)
+    # This server lacks SubmitJobStream, and its UNIMPLEMENTED can race the
+    # first write and surface as INTERNAL; test the unary path directly
+    client._submit_job_stream_supported = False
+    try:
+        job = await client.get_job_status("job-1")
+        assert job.state == JobState.RUNNING
+        assert servicer.calls == 3
+
+        servicer.calls, servicer.failures = 0, 3
+        with pytest.raises(ArvakError, match="UNAVAILABLE"):
+            await client.get_job_status("job-1")
+        assert servicer.calls == 3
+
+        # Submissions are not idempotent, so they are never retried
+        servicer.calls, servicer.failures = 0, 1
+        with pytest.raises(ArvakError, match="UNAVAILABLE"):
+            await client.submit_qasm(BELL_STATE_QASM, "simulator")
+        assert servicer.calls == 1
+        assert await client.submit_qasm(BELL_STATE_QASM, "simulator") == "flaky-job"
+
+        with pytest.raises(ArvakJobNotFoundError):
+            await client.get_job_status("missing")
+    finally:
+        await client.close()
+        await server.stop(None)
+
+
+class _SubmitStreamServicer(arvak_pb2_grpc.ArvakServiceServicer):
+    """Submits and completes each job on SubmitBatchStream."""
+
+    async def SubmitBatchStream(self, request_iterator, context):
+        async for submission in request_iterator:
+            yield arvak_pb2.BatchJobResult(job_id="stream-job", submitted="ok")
+            yield arvak_pb2.BatchJobResult(
+                job_id="stream-job",
+                completed=arvak_pb2.JobResult(
+                    job_id="stream-job", counts={"00": submission.shots},
+                    shots=submission.shots,
+                ),
+            )
+
+
+@pytest.mark.asyncio
+async def test_submit_and_watch_single_stream():
+    """Test that submit_and_watch gets the result from the submit stream."""
+    server = grpc.aio.server()
+    arvak_pb2_grpc.add_ArvakServiceServicer_to_server(_SubmitStreamServicer(), server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    client = AsyncArvakClient(f"127.0.0.1:{port}", flush_interval_ms=None)
+    try:
+        result = await client.submit_and_watch(BELL_STATE_QASM, "simulator", shots=7)
+        assert result.job_id == "stream-job"
+        assert result.counts == {"00": 7}
+    finally:
+        await client.close()
+        await server.stop(None)
+
+
+class _JobStreamServicer(arvak_pb2_grpc.ArvakServiceServicer):
+    """Answers SubmitJobStream in reverse order; rejects the ``bad`` backend."""
+
+    def __init__(self):
+        self.streams = 0
+        self.unary_calls = 0
+
+    async def SubmitJobStream(self, request_iterator, context):
+        self.streams += 1
+        held = []
+        async for message in request_iterator:
+            job = message.job
+            if job.backend_id == "bad":
+                yield arvak_pb2.SubmitJobStreamResponse(
+                    correlation_id=message.correlation_id,
+                    error_code=grpc.StatusCode.NOT_FOUND.value[0],
+                    error_message="Backend not found: bad",
+                )
+                continue
+            held.append(arvak_pb2.SubmitJobStreamResponse(
+                correlation_id=message.correlation_id,
+                job_id=f"{job.circuit.qasm3.strip()[:8]}-{job.shots}",
+            ))
+            if len(held) == 3:
+                for reply in reversed(held):
+                    yield reply
+                held.clear()
+
+    async def SubmitJob(self, request, context):
+        self.unary_calls += 1
+        return arvak_pb2.SubmitJobResponse(job_id="unary")
+
+
+class _DroppingJobStreamServicer(_JobStreamServicer):
+    """Takes each streamed submission, then drops the stream."""
+
+    async def SubmitJobStream(self, request_iterator, context):
+        self.streams += 1
+        async for _ in request_iterator:
+            await context.abort(grpc.StatusCode.UNAVAILABLE, "connection reset")
+
+
+@pytest.mark.asyncio
+async def test_job_stream_errors_are_not_resubmitted():
+    """Test that a dropped SubmitJobStream fails the submit, not resends it.
+
+    The server may already have created the job, so only UNIMPLEMENTED
+    falls back to a unary SubmitJob; the stream stays in use afterwards.
+    """
+    servicer = _DroppingJobStreamServicer()
+    server = grpc.aio.server()
+    arvak_pb2_grpc.add_ArvakServiceServicer_to_server(servicer, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    client = AsyncArvakClient(f"127.0.0.1:{port}", flush_interval_ms=None)
+    try:
+        for _ in range(2):
+            with pytest.raises(ArvakError, match="UNAVAILABLE"):
+                await client.submit_qasm(BELL_STATE_QASM, "simulator")
+        assert servicer.streams == 2 and servicer.unary_calls == 0
+        assert client._submit_job_stream_supported
+    finally:
+        await client.close()
+        await server.stop(None)
+
+
+@pytest.mark.asyncio
+async def test_submits_share_one_job_stream():
+    """Test that unbatched submits are matched to replies over one stream."""
+    servicer = _JobStreamServicer()
+    server = grpc.aio.server()
+    arvak_pb2_grpc.add_ArvakServiceServicer_to_server(servicer, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    client = AsyncArvakClient(f"127.0.0.1:{port}", flush_interval_ms=None)
+    try:
+        prepared = client.prepare_qasm(BELL_STATE_QASM)
+        hits = _prepare_circuit.cache_info().hits
+        job_ids = await asyncio.gather(
+            client.submit_qasm(BELL_STATE_QASM, "simulator", shots=1),
+            client.submit_qasm(BELL_STATE_QASM, "simulator", shots=2),
+            client.submit_prepared(prepared, "simulator", shots=3),
+        )
+        assert job_ids == ["OPENQASM-1", "OPENQASM-2", "OPENQASM-3"]
+        # submit_qasm reused the circuit encoding made by prepare_qasm
+        assert _prepare_circuit.cache_info().hits == hits + 2
+
+        with pytest.raises(ArvakBackendNotFoundError):
+            await client.submit_qasm(BELL_STATE_QASM, "bad")
+        assert servicer.streams == 1 and servicer.unary_calls == 0
+    finally:
+        await client.close()
+        await server.stop(None)
+
+
+@pytest.mark.asyncio
+@pytest.mark.xdist_group("sim")
+async def test_high_concurrency(server_address):
     """Test high concurrency with connection pooling."""
-    async with AsyncArvakClient("localhost:50051", pool_size=10) as client:
-        # Submit 50 jobs concurrently
-        tasks = [
-            client.submit_qasm(BELL_STATE_QASM, "simulator", shots=100)
-            for _ in range(50)
-        ]
+    async with AsyncArvakClient(server_address, pool_size=10) as client:
+        # Submit 50 jobs concurrently, at most 40 in flight at a time
+        in_flight = asyncio.Semaphore(40)
 
-        job_ids = await asyncio.gather(*tasks)
+        async def submit():
+            async with in_flight:
+                return await client.submit_qasm(BELL_STATE_QASM, "simulator", shots=100)
+
+        job_ids = await _gather(*(submit() for _ in range(50)))
         assert len(job_ids) == 50
 
         # We won't wait for all to complete to keep test fast
@@ -229,5 +785,17 @@ async def test_high_concurrency():
         assert all(len(job_id) > 0 for job_id in job_ids)
 
 
+@pytest.mark.asyncio
+@pytest.mark.xdist_group("sim")
+async def test_high_volume_batch(async_client):
+    """Test submitting 50 circuits in one SubmitBatch call."""
+    job_ids = await async_client.submit_batch(
+        [(BELL_STATE_QASM, 100)] * 50, "simulator", format="qasm3"
+    )
+
+    assert len(job_ids) == 50
+    assert len(set(job_ids)) == 50
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
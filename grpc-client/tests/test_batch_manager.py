@@ -0,0 +1,75 @@
+"""Tests for BatchJobManager."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from arvak_grpc import BatchJobManager
+from arvak_grpc.exceptions import (
+    ArvakBackendNotFoundError,
+    ArvakError,
+    ArvakInvalidCircuitError,
+)
+
+CIRCUITS = [("good-1", 10), ("bad", 20), ("good-2", 30)]
+
+
+def test_submit_many_sends_one_batch():
+    """Test that submit_many submits every circuit in one batch call."""
+    client = Mock()
+    client.submit_batch_future.return_value = ["f1", "f2", "f3"]
+
+    with BatchJobManager(client) as manager:
+        assert manager.submit_many(CIRCUITS, "simulator") == ["f1", "f2", "f3"]
+
+    client.submit_batch_future.assert_called_once_with(
+        CIRCUITS, "simulator", "qasm3", 1.0
+    )
+    client.submit_qasm_future.assert_not_called()
+
+
+def test_submit_many_falls_back_per_circuit():
+    """Test that a batch rejected as invalid is resubmitted per circuit.
+
+    The server validates every circuit of a batch before creating any job,
+    so the rejected batch left nothing behind to duplicate.
+    """
+    client = Mock()
+    client.submit_batch_future.side_effect = ArvakInvalidCircuitError("parse error")
+
+    def submit_qasm_future(code, backend_id, shots, poll_interval):
+        if code == "bad":
+            raise ArvakInvalidCircuitError("parse error")
+        return f"future-{code}"
+
+    client.submit_qasm_future.side_effect = submit_qasm_future
+
+    with BatchJobManager(client) as manager:
+        futures = manager.submit_many(CIRCUITS, "simulator")
+
+    assert sorted(futures) == ["future-good-1", "future-good-2"]
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        ArvakError("UNAVAILABLE: connection reset"),
+        ArvakError("DEADLINE_EXCEEDED: Deadline Exceeded"),
+        ArvakBackendNotFoundError("Backend not found: simulator"),
+    ],
+)
+def test_submit_many_raises_other_batch_errors(error):
+    """Test that other batch failures are raised, not resubmitted.
+
+    The server may have created some of the batch's jobs already, so
+    submitting the circuits again could run them twice.
+    """
+    client = Mock()
+    client.submit_batch_future.side_effect = error
+
+    with BatchJobManager(client) as manager:
+        with pytest.raises(type(error)):
+            manager.submit_many(CIRCUITS, "simulator")
+
+    client.submit_qasm_future.assert_not_called()
+    client.submit_circuit_json.assert_not_called()
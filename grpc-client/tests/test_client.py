@@ -2,11 +2,35 @@
 
 import pytest
 import grpc
-from arvak_grpc import ArvakClient, JobState
+import pickle
+import threading
+from collections.abc import Mapping
+from datetime import datetime
+
+from concurrent import futures
+
+from arvak_grpc import (
+    ArvakClient,
+    Job,
+    JobResult,
+    JobState,
+    ResultExporter,
+    arvak_pb2,
+    arvak_pb2_grpc,
+)
+from arvak_grpc.client import (
+    _build_batch_request,
+    _check_qasm_header,
+    _decode_json_field,
+    _result_counts,
+    _scratch_message,
+)
 from arvak_grpc.exceptions import (
+    ArvakError,
     ArvakJobNotFoundError,
     ArvakBackendNotFoundError,
     ArvakInvalidCircuitError,
+    ArvakJobNotCompletedError,
 )
 
 # Test circuit: Bell state
@@ -20,16 +44,37 @@ cx q[0], q[1];
 INVALID_QASM = "this is not valid qasm"
 
 
-@pytest.fixture
-def client():
-    """Create a client connected to the test server."""
-    # Note: Tests assume server is running on localhost:50051
-    # In a real setup, you would start a test server programmatically
-    client = ArvakClient("localhost:50051", timeout=30.0)
+@pytest.fixture(scope="session")
+def client(server_address):
+    """Create a client connected to the test server, shared by all tests.
+
+    Its channels stay connected for the whole run, so tests do not pay for
+    a TCP handshake and HTTP/2 setup each.
+    """
+    # Note: Tests assume a server is running at server_address
+    client = ArvakClient(server_address, timeout=30.0, pool_size=4)
     yield client
     client.close()
 
 
+@pytest.fixture(scope="session")
+def bell_result(client):
+    """Get a completed Bell-state result for a shot count.
+
+    Each shot count is run on the simulator once per session; tests that
+    only inspect a finished result share it instead of resubmitting.
+    """
+    results = {}
+
+    def run(shots):
+        if shots not in results:
+            job_id = client.submit_qasm(BELL_STATE_QASM, "simulator", shots=shots)
+            results[shots] = client.wait_for_job(job_id, max_wait=30.0)
+        return results[shots]
+
+    return run
+
+
 def test_list_backends(client):
     """Test listing available backends."""
     backends = client.list_backends()
@@ -37,8 +82,10 @@ def test_list_backends(client):
     assert len(backends) > 0, "Should have at least one backend"
 
     # Check simulator backend exists
-    simulator = next((b for b in backends if b.backend_id == "simulator"), None)
-    assert simulator is not None, "Simulator backend should be available"
+    by_id = {b.backend_id: b for b in backends}
+    assert len(by_id) == len(backends), "Backend IDs should be unique"
+    assert "simulator" in by_id, "Simulator backend should be available"
+    simulator = by_id["simulator"]
     assert simulator.is_available
     assert simulator.max_qubits > 0
     assert simulator.max_shots > 0
@@ -62,17 +109,12 @@ def test_get_backend_info_not_found(client):
         client.get_backend_info("nonexistent")
 
 
-def test_submit_and_wait(client):
+def test_submit_and_wait(bell_result, assert_valid_distribution):
     """Test submitting a job and waiting for results."""
-    # Submit job
-    job_id = client.submit_qasm(BELL_STATE_QASM, "simulator", shots=1000)
-    assert job_id is not None
-    assert len(job_id) > 0
-
-    # Wait for completion
-    result = client.wait_for_job(job_id, max_wait=30.0)
+    # Submits the job and waits for it, unless an earlier test has
+    result = bell_result(1000)
 
-    assert result.job_id == job_id
+    assert result.job_id
     assert result.shots == 1000
     assert len(result.counts) > 0
 
@@ -81,22 +123,19 @@ def test_submit_and_wait(client):
     assert total == 1000
 
     # Check probabilities
-    probs = result.probabilities()
-    assert len(probs) > 0
-    assert all(0.0 <= p <= 1.0 for p in probs.values())
-    assert abs(sum(probs.values()) - 1.0) < 0.001
+    assert_valid_distribution(result.probabilities())
 
 
-def test_get_job_status(client):
+def test_get_job_status(client, bell_result):
     """Test getting job status."""
-    job_id = client.submit_qasm(BELL_STATE_QASM, "simulator", shots=500)
+    job_id = bell_result(1000).job_id
 
     job = client.get_job_status(job_id)
 
     assert job.job_id == job_id
     assert job.backend_id == "simulator"
-    assert job.shots == 500
-    assert job.state in [JobState.QUEUED, JobState.RUNNING, JobState.COMPLETED]
+    assert job.shots == 1000
+    assert job.state == JobState.COMPLETED
 
 
 def test_submit_batch(client):
@@ -112,10 +151,13 @@ def test_submit_batch(client):
     assert len(job_ids) == 3
     assert all(len(job_id) > 0 for job_id in job_ids)
 
-    # Wait for all jobs
-    for job_id in job_ids:
-        result = client.wait_for_job(job_id, max_wait=30.0)
-        assert result.shots in [500, 1000, 1500]
+    # Wait for all jobs at once, one waiting thread per job
+    with futures.ThreadPoolExecutor(max_workers=len(job_ids)) as executor:
+        results = list(
+            executor.map(lambda job_id: client.wait_for_job(job_id, max_wait=30.0), job_ids)
+        )
+
+    assert [result.shots for result in results] == [500, 1000, 1500]
 
 
 def test_submit_invalid_circuit(client):
@@ -142,10 +184,9 @@ def test_get_job_result_not_found(client):
         client.get_job_result("nonexistent-job-id")
 
 
-def test_most_frequent_result(client):
+def test_most_frequent_result(bell_result):
     """Test getting the most frequent measurement."""
-    job_id = client.submit_qasm(BELL_STATE_QASM, "simulator", shots=1000)
-    result = client.wait_for_job(job_id, max_wait=30.0)
+    result = bell_result(1000)
 
     most_freq = result.most_frequent()
     assert most_freq is not None
@@ -155,35 +196,484 @@ def test_most_frequent_result(client):
     assert 0.0 <= prob <= 1.0
 
 
-def test_cancel_job(client):
+def test_cancel_job(client, assert_cancel_response):
     """Test canceling a job."""
     job_id = client.submit_qasm(BELL_STATE_QASM, "simulator", shots=1000)
 
-    # Try to cancel (may already be completed)
-    success, message = client.cancel_job(job_id)
-
     # Either successfully canceled or already in terminal state
-    assert isinstance(success, bool)
-    assert isinstance(message, str)
+    assert_cancel_response(client.cancel_job(job_id))
 
 
-def test_context_manager(client):
+def test_context_manager(server_address):
     """Test using client as context manager."""
-    with ArvakClient("localhost:50051") as client:
+    with ArvakClient(server_address) as client:
         backends = client.list_backends()
         assert len(backends) > 0
 
 
-def test_job_terminal_states(client):
+def test_job_terminal_states(client, bell_result):
     """Test checking terminal states."""
-    job_id = client.submit_qasm(BELL_STATE_QASM, "simulator", shots=100)
-    result = client.wait_for_job(job_id, max_wait=30.0)
-
-    job = client.get_job_status(job_id)
+    job = client.get_job_status(bell_result(1000).job_id)
     assert job.is_terminal
     assert job.is_success
     assert not job.is_pending
 
 
+class _FakeRpcError(grpc.RpcError):
+    """RpcError stand-in carrying a status code and details."""
+
+    def __init__(self, code, details):
+        self._code = code
+        self._details = details
+
+    def code(self):
+        return self._code
+
+    def details(self):
+        return self._details
+
+
+@pytest.mark.parametrize(
+    "code, details, expected",
+    [
+        (grpc.StatusCode.INVALID_ARGUMENT, "bad circuit", ArvakInvalidCircuitError),
+        (grpc.StatusCode.FAILED_PRECONDITION, "not done", ArvakJobNotCompletedError),
+        (grpc.StatusCode.NOT_FOUND, "Job not found: x", ArvakJobNotFoundError),
+        (grpc.StatusCode.NOT_FOUND, "Backend not found: x", ArvakBackendNotFoundError),
+        (grpc.StatusCode.NOT_FOUND, "missing", ArvakError),
+        (grpc.StatusCode.UNAVAILABLE, "down", ArvakError),
+    ],
+)
+def test_handle_grpc_error_mapping(code, details, expected):
+    """Test translation of gRPC status codes to Arvak exceptions."""
+    client = ArvakClient("localhost:50051")
+    try:
+        with pytest.raises(expected) as exc_info:
+            client._handle_grpc_error(_FakeRpcError(code, details))
+        assert type(exc_info.value) is expected
+    finally:
+        client.close()
+
+
+
+def test_proto_to_job_timestamps():
+    """Test that job timestamps stay epochs until the datetime is needed."""
+    client = ArvakClient("localhost:50051")
+    try:
+        job = client._proto_to_job(
+            arvak_pb2.Job(
+                job_id="job-1",
+                state=arvak_pb2.JOB_STATE_RUNNING,
+                submitted_at=1700000000,
+                started_at=1700000005,
+                backend_id="simulator",
+                shots=10,
+            )
+        )
+    finally:
+        client.close()
+
+    assert job.submitted_at_epoch == 1700000000
+    assert job.completed_at_epoch is None
+    assert job._submitted_at is None
+    assert not hasattr(job, "__dict__")
+
+    assert job.submitted_at == datetime.fromtimestamp(1700000000)
+    assert job.started_at == datetime.fromtimestamp(1700000005)
+    assert job.completed_at is None
+    assert job.submitted_at is job.submitted_at
+
+
+def test_job_accepts_datetimes_or_epochs():
+    """Test that Job takes datetime or epoch timestamps, as before."""
+    submitted = datetime.fromtimestamp(1700000000)
+    job = Job(
+        job_id="job-1",
+        state=JobState.COMPLETED,
+        submitted_at=submitted,
+        backend_id="simulator",
+        shots=10,
+        completed_at=1700000010,
+    )
+
+    assert job.submitted_at is submitted
+    assert job.submitted_at_epoch == 1700000000
+    assert job.completed_at == datetime.fromtimestamp(1700000010)
+    assert job.started_at is None
+    assert job == Job(
+        "job-1",
+        JobState.COMPLETED,
+        1700000000,
+        "simulator",
+        10,
+        completed_at=datetime.fromtimestamp(1700000010),
+    )
+    assert "submitted_at=datetime.datetime(" in repr(job)
+
+
+@pytest.mark.parametrize(
+    "state, terminal, pending",
+    [
+        (JobState.UNSPECIFIED, False, False),
+        (JobState.QUEUED, False, True),
+        (JobState.RUNNING, False, True),
+        (JobState.COMPLETED, True, False),
+        (JobState.FAILED, True, False),
+        (JobState.CANCELED, True, False),
+    ],
+)
+def test_job_state_predicates(state, terminal, pending):
+    """Test the state-set predicates for every job state."""
+    job = Job("job-1", state, 0.0, "simulator", 1)
+
+    assert job.is_terminal is terminal
+    assert job.is_pending is pending
+    assert job.is_success is (state == JobState.COMPLETED)
+
+
+def test_proto_to_result_counts_view():
+    """Test that result counts are a read-only view of the protobuf map."""
+    client = ArvakClient("localhost:50051")
+    try:
+        proto_result = arvak_pb2.JobResult(
+            job_id="job-1", counts={"00": 6, "11": 4}, shots=10
+        )
+        result = client._proto_to_result(proto_result)
+    finally:
+        client.close()
+
+    assert result.counts == {"00": 6, "11": 4}
+    assert result.counts.get("01", 0) == 0
+    with pytest.raises(KeyError):
+        result.counts["01"]
+    assert "01" not in proto_result.counts
+    assert pickle.loads(pickle.dumps(result.counts)) == {"00": 6, "11": 4}
+
+
+def test_proto_to_result_packed_histogram():
+    """Test decoding counts sent as a packed histogram."""
+    np = pytest.importorskip("numpy")
+    proto_result = arvak_pb2.JobResult(
+        job_id="job-1",
+        shots=10,
+        histogram=arvak_pb2.CountHistogram(
+            num_qubits=3,
+            keys=np.array([1, 6], dtype="<u8").tobytes(),
+            counts=np.array([6, 4], dtype="<u4").tobytes(),
+        ),
+    )
+    result = _result_counts(proto_result)
+    assert isinstance(result, Mapping) and len(result) == 2
+
+    result = JobResult("job-1", result, 10)
+    keys, counts = result.arrays(packed=True)
+    assert keys.tolist() == [1, 6] and counts.tolist() == [6, 4]
+    assert result.total == 10 and result.most_frequent() == ("001", 0.6)
+    assert result.counts._dict is None  # Not needed so far
+
+    assert result.counts == {"001": 6, "110": 4}
+    assert result.counts["110"] == 4
+    assert pickle.loads(pickle.dumps(result.counts)) == {"001": 6, "110": 4}
+
+
+@pytest.mark.parametrize("packed", [False, True])
+def test_export_json_decoded_counts(tmp_path, packed):
+    """Test exporting results whose counts are decoded lazily."""
+    if packed:
+        np = pytest.importorskip("numpy")
+        proto_result = arvak_pb2.JobResult(
+            job_id="job-1",
+            shots=10,
+            histogram=arvak_pb2.CountHistogram(
+                num_qubits=2,
+                keys=np.array([0, 3], dtype="<u8").tobytes(),
+                counts=np.array([6, 4], dtype="<u4").tobytes(),
+            ),
+        )
+    else:
+        proto_result = arvak_pb2.JobResult(
+            job_id="job-1", counts={"00": 6, "11": 4}, shots=10
+        )
+    result = JobResult("job-1", _result_counts(proto_result), 10)
+
+    path = tmp_path / "results.json"
+    ResultExporter.to_json(result, path)
+    (loaded,) = ResultExporter.from_json(path)
+    assert loaded.counts == {"00": 6, "11": 4}
+    assert loaded.shots == 10
+
+
+def test_job_result_caches_totals():
+    """Test that the counts total, probabilities and mode are computed once."""
+    result = JobResult("job-1", {"00": 6, "11": 4}, 10)
+
+    assert result.probabilities() == {"00": 0.6, "11": 0.4}
+    assert result.most_frequent() == ("00", 0.6)
+    assert result._total == 10 and result._most == ("00", 6)
+    assert result.probabilities() is result.probabilities()
+    assert not hasattr(result, "__dict__")
+
+    copy = pickle.loads(pickle.dumps(result))
+    assert copy == result and copy._total is None
+    assert JobResult("empty", {}, 0).most_frequent() is None
+    assert result.top_k(1) == [("00", 6)]
+    assert result.top_k(5) == [("00", 6), ("11", 4)]
+
+
+def test_job_result_arrays():
+    """Test the struct-of-arrays view of result counts."""
+    np = pytest.importorskip("numpy")
+    result = JobResult("job-1", {"00": 6, "01": 1, "11": 3}, 10)
+
+    bitstrings, counts = result.arrays()
+    assert bitstrings.tolist() == ["00", "01", "11"]
+    assert counts.dtype == np.int64 and counts.tolist() == [6, 1, 3]
+    assert bitstrings[counts.argmax()] == "00"
+    assert result.arrays() is result.arrays()
+
+    bitstrings, counts = JobResult("empty", {}, 0).arrays()
+    assert len(bitstrings) == 0 and len(counts) == 0
+
+
+def test_job_result_packed_arrays():
+    """Test packing bitstrings into uint64 keys, with string fallbacks."""
+    np = pytest.importorskip("numpy")
+    result = JobResult("job-1", {"001": 6, "101": 1, "110": 3}, 10)
+
+    keys, counts = result.arrays(packed=True)
+    assert keys.dtype == np.uint64 and keys.tolist() == [1, 5, 6]
+    assert counts is result.arrays()[1]
+    assert result.num_qubits == 3
+    assert result.format_key(keys[counts.argmax()]) == "001"
+
+    wide = JobResult("wide", {"1" * 65: 1}, 1)
+    assert wide.arrays(packed=True)[0].dtype.kind == "U"
+    registers = JobResult("regs", {"01 1": 1}, 1)
+    assert registers.arrays(packed=True)[0].tolist() == ["01 1"]
+    assert JobResult("padded", {"1": 1}, 1, num_qubits=4).format_key(1) == "0001"
+
+
+@pytest.mark.parametrize("packed", [False, True])
+def test_job_result_top_k_from_arrays(packed):
+    """Test that top_k over built arrays matches the heap, ties included."""
+    pytest.importorskip("numpy")
+    counts = {"000": 2, "001": 5, "010": 2, "011": 7, "100": 2, "101": 5}
+    expected = JobResult("job-1", counts, 23)
+    result = JobResult("job-1", counts, 23)
+    result.arrays(packed=packed)
+
+    for k in range(8):
+        assert result.top_k(k) == expected.top_k(k)
+    assert result.top_k(3) == [("011", 7), ("001", 5), ("101", 5)]
+    assert result.most_frequent() == ("011", 7 / 23)
+    assert result.total == 23
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("", None),
+        ("{}", None),
+        ("[]", []),
+        ('{"qubits": 2}', {"qubits": 2}),
+    ],
+)
+def test_decode_json_field(value, expected):
+    """Test decoding of JSON-encoded metadata/topology fields."""
+    assert _decode_json_field(value) == expected
+
+
+def test_decode_json_field_malformed():
+    """Test that malformed JSON fields raise instead of reading as empty."""
+    with pytest.raises(ArvakError, match="Malformed JSON"):
+        _decode_json_field("{not json")
+
+
+
+@pytest.mark.parametrize(
+    "qasm, valid",
+    [
+        (BELL_STATE_QASM, True),
+        (BELL_STATE_QASM.encode(), True),
+        ("// Bell\n/* two\n * qubits */ OPENQASM 3;", True),
+        (INVALID_QASM, False),
+        ("", False),
+        ("qubit q;\nOPENQASM 3.0;", False),
+        ("OPENQASMX 3.0;", False),
+        ("// comment OPENQASM 3.0;", False),
+        (b"/* unterminated OPENQASM 3.0;", False),
+    ],
+)
+def test_check_qasm_header(qasm, valid):
+    """Test the client-side check for the OPENQASM version statement."""
+    if valid:
+        _check_qasm_header(qasm)
+    else:
+        with pytest.raises(ArvakInvalidCircuitError):
+            _check_qasm_header(qasm)
+
+
+def test_invalid_circuit_fails_without_rpc():
+    """Test that a circuit without a header never reaches the server."""
+    # Nothing listens here; an RPC would fail with UNAVAILABLE
+    with ArvakClient("localhost:1", timeout=1.0) as client:
+        with pytest.raises(ArvakInvalidCircuitError):
+            client.submit_qasm(INVALID_QASM, "simulator")
+        with pytest.raises(ArvakInvalidCircuitError):
+            client.submit_and_watch(INVALID_QASM, "simulator")
+
+
+def test_build_batch_request():
+    """Test batch request building for both circuit formats."""
+    request = _build_batch_request([("a", 1), ("b", 2)], "simulator", "json")
+
+    assert request.backend_id == "simulator"
+    assert [job.circuit.arvak_ir_json for job in request.jobs] == ["a", "b"]
+    assert [job.shots for job in request.jobs] == [1, 2]
+    assert _build_batch_request([("a", 1)], "sim", "qasm3").jobs[0].circuit.qasm3 == "a"
+
+    with pytest.raises(ValueError):
+        _build_batch_request([], "simulator", "qasm2")
+
+
+def test_scratch_message_reused_per_thread():
+    """Test that scratch request messages are reused, cleared, per thread."""
+    request = _scratch_message(arvak_pb2.SubmitJobRequest)
+    request.backend_id = "simulator"
+    request.circuit.qasm3 = "OPENQASM 3.0;"
+
+    again = _scratch_message(arvak_pb2.SubmitJobRequest)
+    assert again is request
+    assert again == arvak_pb2.SubmitJobRequest()
+
+    other = []
+    thread = threading.Thread(
+        target=lambda: other.append(_scratch_message(arvak_pb2.SubmitJobRequest))
+    )
+    thread.start()
+    thread.join()
+    assert other[0] is not request
+
+class _EchoSubmitServicer(arvak_pb2_grpc.ArvakServiceServicer):
+    """Returns the decoded SubmitJobRequest fields as the job ID."""
+
+    def SubmitJob(self, request, context):
+        return arvak_pb2.SubmitJobResponse(
+            job_id=f"{request.circuit.qasm3}|{request.backend_id}|{request.shots}"
+        )
+
+
+def test_submit_prepared():
+    """Test that a prepared circuit reaches the server as a full request."""
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=1))
+    arvak_pb2_grpc.add_ArvakServiceServicer_to_server(_EchoSubmitServicer(), server)
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    try:
+        with ArvakClient(f"localhost:{port}") as client:
+            prepared = client.prepare_qasm(BELL_STATE_QASM)
+            job_ids = [
+                client.submit_prepared(prepared, "simulator", shots=shots)
+                for shots in (10, 20)
+            ]
+            assert client.prepare_qasm(BELL_STATE_QASM) is prepared
+            assert client.prepare_qasm(BELL_STATE_QASM.encode()) == prepared
+            job_ids.append(
+                client.submit_qasm(BELL_STATE_QASM.encode(), "simulator", shots=30)
+            )
+    finally:
+        server.stop(None)
+
+    assert job_ids == [
+        f"{BELL_STATE_QASM}|simulator|10",
+        f"{BELL_STATE_QASM}|simulator|20",
+        f"{BELL_STATE_QASM}|simulator|30",
+    ]
+
+class _SubmitStreamServicer(arvak_pb2_grpc.ArvakServiceServicer):
+    """Completes jobs on SubmitBatchStream; ``bad`` circuits are rejected."""
+
+    def __init__(self):
+        self.unary_calls = 0
+
+    def SubmitBatchStream(self, request_iterator, context):
+        for submission in request_iterator:
+            if submission.circuit.qasm3 == "bad":
+                yield arvak_pb2.BatchJobResult(error="Circuit parsing failed: bad")
+                continue
+            yield arvak_pb2.BatchJobResult(job_id="job-1", submitted="ok")
+            yield arvak_pb2.BatchJobResult(
+                job_id="job-1",
+                completed=arvak_pb2.JobResult(
+                    job_id="job-1", counts={"0": submission.shots}, shots=submission.shots
+                ),
+            )
+
+    def SubmitJob(self, request, context):
+        self.unary_calls += 1
+        return arvak_pb2.SubmitJobResponse(job_id="job-1")
+
+    def WatchJob(self, request, context):
+        self.unary_calls += 1
+        yield arvak_pb2.JobStatusUpdate(
+            job_id=request.job_id,
+            state=arvak_pb2.JOB_STATE_COMPLETED,
+            result=arvak_pb2.JobResult(job_id=request.job_id, counts={"1": 3}, shots=3),
+        )
+
+
+class _NoSubmitStreamServicer(_SubmitStreamServicer):
+    """A server that predates SubmitBatchStream."""
+
+    def SubmitBatchStream(self, request_iterator, context):
+        context.abort(grpc.StatusCode.UNIMPLEMENTED, "Method not found!")
+
+
+@pytest.mark.parametrize(
+    "servicer_class, counts, unary_calls",
+    [(_SubmitStreamServicer, {"0": 5}, 0), (_NoSubmitStreamServicer, {"1": 3}, 2)],
+)
+def test_submit_and_watch(servicer_class, counts, unary_calls):
+    """Test submit_and_watch over one stream, and its two-call fallback."""
+    servicer = servicer_class()
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+    arvak_pb2_grpc.add_ArvakServiceServicer_to_server(servicer, server)
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    try:
+        with ArvakClient(f"localhost:{port}") as client:
+            result = client.submit_and_watch(BELL_STATE_QASM, "simulator", shots=5)
+            assert result.job_id == "job-1"
+            assert result.counts == counts
+            assert servicer.unary_calls == unary_calls
+
+            if servicer_class is _SubmitStreamServicer:
+                with pytest.raises(ArvakInvalidCircuitError):
+                    client.submit_and_watch("bad", "simulator")
+    finally:
+        server.stop(None)
+
+
+def test_channel_pool_round_robin():
+    """Test that RPCs rotate over the pooled channels."""
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+    arvak_pb2_grpc.add_ArvakServiceServicer_to_server(_EchoSubmitServicer(), server)
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    try:
+        with ArvakClient(f"localhost:{port}", pool_size=3) as client:
+            stubs = [client._stub() for _ in range(4)]
+            assert len(set(map(id, stubs[:3]))) == 3
+            assert stubs[3] is stubs[0]
+
+            job_ids = [
+                client.submit_qasm(BELL_STATE_QASM, "simulator", shots=shots)
+                for shots in range(1, 5)
+            ]
+    finally:
+        server.stop(None)
+
+    assert job_ids == [f"{BELL_STATE_QASM}|simulator|{n}" for n in range(1, 5)]
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
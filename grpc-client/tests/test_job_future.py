@@ -0,0 +1,298 @@
+"""Tests for JobFuture against an in-process server."""
+
+import threading
+from concurrent import futures
+from types import SimpleNamespace
+
+import grpc
+import pytest
+
+from arvak_grpc import (
+    ArvakClient,
+    JobFuture,
+    JobResult,
+    JobState,
+    CancelledError,
+    as_completed,
+    wait,
+    arvak_pb2,
+    arvak_pb2_grpc,
+)
+from arvak_grpc.exceptions import ArvakError, ArvakJobNotFoundError
+from arvak_grpc.job_future import _PolledJob
+
+
+def _result(job_id):
+    return arvak_pb2.JobResult(job_id=job_id, counts={"00": 3, "11": 5}, shots=8)
+
+
+class _WatchServicer(arvak_pb2_grpc.ArvakServiceServicer):
+    """Reports jobs over WatchJob; ``cancel-*`` jobs end up canceled."""
+
+    def __init__(self):
+        self.unary_calls = 0
+
+    def WatchJob(self, request, context):
+        yield arvak_pb2.JobStatusUpdate(
+            job_id=request.job_id, state=arvak_pb2.JOB_STATE_RUNNING
+        )
+        if request.job_id.startswith("cancel-"):
+            yield arvak_pb2.JobStatusUpdate(
+                job_id=request.job_id, state=arvak_pb2.JOB_STATE_CANCELED
+            )
+            return
+        yield arvak_pb2.JobStatusUpdate(
+            job_id=request.job_id,
+            state=arvak_pb2.JOB_STATE_COMPLETED,
+            result=_result(request.job_id),
+        )
+
+    def GetJobStatus(self, request, context):
+        self.unary_calls += 1
+        return arvak_pb2.GetJobStatusResponse(
+            job=arvak_pb2.Job(
+                job_id=request.job_id, state=arvak_pb2.JOB_STATE_COMPLETED
+            )
+        )
+
+    def GetJobResult(self, request, context):
+        self.unary_calls += 1
+        return arvak_pb2.GetJobResultResponse(result=_result(request.job_id))
+
+
+class _PollOnlyServicer(_WatchServicer):
+    """A server that predates WatchJob."""
+
+    def WatchJob(self, request, context):
+        context.abort(grpc.StatusCode.UNIMPLEMENTED, "Method not found!")
+
+
+class _BatchPollServicer(_PollOnlyServicer):
+    """Answers GetJobStatusBatch, leaving out ``missing-*`` jobs."""
+
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def GetJobStatusBatch(self, request, context):
+        self.batches.append(list(request.job_ids))
+        return arvak_pb2.GetJobStatusBatchResponse(
+            jobs=[
+                arvak_pb2.Job(job_id=job_id, state=arvak_pb2.JOB_STATE_COMPLETED)
+                for job_id in request.job_ids
+                if not job_id.startswith("missing-")
+            ]
+        )
+
+
+class _FlakyBatchPollServicer(_BatchPollServicer):
+    """Fails the first ``failures`` status batches with ``code``."""
+
+    def __init__(self, code, failures):
+        super().__init__()
+        self.code = code
+        self.failures = failures
+        self.peers = []
+
+    def GetJobStatusBatch(self, request, context):
+        self.peers.append(context.peer())
+        if len(self.peers) <= self.failures:
+            context.abort(self.code, "connection reset")
+        return super().GetJobStatusBatch(request, context)
+
+
+class _StuckServicer(_BatchPollServicer):
+    """Keeps every job running; ``watch-*`` jobs are followed over WatchJob."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def WatchJob(self, request, context):
+        if not request.job_id.startswith("watch-"):
+            context.abort(grpc.StatusCode.UNIMPLEMENTED, "Method not found!")
+        yield arvak_pb2.JobStatusUpdate(
+            job_id=request.job_id, state=arvak_pb2.JOB_STATE_RUNNING
+        )
+        self.release.wait(5)
+
+    def GetJobStatusBatch(self, request, context):
+        return arvak_pb2.GetJobStatusBatchResponse(
+            jobs=[
+                arvak_pb2.Job(job_id=job_id, state=arvak_pb2.JOB_STATE_RUNNING)
+                for job_id in request.job_ids
+            ]
+        )
+
+
+@pytest.fixture
+def serve():
+    servers = []
+
+    def start(servicer):
+        server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+        arvak_pb2_grpc.add_ArvakServiceServicer_to_server(servicer, server)
+        port = server.add_insecure_port("localhost:0")
+        server.start()
+        servers.append(server)
+        return ArvakClient(f"localhost:{port}")
+
+    yield start
+    for server in servers:
+        server.stop(None)
+
+
+def test_future_follows_watch_stream(serve):
+    """Test that a future settles from the WatchJob stream alone."""
+    servicer = _WatchServicer()
+    with serve(servicer) as client:
+        jobs = [JobFuture(client, f"job-{i}") for i in range(5)]
+        results = [job.result(timeout=5) for job in jobs]
+
+        assert [r.job_id for r in results] == [f"job-{i}" for i in range(5)]
+        assert dict(results[0].counts) == {"00": 3, "11": 5}
+        assert servicer.unary_calls == 0
+
+        canceled = JobFuture(client, "cancel-1")
+        with pytest.raises(CancelledError):
+            canceled.result(timeout=5)
+
+
+def test_future_falls_back_to_polling(serve):
+    """Test that futures poll when the server does not implement WatchJob."""
+    servicer = _PollOnlyServicer()
+    with serve(servicer) as client:
+        result = JobFuture(client, "job-1", poll_interval=0.01).result(timeout=5)
+
+        assert result.job_id == "job-1"
+        assert servicer.unary_calls == 2
+
+
+def test_polled_futures_share_status_batches(serve):
+    """Test that polled futures are checked together in one batch RPC."""
+    servicer = _BatchPollServicer()
+    with serve(servicer) as client:
+        jobs = [JobFuture(client, f"job-{i}") for i in range(3)]
+        missing = JobFuture(client, "missing-1")
+
+        assert [job.result(timeout=5).job_id for job in jobs] == [
+            "job-0", "job-1", "job-2"
+        ]
+        with pytest.raises(ArvakJobNotFoundError):
+            missing.result(timeout=5)
+
+    # Every future was polled; no job was queried on its own
+    assert {job_id for batch in servicer.batches for job_id in batch} == {
+        "job-0", "job-1", "job-2", "missing-1"
+    }
+    assert servicer.unary_calls == 3  # GetJobResult per completed job
+
+
+def test_poller_reconnects_on_transient_errors(serve):
+    """Test that the poller reopens its failed channel after UNAVAILABLE."""
+    # The first poll fails all three attempts the interceptor makes
+    servicer = _FlakyBatchPollServicer(grpc.StatusCode.UNAVAILABLE, failures=3)
+    with serve(servicer) as client:
+        job = JobFuture(client, "job-1", poll_interval=0.01)
+        assert job.result(timeout=5).job_id == "job-1"
+
+    # The next poll came in over a new connection
+    assert len(servicer.peers) == 4
+    assert len(set(servicer.peers[:3])) == 1 and servicer.peers[3] != servicer.peers[0]
+
+
+@pytest.mark.parametrize("job_id", ["watch-1", "poll-1"])
+def test_close_fails_followed_futures(serve, job_id):
+    """Test that closing the client settles the futures it still follows."""
+    servicer = _StuckServicer()
+    try:
+        with serve(servicer) as client:
+            job = JobFuture(client, job_id, poll_interval=0.01)
+            assert not job.wait(timeout=0.2)
+        with pytest.raises(ArvakError, match="client closed"):
+            job.result(timeout=1)
+    finally:
+        servicer.release.set()
+
+
+@pytest.mark.parametrize(
+    "code, failures, calls",
+    [
+        (grpc.StatusCode.PERMISSION_DENIED, 1, 1),
+        (grpc.StatusCode.INTERNAL, 100, 6),  # Gives up after 5 reconnects
+    ],
+)
+def test_poller_fails_jobs_on_lasting_errors(serve, code, failures, calls):
+    """Test that futures fail instead of being polled forever."""
+    servicer = _FlakyBatchPollServicer(code, failures)
+    with serve(servicer) as client:
+        job = JobFuture(client, "job-1", poll_interval=0.01)
+        with pytest.raises(ArvakError, match="connection reset"):
+            job.result(timeout=5)
+
+    assert len(servicer.peers) == calls
+
+
+def test_polled_job_backoff():
+    """Test that polling backs off while a job is unchanged and resets after."""
+    future = SimpleNamespace(_initial_poll=0.1, _multiplier=2.0, _poll_interval=0.5)
+    entry = _PolledJob(future, now=0.0)
+    assert 0.09 <= entry.due <= 0.11
+
+    delays = []
+    for state in (JobState.QUEUED, JobState.QUEUED, JobState.QUEUED, None, None):
+        entry.reschedule(state, now=10.0)
+        delays.append(entry.delay)
+    assert delays == [0.1, 0.2, 0.4, 0.5, 0.5]
+    assert 10.45 <= entry.due <= 10.55
+
+    entry.reschedule(JobState.RUNNING, now=20.0)
+    assert entry.delay == 0.1
+
+
+class _IdleClient:
+    """A client whose watcher never settles anything on its own."""
+
+    def _job_watcher(self):
+        return SimpleNamespace(watch=lambda future: None)
+
+
+def test_as_completed_and_wait_wake_on_completion():
+    """Test that waiters wake as soon as a future completes."""
+    jobs = [JobFuture(_IdleClient(), f"job-{i}") for i in range(3)]
+    result = JobResult(job_id="job-1", counts={"0": 1}, shots=1)
+    threading.Timer(0.05, jobs[1]._set_result, [result]).start()
+
+    assert next(as_completed(jobs, timeout=5)) is jobs[1]
+    done, pending = wait(jobs, timeout=5, return_when="FIRST_COMPLETED")
+    assert done == {jobs[1]} and pending == {jobs[0], jobs[2]}
+
+    with pytest.raises(TimeoutError):
+        list(as_completed(jobs, timeout=0.05))
+    assert wait(jobs[:1], timeout=0.05, return_when="FIRST_COMPLETED") == (
+        set(), {jobs[0]}
+    )
+
+
+def test_callbacks_run_on_the_callback_pool():
+    """Test that callbacks run off the settling thread, once, unlocked."""
+    job = JobFuture(_IdleClient(), "job-1")
+    seen = []
+    ran = threading.Event()
+
+    def first(f):
+        seen.append((f.done(), threading.current_thread().name))
+        ran.set()
+
+    job.add_done_callback(first)
+    job._set_result(JobResult(job_id="job-1", counts={"0": 1}, shots=1))
+    assert ran.wait(5)
+
+    # Already done: runs right away, in the caller's thread
+    job.add_done_callback(lambda f: seen.append(f.result().job_id))
+    job._set_result(None)  # Settling twice is a no-op
+
+    assert seen[0][0] is True
+    assert seen[0][1].startswith("arvak-callback")
+    assert seen[1:] == ["job-1"]
+    assert job.as_concurrent_future().result(timeout=5).job_id == "job-1"
@@ -3,9 +3,12 @@
 import pytest
 import time
 import tempfile
+from collections import OrderedDict
 from pathlib import Path
+from arvak_grpc import result_cache
 from arvak_grpc.types import JobResult
 from arvak_grpc.result_cache import (
+    CacheEntry,
     MemoryCache,
     DiskCache,
     TwoLevelCache,
@@ -182,6 +185,97 @@ class TestMemoryCache:
         assert stats['misses'] == 1
         assert stats['hit_rate'] == 0.5
 
+    def test_concurrent_access(self, sample_results):
+        """Test concurrent lookups alongside puts and removals."""
+        import threading
+
+        cache = MemoryCache(max_size=5)
+        errors = []
+
+        def reader():
+            try:
+                for _ in range(2000):
+                    for result in sample_results:
+                        cache.get(result.job_id)
+            except Exception as e:
+                errors.append(e)
+
+        def writer():
+            try:
+                for _ in range(200):
+                    for result in sample_results:
+                        cache.put(result)
+                        cache.remove(result.job_id)
+                        cache.put(result)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=reader) for _ in range(4)]
+        threads.append(threading.Thread(target=writer))
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        assert cache.size() <= 5
+
+
+class _RacingDict(OrderedDict):
+    """Simulates a lock-free ``remove()`` landing inside a cache update.
+
+    After ``trigger`` calls of ``method`` the dict is emptied, just after
+    the call returns.
+    """
+
+    def __init__(self, method, trigger):
+        super().__init__()
+        self.method = method
+        self.calls = 0
+        self.trigger = trigger
+
+    def _maybe_clear(self, name):
+        if name == self.method:
+            self.calls += 1
+            if self.calls == self.trigger:
+                self.clear()
+
+    def get(self, key, default=None):
+        value = super().get(key, default)
+        self._maybe_clear("get")
+        return value
+
+    def __len__(self):
+        size = super().__len__()
+        self._maybe_clear("len")
+        return size
+
+
+class TestMemoryCacheRaces:
+    """Lookups and puts racing the lock-free remove()."""
+
+    def test_expired_get_after_concurrent_remove(self, sample_result):
+        """Test that an expired lookup tolerates a concurrent remove()."""
+        cache = MemoryCache(max_size=10, ttl=0.5)
+        # Removed between the lock-free lookup and the locked removal
+        cache._cache = _RacingDict("get", trigger=2)
+        cache._cache[sample_result.job_id] = CacheEntry(
+            result=sample_result, timestamp=time.time() - 1
+        )
+
+        assert cache.get(sample_result.job_id) is None
+
+    def test_put_when_remove_empties_full_cache(self, sample_results):
+        """Test that put() tolerates remove() emptying a full cache."""
+        cache = MemoryCache(max_size=1)
+        cache._cache = _RacingDict("len", trigger=1)
+        cache._cache["old"] = CacheEntry(
+            result=sample_results[0], timestamp=time.time()
+        )
+
+        cache.put(sample_results[1])
+        assert cache.get(sample_results[1].job_id) is sample_results[1]
+
 
 class TestDiskCache:
     """Test DiskCache functionality."""
@@ -226,6 +320,19 @@ class TestDiskCache:
             assert retrieved is not None
             assert retrieved.counts == sample_result.counts
 
+    def test_metadata_persistence(self, sample_result):
+        """Test that per-job metadata survives a reload."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache1 = DiskCache(tmpdir, format="json")
+            cache1.put(sample_result)
+
+            cache2 = DiskCache(tmpdir, format="json")
+            job_id = sample_result.job_id
+
+            assert cache2._meta_shots[job_id] == sample_result.shots
+            assert cache2._meta_num_states[job_id] == len(sample_result.counts)
+            assert cache2._meta_paths[job_id] == cache1._meta_paths[job_id]
+
     def test_ttl_expiration(self, sample_result):
         """Test TTL expiration for disk cache."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -343,6 +450,54 @@ class TestTwoLevelCache:
             assert cache.l1.get(sample_result.job_id) is None
             assert cache.l2.get(sample_result.job_id) is None
 
+    def test_negative_cache(self, sample_result):
+        """Test that repeated misses skip both levels until a put."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = TwoLevelCache(cache_dir=tmpdir, negative_ttl=10.0)
+
+            assert cache.get(sample_result.job_id) is None
+            assert cache.get(sample_result.job_id) is None
+
+            # Second miss was answered by the negative cache
+            assert cache.stats()['l1']['misses'] == 1
+
+            # A put invalidates the negative entry
+            cache.put(sample_result)
+            assert cache.get(sample_result.job_id) is not None
+
+    def test_negative_cache_is_bounded(self, monkeypatch):
+        """Test that misses for many distinct jobs do not pile up."""
+        monkeypatch.setattr(result_cache, "_NEGATIVE_CACHE_SIZE", 3)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = TwoLevelCache(cache_dir=tmpdir, negative_ttl=10.0)
+
+            for i in range(5):
+                assert cache.get(f"missing-{i}") is None
+            assert list(cache._neg) == ["missing-2", "missing-3", "missing-4"]
+
+            # Expired misses are swept when the next one is recorded
+            cache.negative_ttl = 0.0
+            time.sleep(0.01)
+            assert cache.get("missing-5") is None
+            assert list(cache._neg) == ["missing-5"]
+
+    def test_negative_cache_skips_miss_raced_by_put(self, sample_result):
+        """Test that a put() during a lookup's miss is not shadowed."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = TwoLevelCache(cache_dir=tmpdir, negative_ttl=10.0)
+            l2_get = cache.l2.get
+
+            def racing_get(job_id):
+                result = l2_get(job_id)  # Misses...
+                cache.put(sample_result)  # ...then the result arrives
+                return result
+
+            cache.l2.get = racing_get
+            assert cache.get(sample_result.job_id) is None
+            cache.l2.get = l2_get
+
+            assert cache.get(sample_result.job_id) is not None
+
     def test_evict_expired(self, sample_results):
         """Test evicting expired entries from both levels."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -6,7 +6,9 @@ To regenerate the Python protobuf code from proto/arvak.proto:
     python -m grpc_tools.protoc -I proto --python_out=../../python/arvak_grpc --grpc_python_out=../../python/arvak_grpc proto/arvak.proto
 """
 
+import grpc
 import pytest
+from contextlib import nullcontext
 from unittest.mock import Mock, AsyncMock, MagicMock
 from datetime import datetime
 
@@ -17,6 +19,28 @@ from arvak_grpc import arvak_pb2
 pytestmark = pytest.mark.asyncio
 
 
+class _MockStreamCall:
+    """Minimal stand-in for a grpc.aio server-streaming call."""
+
+    def __init__(self, updates, error=None):
+        self._updates = updates
+        self._error = error
+        self.cancelled = False
+
+    async def _iterate(self):
+        for update in self._updates:
+            yield update
+        if self._error is not None:
+            raise self._error
+
+    def __aiter__(self):
+        return self._iterate()
+
+    def cancel(self):
+        self.cancelled = True
+        return True
+
+
 @pytest.fixture
 def mock_channel():
     """Mock gRPC channel."""
@@ -36,13 +60,9 @@ async def client(mock_channel, mock_stub, monkeypatch):
     """Create async client with mocked channel."""
     client = AsyncArvakClient("localhost:50051")
 
-    # Mock the channel and stub
-    async def mock_get_channel():
-        return mock_channel
-
-    monkeypatch.setattr(client._pool, "get_channel", mock_get_channel)
-    client._channel = mock_channel
-    client._stub = mock_stub
+    # Route every RPC to the mocked stub
+    monkeypatch.setattr(client._pool, "slot", lambda: nullcontext(mock_stub))
+    monkeypatch.setattr(client._streams, "stream", lambda: nullcontext(mock_stub))
 
     yield client
     await client.close()
@@ -139,14 +159,14 @@ async def test_stream_results(client, mock_stub):
         ),
         arvak_pb2.ResultChunk(
             job_id="test-job-3",
-            counts={"01": 300, "10": 200},
+            counts={"01": 300},
             is_final=False,
             chunk_index=1,
             total_chunks=3,
         ),
         arvak_pb2.ResultChunk(
             job_id="test-job-3",
-            counts={"00": 100},
+            counts={"10": 200},
             is_final=True,
             chunk_index=2,
             total_chunks=3,
@@ -172,7 +192,7 @@ async def test_stream_results(client, mock_stub):
 
     # Verify all chunks received
     assert chunk_count == 3
-    assert all_counts == {"00": 600, "11": 500, "01": 300, "10": 200}
+    assert all_counts == {"00": 500, "11": 500, "01": 300, "10": 200}
 
 
 async def test_submit_batch_stream(client, mock_stub):
@@ -309,3 +329,84 @@ async def test_watch_job_immediate_completion(client, mock_stub):
 
     assert len(states) == 1
     assert states[0] == JobState.COMPLETED
+
+
+async def test_wait_for_job_uses_watch_stream(client, mock_stub):
+    """Test wait_for_job returns the result carried by the WatchJob stream."""
+    job = arvak_pb2.Job(
+        job_id="test-job-6",
+        state=arvak_pb2.JOB_STATE_RUNNING,
+        submitted_at=1234567890,
+        backend_id="simulator",
+        shots=100,
+    )
+    done = arvak_pb2.Job()
+    done.CopyFrom(job)
+    done.state = arvak_pb2.JOB_STATE_COMPLETED
+    updates = [
+        arvak_pb2.JobStatusUpdate(
+            job_id="test-job-6",
+            state=arvak_pb2.JOB_STATE_RUNNING,
+            timestamp=1234567890,
+            job=job,
+        ),
+        arvak_pb2.JobStatusUpdate(
+            job_id="test-job-6",
+            state=arvak_pb2.JOB_STATE_COMPLETED,
+            timestamp=1234567891,
+            job=done,
+            result=arvak_pb2.JobResult(
+                job_id="test-job-6",
+                counts={"00": 60, "11": 40},
+                shots=100,
+                execution_time_ms=5,
+            ),
+        ),
+    ]
+    call = _MockStreamCall(updates)
+    mock_stub.WatchJob = Mock(return_value=call)
+    mock_stub.GetJobStatus = AsyncMock()
+    mock_stub.GetJobResult = AsyncMock()
+
+    states_seen = []
+    result = await client.wait_for_job(
+        "test-job-6", progress_callback=lambda j: states_seen.append(j.state)
+    )
+
+    assert result.counts == {"00": 60, "11": 40}
+    assert states_seen == [JobState.RUNNING, JobState.COMPLETED]
+    assert call.cancelled
+    mock_stub.GetJobStatus.assert_not_called()
+    mock_stub.GetJobResult.assert_not_called()
+
+
+async def test_wait_for_job_falls_back_to_polling(client, mock_stub):
+    """Test wait_for_job polls when the server does not implement WatchJob."""
+    unimplemented = grpc.aio.AioRpcError(
+        grpc.StatusCode.UNIMPLEMENTED, grpc.aio.Metadata(), grpc.aio.Metadata()
+    )
+    mock_stub.WatchJob = Mock(return_value=_MockStreamCall([], unimplemented))
+    mock_stub.GetJobStatus = AsyncMock(
+        return_value=arvak_pb2.GetJobStatusResponse(
+            job=arvak_pb2.Job(
+                job_id="test-job-7",
+                state=arvak_pb2.JOB_STATE_COMPLETED,
+                submitted_at=1234567890,
+                backend_id="simulator",
+                shots=10,
+            )
+        )
+    )
+    mock_stub.GetJobResult = AsyncMock(
+        return_value=arvak_pb2.GetJobResultResponse(
+            result=arvak_pb2.JobResult(job_id="test-job-7", counts={"0": 10}, shots=10)
+        )
+    )
+
+    result = await client.wait_for_job("test-job-7", poll_interval=0.01)
+    assert result.counts == {"0": 10}
+    assert client._watch_supported is False
+
+    # The probe result sticks: later waits go straight to polling
+    await client.wait_for_job("test-job-7", poll_interval=0.01)
+    assert mock_stub.WatchJob.call_count == 1